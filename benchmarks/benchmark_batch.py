@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+
+SRC: Path = Path(__file__).resolve().parent.parent.joinpath('src')
+
+
+def run_single(paths: list[Path]) -> float:
+    start: float = time.perf_counter()
+    for path in paths:
+        with path.open() as input:
+            subprocess.run([sys.executable, str(SRC / 'main.py')], stdin = input, capture_output = True)
+    return time.perf_counter() - start
+
+def run_batch(paths: list[Path]) -> float:
+    start: float = time.perf_counter()
+    subprocess.run([sys.executable, str(SRC / 'batch.py'), '--list', '-'], input = ''.join(f'{path}\n' for path in paths), capture_output = True, text = True, check = False)
+    return time.perf_counter() - start
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Wall time of one process per program against a single batch process')
+    argument_parser.add_argument('--corpus', type = Path, default = SRC.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--copies', type = int, default = 3)
+    args: Namespace = argument_parser.parse_args()
+    paths: list[Path] = sorted(args.corpus.rglob('*.stella')) * args.copies
+    single_time: float = run_single(paths)
+    batch_time: float = run_batch(paths)
+    print(f'{len(paths)} programs')
+    print(f'{"mode":<10}{"total, s":>10}{"per program, ms":>18}')
+    print(f'{"single":<10}{single_time:>10.2f}{single_time / len(paths) * 1000:>18.1f}')
+    print(f'{"batch":<10}{batch_time:>10.2f}{batch_time / len(paths) * 1000:>18.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+import time
+
+from argparse import SUPPRESS, ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program, generate_type_reconstruction_program
+
+from parsing.dfaCache import DfaCache
+from parsing.programParser import ProgramParser
+
+
+GENERATORS: list[Callable[[int], str]] = [generate_simply_typed_program, generate_structural_subtyping_program, generate_type_reconstruction_program]
+
+
+def warm_up(dfa_cache_path: Path, corpus_dir: Path) -> None:
+    sources: list[str] = [path.read_text() for path in sorted(corpus_dir.rglob('*.stella'))]
+    sources.extend(generate_program(5) for generate_program in GENERATORS)
+    DfaCache.warm_up(sources)
+    DfaCache(dfa_cache_path).save()
+    print(DfaCache.get_state_count())
+
+def measure(dfa_cache_path: Path | None, functions_count: int) -> None:
+    sources: list[str] = [generate_program(functions_count) for generate_program in GENERATORS]
+    start: float = time.perf_counter()
+    if dfa_cache_path:
+        DfaCache(dfa_cache_path).load()
+    loaded: float = time.perf_counter()
+    ProgramParser(sources[0]).parse()
+    parsed: float = time.perf_counter()
+    for source in sources[1:]:
+        ProgramParser(source).parse()
+    print(f'{(loaded - start) * 1000} {(parsed - loaded) * 1000} {(time.perf_counter() - loaded) * 1000}')
+
+def run_child(*args: str) -> str:
+    return subprocess.run([sys.executable, __file__, *args], check = True, capture_output = True, text = True).stdout
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'First-parse latency of a fresh process with and without a persisted DFA cache')
+    argument_parser.add_argument('--corpus', type = Path, default = Path(__file__).resolve().parent.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--functions', type = int, default = 20)
+    argument_parser.add_argument('--runs', type = int, default = 5)
+    argument_parser.add_argument('--warm-up', type = Path, help = SUPPRESS)
+    argument_parser.add_argument('--measure', choices = ['cold', 'warm'], help = SUPPRESS)
+    argument_parser.add_argument('--dfa-cache', type = Path, help = SUPPRESS)
+    args: Namespace = argument_parser.parse_args()
+    sys.setrecursionlimit(100000)
+    if args.warm_up:
+        warm_up(args.warm_up, args.corpus)
+        return
+    if args.measure:
+        measure(args.dfa_cache if args.measure == 'warm' else None, args.functions)
+        return
+    with TemporaryDirectory() as directory:
+        dfa_cache_path: Path = Path(directory) / 'dfa.cache'
+        states: str = run_child('--warm-up', str(dfa_cache_path), '--corpus', str(args.corpus)).strip()
+        print(f'{states} DFA states, {dfa_cache_path.stat().st_size / 1024:.0f} KiB on disk')
+        print(f'{"process":<12}{"load, ms":>12}{"first parse, ms":>18}{"all parses, ms":>18}')
+        for mode in ('cold', 'warm'):
+            timings: list[list[float]] = []
+            for _ in range(args.runs):
+                timings.append([float(value) for value in run_child('--measure', mode, '--dfa-cache', str(dfa_cache_path), '--functions', str(args.functions)).split()])
+            load, first_parse, all_parses = (min(column) for column in zip(*timings))
+            print(f'{mode:<12}{load:>12.2f}{first_parse:>18.2f}{all_parses:>18.2f}')
+
+if __name__ == '__main__':
+    main()
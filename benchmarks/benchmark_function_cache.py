@@ -0,0 +1,45 @@
+import time
+
+from argparse import ArgumentParser, Namespace
+from tempfile import TemporaryDirectory
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program
+
+from antlr.stellaParser import stellaParser
+from checker.checkerManager import CheckerManager
+from checker.functionCache import FunctionCache
+from checker.incrementalChecker import IncrementalChecker
+from parsing.programParser import parse_program
+
+
+def measure_full(source: str) -> float:
+    program_context: stellaParser.ProgramContext = parse_program(source, is_regex_lexer = True)
+    start: float = time.perf_counter()
+    CheckerManager(True).check(program_context)
+    return (time.perf_counter() - start) * 1000
+
+def measure_incremental(function_cache: FunctionCache, source: str) -> tuple[float, int]:
+    program_context: stellaParser.ProgramContext = parse_program(source, is_regex_lexer = True)
+    incremental_checker: IncrementalChecker = IncrementalChecker(function_cache, True)
+    start: float = time.perf_counter()
+    incremental_checker.check(program_context, source)
+    return (time.perf_counter() - start) * 1000, incremental_checker.checked_decls
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Check time of a program after an edit, with and without a function cache')
+    argument_parser.add_argument('--functions', type = int, default = 2000)
+    args: Namespace = argument_parser.parse_args()
+    print(f'{"program":<24}{"full, ms":>10}{"cold, ms":>10}{"body edit, ms":>16}{"header edit, ms":>18}')
+    for generate_program in (generate_simply_typed_program, generate_structural_subtyping_program):
+        source: str = generate_program(args.functions)
+        body: int = source.index('succ(', source.index(f'fn f{args.functions // 2}('))
+        header: int = source.index('(', source.index(f'fn f{args.functions - 1}(') + 3)
+        with TemporaryDirectory() as directory:
+            function_cache: FunctionCache = FunctionCache(directory)
+            cold_time, _ = measure_incremental(function_cache, source)
+            body_time, body_decls = measure_incremental(function_cache, f'{source[:body]} {source[body:]}')
+            header_time, header_decls = measure_incremental(function_cache, f'{source[:header]} {source[header:]}')
+        print(f'{generate_program.__name__.removeprefix("generate_"):<24}{measure_full(source):>10.1f}{cold_time:>10.1f}{f"{body_time:.1f} ({body_decls})":>16}{f"{header_time:.1f} ({header_decls})":>18}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import time
+
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program
+
+from checker.documentChecker import DocumentChecker
+
+
+def measure(document_checker: DocumentChecker, edit: Callable[[], None], runs: int) -> float:
+    timings: list[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        edit()
+        document_checker.check()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2] * 1000
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Latency of re-checking a document after an edit, against a full check')
+    argument_parser.add_argument('--functions', type = int, default = 2000)
+    argument_parser.add_argument('--runs', type = int, default = 11)
+    args: Namespace = argument_parser.parse_args()
+    print(f'{"program":<24}{"lines":>8}{"open, ms":>12}{"body edit, ms":>16}{"header edit, ms":>20}')
+    for generate_program in (generate_simply_typed_program, generate_structural_subtyping_program):
+        source: str = generate_program(args.functions)
+        start: float = time.perf_counter()
+        document_checker: DocumentChecker = DocumentChecker(source)
+        document_checker.check()
+        open_time: float = (time.perf_counter() - start) * 1000
+        body: int = source.index('succ(', source.index(f'fn f{args.functions // 2}('))
+        body_time: float = measure(document_checker, lambda: document_checker.edit(body, body, ' '), args.runs)
+        header: int = source.index('(', source.index(f'fn f{args.functions - 1}(') + 3)
+        header_time: float = measure(document_checker, lambda: document_checker.edit(header, header, ' '), args.runs)
+        print(f'{generate_program.__name__.removeprefix("generate_"):<24}{source.count(chr(10)) + 1:>8}{open_time:>12.1f}{body_time:>16.1f}{header_time:>20.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import os
+import time
+
+from argparse import ArgumentParser, Namespace
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program
+
+from checker.checkerManager import CheckerManager
+from checker.parallelChecker import ParallelChecker
+from parsing.programParser import parse_program
+
+
+def measure_serial(source: str) -> float:
+    start: float = time.perf_counter()
+    CheckerManager(True).check(parse_program(source, is_regex_lexer = True))
+    return time.perf_counter() - start
+
+def measure_parallel(parallel_checker: ParallelChecker, source: str) -> float:
+    start: float = time.perf_counter()
+    parallel_checker.check(source)
+    return time.perf_counter() - start
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Wall time of checking one large program serially and on worker processes')
+    argument_parser.add_argument('--functions', type = int, default = 2000)
+    argument_parser.add_argument('--jobs', type = int, nargs = '+', default = [1, 2, 4])
+    args: Namespace = argument_parser.parse_args()
+    print(f'{os.cpu_count()} CPUs')
+    print(f'{"program":<30}{"serial, s":>10}' + ''.join(f'{f"{jobs} jobs, s":>12}' for jobs in args.jobs))
+    for generate_program in (generate_simply_typed_program, generate_structural_subtyping_program):
+        source: str = generate_program(args.functions)
+        times: list[float] = []
+        for jobs in args.jobs:
+            parallel_checker: ParallelChecker = ParallelChecker(jobs, True)
+            try:
+                parallel_checker.check('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n')
+                times.append(measure_parallel(parallel_checker, source))
+            finally:
+                parallel_checker.close()
+        print(f'{generate_program.__name__.removeprefix("generate_"):<30}{measure_serial(source):>10.2f}' + ''.join(f'{elapsed:>12.2f}' for elapsed in times))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import sys
+import time
+
+from antlr4 import CommonTokenStream
+from antlr4.InputStream import InputStream
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import Callable
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program, generate_type_reconstruction_program
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from parsing.programParser import ProgramParser
+from parsing.regexLexer import tokenize
+
+
+def parse_default(source: str) -> bool:
+    stellaParser(CommonTokenStream(stellaLexer(InputStream(source)))).program()
+    return False
+
+def parse_two_stage(source: str) -> bool:
+    program_parser: ProgramParser = ProgramParser(source)
+    program_parser.parse()
+    return not program_parser.is_sll_parsed
+
+def parse_two_stage_regex_lexer(source: str) -> bool:
+    program_parser: ProgramParser = ProgramParser(source, is_regex_lexer = True)
+    program_parser.parse()
+    return not program_parser.is_sll_parsed
+
+def tokenize_antlr(source: str) -> bool:
+    CommonTokenStream(stellaLexer(InputStream(source))).fill()
+    return False
+
+def tokenize_regex(source: str) -> bool:
+    tokenize(source)
+    return False
+
+PARSERS: dict[str, Callable[[str], bool]] = {
+    'default-ll': parse_default,
+    'sll-then-ll': parse_two_stage,
+    'sll-then-ll, regex lexer': parse_two_stage_regex_lexer,
+    'antlr lexer only': tokenize_antlr,
+    'regex lexer only': tokenize_regex,
+}
+
+
+def collect_corpus(corpus_dir: Path, functions_count: int) -> list[str]:
+    sources: list[str] = [path.read_text() for path in sorted(corpus_dir.rglob('*.stella'))]
+    for generate_program in (generate_simply_typed_program, generate_structural_subtyping_program, generate_type_reconstruction_program):
+        sources.append(generate_program(functions_count))
+    return sources
+
+def benchmark_parser(parse: Callable[[str], bool], sources: list[str], repeat: int) -> tuple[list[float], int]:
+    timings: list[float] = []
+    fallbacks: int = 0
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fallbacks = sum(parse(source) for source in sources)
+        timings.append(time.perf_counter() - start)
+    return timings, fallbacks
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Parsing time per prediction mode and lexer')
+    argument_parser.add_argument('--corpus', type = Path, default = Path(__file__).resolve().parent.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--functions', type = int, default = 100)
+    argument_parser.add_argument('--repeat', type = int, default = 10)
+    args: Namespace = argument_parser.parse_args()
+    sys.setrecursionlimit(100000)
+    sources: list[str] = collect_corpus(args.corpus, args.functions)
+    for parse in PARSERS.values():
+        benchmark_parser(parse, sources, 1)
+    print(f'{len(sources)} programs')
+    print(f'{"parser":<28}{"min, ms":>12}{"mean, ms":>12}{"fallbacks":>12}')
+    for name, parse in PARSERS.items():
+        timings, fallbacks = benchmark_parser(parse, sources, args.repeat)
+        print(f'{name:<28}{min(timings) * 1000:>12.2f}{sum(timings) / len(timings) * 1000:>12.2f}{fallbacks:>12}')
+
+if __name__ == '__main__':
+    main()
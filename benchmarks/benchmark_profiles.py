@@ -0,0 +1,46 @@
+import sys
+import time
+
+from antlr4 import CommonTokenStream
+from antlr4.InputStream import InputStream
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program, generate_type_reconstruction_program
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from checker.checkerManager import CheckerManager
+
+
+PROFILES: dict[str, Callable[[int], str]] = {
+    'simply-typed': generate_simply_typed_program,
+    'structural-subtyping': generate_structural_subtyping_program,
+    'type-reconstruction': generate_type_reconstruction_program,
+}
+
+
+def benchmark_profile(program: str, repeat: int) -> list[float]:
+    context: stellaParser.ProgramContext = stellaParser(CommonTokenStream(stellaLexer(InputStream(program)))).program()
+    timings: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        errors = CheckerManager().check(context)
+        timings.append(time.perf_counter() - start)
+        if errors:
+            raise ValueError(f'Benchmark program is ill-typed: {errors[0].error_kind.name}')
+    return timings
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Type checking time per extension profile')
+    argument_parser.add_argument('--functions', type = int, default = 100)
+    argument_parser.add_argument('--repeat', type = int, default = 10)
+    args: Namespace = argument_parser.parse_args()
+    sys.setrecursionlimit(100000)
+    print(f'{"profile":<24}{"min, ms":>12}{"mean, ms":>12}')
+    for profile, generate_program in PROFILES.items():
+        timings: list[float] = benchmark_profile(generate_program(args.functions), args.repeat)
+        print(f'{profile:<24}{min(timings) * 1000:>12.2f}{sum(timings) / len(timings) * 1000:>12.2f}')
+
+if __name__ == '__main__':
+    main()
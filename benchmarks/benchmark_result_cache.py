@@ -0,0 +1,33 @@
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+SRC: Path = Path(__file__).resolve().parent.parent.joinpath('src')
+
+
+def run_batch(paths: list[Path], *flags: str) -> tuple[float, str]:
+    start: float = time.perf_counter()
+    batch: subprocess.CompletedProcess = subprocess.run([sys.executable, str(SRC / 'batch.py'), *flags, '--list', '-'], input = ''.join(f'{path}\n' for path in paths), capture_output = True, text = True, check = False)
+    return time.perf_counter() - start, batch.stderr.splitlines()[-1]
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Batch wall time without a result cache, with a cold one and with a warm one')
+    argument_parser.add_argument('--corpus', type = Path, default = SRC.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--copies', type = int, default = 20)
+    args: Namespace = argument_parser.parse_args()
+    paths: list[Path] = sorted(args.corpus.rglob('*.stella')) * args.copies
+    print(f'{len(paths)} programs')
+    print(f'{"cache":<10}{"total, s":>10}{"per program, ms":>18}  summary')
+    with TemporaryDirectory() as directory:
+        runs: list[tuple[str, list[Path], tuple[str, ...]]] = [('none', paths, ()), ('cold', sorted(set(paths)), ('--result-cache', directory)), ('warm', paths, ('--result-cache', directory))]
+        for mode, run_paths, flags in runs:
+            elapsed, summary = run_batch(run_paths, *flags)
+            print(f'{mode:<10}{elapsed:>10.2f}{elapsed / len(run_paths) * 1000:>18.1f}  {summary}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+SRC: Path = Path(__file__).resolve().parent.parent.joinpath('src')
+
+
+async def run_client(socket_path: Path, sources: list[str], latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_unix_connection(str(socket_path), limit = 1 << 26)
+    for index, source in enumerate(sources):
+        start: float = time.perf_counter()
+        writer.write(json.dumps({'id': index, 'source': source}).encode() + b'\n')
+        await writer.drain()
+        response: dict[str, object] = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if response['status'] not in ('ok', 'error', 'crash'):
+            raise RuntimeError(f'unexpected response {response}')
+    writer.close()
+    await writer.wait_closed()
+
+async def run_clients(socket_path: Path, sources: list[str], clients: int) -> tuple[list[float], float]:
+    while not socket_path.exists():
+        await asyncio.sleep(0.05)
+    latencies: list[float] = []
+    await run_client(socket_path, sources[:1], [])
+    start: float = time.perf_counter()
+    await asyncio.gather(*(run_client(socket_path, sources[index::clients], latencies) for index in range(clients)))
+    return latencies, time.perf_counter() - start
+
+def run_cold(sources: list[str]) -> list[float]:
+    latencies: list[float] = []
+    for source in sources:
+        start: float = time.perf_counter()
+        subprocess.run([sys.executable, str(SRC / 'main.py')], input = source, capture_output = True, text = True)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def print_row(mode: str, latencies: list[float], elapsed: float) -> None:
+    quantiles: list[float] = statistics.quantiles(latencies, n = 100, method = 'inclusive')
+    print(f'{mode:<16}{quantiles[49] * 1000:>10.1f}{quantiles[98] * 1000:>10.1f}{len(latencies) / elapsed:>16.1f}')
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Request latency of a warm checker server against one fresh process per program')
+    argument_parser.add_argument('--corpus', type = Path, default = SRC.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--copies', type = int, default = 3)
+    argument_parser.add_argument('--workers', type = int, default = 1)
+    argument_parser.add_argument('--clients', type = int, default = 4)
+    args: Namespace = argument_parser.parse_args()
+    sources: list[str] = [path.read_text() for path in sorted(args.corpus.rglob('*.stella'))] * args.copies
+    print(f'{len(sources)} programs')
+    print(f'{"mode":<16}{"p50, ms":>10}{"p99, ms":>10}{"programs / s":>16}')
+    start: float = time.perf_counter()
+    print_row('cold process', run_cold(sources), time.perf_counter() - start)
+    with TemporaryDirectory() as directory:
+        socket_path: Path = Path(directory) / 'server.sock'
+        server: subprocess.Popen = subprocess.Popen([sys.executable, str(SRC / 'server.py'), '--socket', str(socket_path), '--workers', str(args.workers)], stderr = subprocess.DEVNULL)
+        try:
+            latencies, elapsed = asyncio.run(run_clients(socket_path, sources, args.clients))
+        finally:
+            server.terminate()
+            server.wait()
+    print_row(f'server x{args.clients}', latencies, elapsed)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import time
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from programs import generate_simply_typed_program
+
+from checker.checkerManager import CheckerManager
+from checker.checkerSession import CheckerSession
+from parsing.programParser import ParseError, parse_program
+
+
+def check_fresh(sources: list[str]) -> float:
+    start: float = time.perf_counter()
+    for source in sources:
+        try:
+            CheckerManager().check(parse_program(source))
+        except (ParseError, ValueError):
+            pass
+    return time.perf_counter() - start
+
+def check_session(sources: list[str]) -> float:
+    checker_session: CheckerSession = CheckerSession()
+    start: float = time.perf_counter()
+    for source in sources:
+        try:
+            checker_session.check(source)
+        except ValueError:
+            pass
+    return time.perf_counter() - start
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Time to check many small programs with fresh checker objects and with one session')
+    argument_parser.add_argument('--corpus', type = Path, default = Path(__file__).resolve().parent.parent.joinpath('tests', 'test_cases'))
+    argument_parser.add_argument('--copies', type = int, default = 30)
+    args: Namespace = argument_parser.parse_args()
+    sources: list[str] = [path.read_text() for path in sorted(args.corpus.rglob('*.stella'))] * args.copies
+    sources.extend(generate_simply_typed_program(index % 4 + 1) for index in range(len(sources)))
+    check_session(sources[:len(sources) // args.copies // 2])
+    print(f'{len(sources)} programs')
+    print(f'{"mode":<10}{"total, s":>10}{"per program, ms":>18}')
+    for mode, check in (('fresh', check_fresh), ('session', check_session)):
+        elapsed: float = check(sources)
+        print(f'{mode:<10}{elapsed:>10.2f}{elapsed / len(sources) * 1000:>18.2f}')
+
+if __name__ == '__main__':
+    main()
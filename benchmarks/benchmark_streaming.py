@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+from programs import generate_simply_typed_program, generate_structural_subtyping_program
+
+
+GENERATORS: dict[str, Callable[[int], str]] = {
+    'simply-typed': generate_simply_typed_program,
+    'structural-subtyping': generate_structural_subtyping_program
+}
+MAIN: Path = Path(__file__).resolve().parent.parent.joinpath('src', 'main.py')
+
+
+def run_checker(path: Path, *args: str) -> tuple[float, float]:
+    start: float = time.perf_counter()
+    with path.open() as file:
+        process: subprocess.Popen = subprocess.Popen([sys.executable, str(MAIN), *args], stdin = file, stderr = subprocess.DEVNULL)
+        _, status, usage = os.wait4(process.pid, 0)
+    if status:
+        raise RuntimeError(f'checker exited with status {status}')
+    return time.perf_counter() - start, usage.ru_maxrss / 1024
+
+def main() -> None:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Peak memory and time of whole-program and declaration-streaming checks')
+    argument_parser.add_argument('--functions', type = int, nargs = '+', default = [1000, 4000, 16000])
+    args: Namespace = argument_parser.parse_args()
+    print(f'{"profile":<24}{"functions":>10}{"size, KiB":>12}{"whole, s":>10}{"whole, MiB":>12}{"stream, s":>11}{"stream, MiB":>13}')
+    with TemporaryDirectory() as directory:
+        for name, generate_program in GENERATORS.items():
+            for functions_count in args.functions:
+                path: Path = Path(directory) / f'{name}-{functions_count}.stella'
+                path.write_text(generate_program(functions_count))
+                whole_time, whole_memory = run_checker(path, '--regex-lexer')
+                stream_time, stream_memory = run_checker(path, '--stream')
+                print(f'{name:<24}{functions_count:>10}{path.stat().st_size / 1024:>12.0f}{whole_time:>10.2f}{whole_memory:>12.1f}{stream_time:>11.2f}{stream_memory:>13.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import sys
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.joinpath('src')))
+
+
+def generate_simply_typed_program(functions_count: int) -> str:
+    declarations: list[str] = []
+    for index in range(functions_count):
+        declarations.append(f'''fn f{index}(n : Nat) -> Nat {{
+  return if Nat::iszero(n) then (fn(x : Nat) {{ return succ(x) }})(n) else Nat::pred(succ(n))
+}}''')
+    declarations.append(f'''fn main(n : Nat) -> Nat {{
+  return f{functions_count - 1}(n)
+}}''')
+    return 'language core;\n\n' + '\n\n'.join(declarations)
+
+def generate_structural_subtyping_program(functions_count: int) -> str:
+    declarations: list[str] = []
+    for index in range(functions_count):
+        declarations.append(f'''fn f{index}(r : {{a : Nat, b : Bool}}) -> {{a : Nat}} {{
+  return {{a = succ(r.a), b = r.b, c = {{x = 0, y = true}}}}
+}}''')
+    declarations.append(f'''fn main(n : Nat) -> {{a : Nat}} {{
+  return f{functions_count - 1}({{a = n, b = false, c = unit}})
+}}''')
+    return 'language core;\nextend with #records, #structural-subtyping, #unit-type;\n\n' + '\n\n'.join(declarations)
+
+def generate_type_reconstruction_program(functions_count: int) -> str:
+    declarations: list[str] = []
+    for index in range(functions_count):
+        declarations.append(f'''fn f{index}(n : auto) -> auto {{
+  return if Nat::iszero(n) then succ(n) else (fn(x : auto) {{ return Nat::pred(x) }})(n)
+}}''')
+    declarations.append(f'''fn main(n : Nat) -> auto {{
+  return f{functions_count - 1}(n)
+}}''')
+    return 'language core;\nextend with #type-reconstruction;\n\n' + '\n\n'.join(declarations)
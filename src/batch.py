@@ -0,0 +1,155 @@
+import atexit
+import json
+import os
+import sys
+import time
+import traceback
+
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from io import StringIO
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from checkRunner import CheckRunner
+from main import add_arguments
+from type.type import TypeVariable
+
+
+@dataclass
+class BatchResult:
+    path: str
+    status: str
+    exit_code: int
+    error_kind: str | None
+    message: str
+    is_cached: bool = False
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii = False)
+
+
+class BatchWorker:
+    check_runner: CheckRunner | None = None
+    type_variable_count: int = 0
+
+    @classmethod
+    def initialize(cls, args: Namespace) -> None:
+        cls.check_runner = CheckRunner(args)
+        cls.type_variable_count = TypeVariable.get_count()
+        atexit.register(cls.check_runner.close)
+
+    @classmethod
+    def check(cls, path: Path) -> BatchResult:
+        try:
+            with path.open() as input:
+                return cls.check_input(str(path), input)
+        except OSError:
+            return BatchResult(str(path), 'crash', 1, None, traceback.format_exc())
+
+    @classmethod
+    def check_input(cls, name: str, input: TextIO) -> BatchResult:
+        TypeVariable.reset_count(cls.type_variable_count)
+        output: StringIO = StringIO()
+        try:
+            exit_code: int = cls.check_runner.run(input, output)
+        except Exception:
+            return BatchResult(name, 'crash', 1, None, output.getvalue() + traceback.format_exc())
+        if cls.check_runner.exceeded_budget:
+            return BatchResult(name, 'budget', exit_code & 0xFF, None, output.getvalue())
+        error_kind: str | None = cls.check_runner.errors[0].error_kind.name if exit_code and cls.check_runner.errors else None
+        return BatchResult(name, 'error' if exit_code else 'ok', exit_code & 0xFF, error_kind, output.getvalue(), cls.check_runner.is_cached)
+
+
+def parse_args() -> Namespace:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Check many Stella programs in one process and write one JSON result line per program')
+    argument_parser.add_argument('paths', nargs = '*', type = Path, help = 'program files or directories searched recursively for *.stella files')
+    argument_parser.add_argument('--list', metavar = 'FILE', type = Path, help = 'read program paths from FILE, one per line, or from stdin if FILE is -')
+    argument_parser.add_argument('--jobs', type = int, default = 1, help = 'number of worker processes, 0 for one per CPU')
+    argument_parser.add_argument('--max-tasks-per-worker', type = int, default = 500, help = 'replace a worker process after it has checked this many programs')
+    return add_arguments(argument_parser).parse_args()
+
+def iter_paths(paths: list[Path], list_path: Path | None) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob('*.stella'))
+        else:
+            yield path
+    if list_path:
+        lines: Iterator[str] = sys.stdin if str(list_path) == '-' else list_path.open()
+        for line in lines:
+            if line.strip():
+                yield Path(line.strip())
+
+def get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+def check_serial(args: Namespace, paths: Iterator[Path]) -> Iterator[BatchResult]:
+    BatchWorker.initialize(args)
+    for path in paths:
+        yield BatchWorker.check(path)
+
+def check_parallel(args: Namespace, paths: list[Path], jobs: int) -> Iterator[BatchResult]:
+    pending: deque[int] = deque(sorted(range(len(paths)), key = lambda index: get_size(paths[index]), reverse = True))
+    results: dict[int, BatchResult] = {}
+    emitted: int = 0
+    while pending:
+        suspects: list[int] = []
+        with ProcessPoolExecutor(jobs, initializer = BatchWorker.initialize, initargs = (args,), max_tasks_per_child = args.max_tasks_per_worker) as executor:
+            running: dict[Future, int] = {}
+            while (pending or running) and not suspects:
+                while pending and len(running) < 2 * jobs:
+                    index: int = pending.popleft()
+                    running[executor.submit(BatchWorker.check, paths[index])] = index
+                done, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except BrokenProcessPool:
+                        suspects.append(index)
+                if suspects:
+                    suspects.extend(running.values())
+                while emitted in results:
+                    yield results.pop(emitted)
+                    emitted += 1
+        for index in sorted(suspects):
+            results[index] = check_isolated(args, paths[index])
+        while emitted in results:
+            yield results.pop(emitted)
+            emitted += 1
+
+def check_isolated(args: Namespace, path: Path) -> BatchResult:
+    with ProcessPoolExecutor(1, initializer = BatchWorker.initialize, initargs = (args,)) as executor:
+        try:
+            return executor.submit(BatchWorker.check, path).result()
+        except BrokenProcessPool as broken_process_pool:
+            return BatchResult(str(path), 'crash', 1, None, f'{broken_process_pool}\n')
+
+def main() -> None:
+    args: Namespace = parse_args()
+    jobs: int = args.jobs or os.cpu_count() or 1
+    counts: dict[str, int] = {'ok': 0, 'error': 0, 'budget': 0, 'crash': 0}
+    cached_count: int = 0
+    start: float = time.perf_counter()
+    results: Iterator[BatchResult] = check_serial(args, iter_paths(args.paths, args.list)) if jobs == 1 else check_parallel(args, list(iter_paths(args.paths, args.list)), jobs)
+    try:
+        for result in results:
+            counts[result.status] += 1
+            cached_count += result.is_cached
+            sys.stdout.write(f'{result.to_json()}\n')
+    finally:
+        sys.stdout.flush()
+    sys.stderr.write(f'{sum(counts.values())} programs: {counts["ok"]} ok, {counts["error"]} with errors, {counts["budget"]} over budget, {counts["crash"]} crashed in {time.perf_counter() - start:.2f} s\n')
+    if args.result_cache:
+        sys.stderr.write(f'result cache: {cached_count} hits, hit rate {cached_count / max(sum(counts.values()), 1):.1%}\n')
+    sys.exit(0 if not counts['error'] and not counts['budget'] and not counts['crash'] else -1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+import os
+import shutil
+
+from antlr4 import Token
+from argparse import Namespace
+from tempfile import TemporaryFile
+from typing import TextIO
+
+from antlr.stellaParser import stellaParser
+from checker.checkerManager import CheckerManager
+from checker.functionCache import FunctionCache
+from checker.incrementalChecker import IncrementalChecker
+from checker.parallelChecker import ParallelChecker
+from checker.resultCache import ResultCache
+from error.error import Error, format_error, format_errors, format_warning
+from parsing.declarationStream import DeclarationStream, SourceText
+from parsing.dfaCache import DfaCache
+from parsing.parseCache import ParseCache
+from parsing.programParser import ParseError, ProgramParser
+from type.checkBudget import BudgetExceededError, CheckBudget
+
+
+class CheckRunner:
+    args: Namespace
+    program_parser: ProgramParser
+    checker_manager: CheckerManager
+    parse_cache: ParseCache | None
+    dfa_cache: DfaCache | None
+    result_cache: ResultCache | None
+    function_cache: FunctionCache | None
+    parallel_checker: ParallelChecker | None
+    check_budget: CheckBudget | None
+    errors: list[Error]
+    warnings: list[Error]
+    exceeded_budget: BudgetExceededError | None
+    is_cached: bool
+
+    def __init__(self, args: Namespace):
+        self.args = args
+        self.errors = []
+        self.warnings = []
+        self.exceeded_budget = None
+        self.is_cached = False
+        self.check_budget = self._get_check_budget()
+        self.program_parser = ProgramParser('', args.regex_lexer)
+        self.checker_manager = CheckerManager(args.all_errors, args.max_errors, args.require_extensions, self.check_budget)
+        self.parse_cache = ParseCache(args.parse_cache, is_regex_lexer = args.regex_lexer) if args.parse_cache else None
+        self.dfa_cache = DfaCache(args.dfa_cache) if args.dfa_cache else None
+        if self.dfa_cache:
+            self.dfa_cache.load()
+        self.result_cache = ResultCache(args.result_cache, self._get_result_options()) if args.result_cache else None
+        self.function_cache = FunctionCache(args.function_cache, str(args.all_errors)) if args.function_cache else None
+        check_jobs: int = args.check_jobs or os.cpu_count() or 1
+        self.parallel_checker = ParallelChecker(check_jobs, args.all_errors, args.max_errors, args.require_extensions) if check_jobs > 1 else None
+
+    def run(self, input: TextIO, output: TextIO) -> int:
+        self.errors = []
+        self.warnings = []
+        self.exceeded_budget = None
+        self.is_cached = False
+        if self.check_budget:
+            self.check_budget.start()
+        try:
+            if self.args.stream:
+                declaration_stream: DeclarationStream = DeclarationStream(self._open_stream_input(input), self.args.regex_lexer)
+                return self._check(declaration_stream, declaration_stream.source, output)
+            source: str = input.read()
+            if self.result_cache:
+                return self._check_cached(source, output)
+            return self._check_source(source, output)
+        except ParseError as parse_error:
+            self.errors = parse_error.errors
+            output.write(format_errors(parse_error.errors, '') if self.args.all_errors else format_error(parse_error.errors[0], ''))
+            return -1
+        except BudgetExceededError as budget_exceeded_error:
+            self.errors = []
+            self.exceeded_budget = budget_exceeded_error
+            output.write(f'Type checking stopped!\n{budget_exceeded_error}\n')
+            return -2
+        finally:
+            if self.check_budget:
+                self.check_budget.stop()
+
+    def close(self) -> None:
+        if self.parallel_checker:
+            self.parallel_checker.close()
+        if self.dfa_cache and DfaCache.get_state_count() > self.dfa_cache.loaded_states:
+            self.dfa_cache.save()
+
+    def _parse(self, source: str) -> stellaParser.ProgramContext:
+        if self.parse_cache:
+            return self.parse_cache.parse(source)
+        self.program_parser.set_source(source)
+        return self.program_parser.parse()
+
+    def _check_cached(self, source: str, output: TextIO) -> int:
+        source_key: str = self.result_cache.get_source_key(source)
+        result: tuple[list[Error], list[Error]] | None = self.result_cache.load_source(source_key)
+        if result:
+            self.is_cached = True
+            return self._write_result(*result, source, output)
+        self.program_parser.set_source(source)
+        tokens: list[Token] = self.program_parser.get_tokens()
+        if self.program_parser.errors:
+            return self._check(self._parse(source), source, output)
+        result_key: str = self.result_cache.get_key(tokens)
+        result = self.result_cache.load(result_key, tokens)
+        if result:
+            self.is_cached = True
+            return self._write_result(*result, source, output)
+        exit_code: int = self._check_source(source, output) if self._is_parallel(source) else self._check(self.parse_cache.parse(source) if self.parse_cache else self.program_parser.parse(), source, output)
+        self.result_cache.store(result_key, tokens, self.errors, self.warnings, source_key)
+        return exit_code
+
+    def _check_source(self, source: str, output: TextIO) -> int:
+        if self._is_parallel(source):
+            errors: list[Error] | None = self.parallel_checker.check(source)
+            if errors is not None:
+                return self._write_result(errors if self.args.all_errors else errors[:1], self.parallel_checker.warnings, source, output)
+        return self._check(self._parse(source), source, output)
+
+    def _is_parallel(self, source: str) -> bool:
+        return self.parallel_checker is not None and not self.function_cache and not self.check_budget and len(source) >= self.args.parallel_threshold
+
+    def _check(self, program: stellaParser.ProgramContext | DeclarationStream, source: str | SourceText, output: TextIO) -> int:
+        if self.check_budget:
+            self.check_budget.poll()
+        if self.function_cache and isinstance(program, stellaParser.ProgramContext):
+            incremental_checker: IncrementalChecker = IncrementalChecker(self.function_cache, self.args.all_errors, self.args.max_errors, self.args.require_extensions, self.check_budget)
+            errors: list[Error] = incremental_checker.check(program, source)
+            return self._write_result(errors if self.args.all_errors else errors[:1], incremental_checker.warnings, source, output)
+        self.checker_manager.reset()
+        if self.args.all_errors:
+            errors: list[Error] = self.checker_manager.check(program)
+            return self._write_result(errors, self.checker_manager.warnings, source, output)
+        error: Error | None = self.checker_manager.check_first(program)
+        return self._write_result([error] if error else [], self.checker_manager.warnings, source, output)
+
+    def _write_result(self, errors: list[Error], warnings: list[Error], source: str | SourceText, output: TextIO) -> int:
+        self._write_warnings(warnings, source, output)
+        self.errors = errors
+        self.warnings = warnings
+        if not errors:
+            return 0
+        output.write(format_errors(errors, source) if self.args.all_errors else format_error(errors[0], source))
+        return -1
+
+    def _get_check_budget(self) -> CheckBudget | None:
+        if self.args.deadline is None and self.args.max_nodes is None and self.args.max_constraints is None and self.args.max_type_size is None and self.args.max_memory is None:
+            return None
+        return CheckBudget(self.args.deadline, self.args.max_nodes, self.args.max_constraints, self.args.max_type_size, self.args.max_memory * 1024 * 1024 if self.args.max_memory is not None else None, self.args.trace_memory)
+
+    def _get_result_options(self) -> str:
+        return f'{self.args.all_errors}:{self.args.max_errors}:{self.args.require_extensions}:{self.args.regex_lexer}'
+
+    @classmethod
+    def _write_warnings(cls, warnings: list[Error], source: str | SourceText, output: TextIO) -> None:
+        for warning in warnings:
+            output.write(f'{format_warning(warning, source)}\n')
+
+    @classmethod
+    def _open_stream_input(cls, input: TextIO) -> TextIO:
+        if input.seekable():
+            return input
+        spool: TextIO = TemporaryFile('w+', newline = '')
+        shutil.copyfileobj(input, spool)
+        return spool
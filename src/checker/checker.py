@@ -1,43 +1,117 @@
 from abc import ABCMeta, abstractmethod
+from typing import Iterable
 
-from antlr.stellaParser import stellaParser
-from checker.visitor import StructureVisitor, TypeVisitor
+from checker.declarationIndex import Declaration, DeclarationIndex
+from checker.syntaxGate import SyntaxGate, SyntaxReport
+from checker.visitor import TypeVisitor
+from error.errorKind import ErrorKind
 from error.errorManager import ErrorManager
+from extension.extensionFeatures import ExtensionFeatures, ExtensionProfile
 from extension.extensionKind import ExtensionKind
 from extension.extensionManager import ExtensionManager
-from unification.unifySolver import UnifySolver
+from syntax import syntaxTree
+from type.checkBudget import CheckBudget
+from type.inferenceCache import InferenceCache
+from unification.unifySolver import DisabledUnifySolver, UnifySolver
 
 
 class Checker(metaclass = ABCMeta):
 
     @abstractmethod
-    def check(self, program_context: stellaParser.ProgramContext) -> None:
+    def check(self, program: syntaxTree.Program, declaration_index: DeclarationIndex) -> None:
         pass
 
+    def check_stream(self, program: syntaxTree.Program, declaration_index: DeclarationIndex, decls: Iterable[syntaxTree.Decl]) -> None:
+        self.check(program, declaration_index)
+
+
+class SyntaxChecker(Checker):
+    _error_manager: ErrorManager
+    _is_strict_extensions: bool
+
+    def __init__(self, error_manager: ErrorManager, is_strict_extensions: bool = False):
+        self._error_manager = error_manager
+        self._is_strict_extensions = is_strict_extensions
+
+    def check(self, program: syntaxTree.Program, declaration_index: DeclarationIndex) -> None:
+        self.check_report(SyntaxGate.scan(program, self.get_features(program)))
+
+    def get_features(self, program: syntaxTree.Program) -> ExtensionFeatures:
+        extension_manager: ExtensionManager = ExtensionManager()
+        register_extensions(program, extension_manager)
+        return extension_manager.features
+
+    def check_report(self, report: SyntaxReport) -> None:
+        if report.unsupported_syntax:
+            unsupported_syntax: str = ', '.join(f'{name} ({count})' if count > 1 else name for name, count in report.unsupported_syntax.items())
+            if self._is_strict_extensions:
+                self._error_manager.register_error(ErrorKind.ERROR_UNSUPPORTED_SYNTAX, unsupported_syntax)
+            else:
+                self._error_manager.register_warning(ErrorKind.ERROR_UNSUPPORTED_SYNTAX, unsupported_syntax)
+        if self._is_strict_extensions:
+            for extensions, ctx in report.missing_extensions.items():
+                self._error_manager.register_error(ErrorKind.ERROR_MISSING_EXTENSION, ' or '.join(f'#{extension.str_name}' for extension in extensions), ctx)
+
 
 class StructureChecker(Checker):
-    _visitor: StructureVisitor
+    _error_manager: ErrorManager
 
     def __init__(self, error_manager: ErrorManager):
-        self._visitor = StructureVisitor(error_manager)
+        self._error_manager = error_manager
 
-    def check(self, program_context: stellaParser.ProgramContext) -> None:
-        self._visitor.visitProgram(program_context)
+    def check(self, program: syntaxTree.Program, declaration_index: DeclarationIndex) -> None:
+        if not declaration_index.main:
+            self._error_manager.register_error(ErrorKind.ERROR_MISSING_MAIN)
+        elif declaration_index.main.arity != 1:
+            self._error_manager.register_error(ErrorKind.ERROR_INCORRECT_ARITY_OF_MAIN, declaration_index.main.arity)
 
 
 class TypeChecker(Checker):
+    _error_manager: ErrorManager
     _extension_manager: ExtensionManager
     _unify_solver: UnifySolver
+    _inference_cache: InferenceCache
+    _check_budget: CheckBudget | None
     _visitor: TypeVisitor
 
-    def __init__(self, error_manager: ErrorManager):
+    def __init__(self, error_manager: ErrorManager, check_budget: CheckBudget | None = None):
+        self._error_manager = error_manager
         self._extension_manager = ExtensionManager()
-        self._unify_solver = UnifySolver()
-        self._visitor = TypeVisitor(error_manager, self._extension_manager, self._unify_solver)
-
-    def check(self, program_context: stellaParser.ProgramContext) -> None:
-        for extension_context in program_context.extensions:
-            if isinstance(extension_context, stellaParser.AnExtensionContext):
-                for extension_name in extension_context.extensionNames:
-                    self._extension_manager.register_extension(ExtensionKind.from_str(extension_name.text[1:]))
-        self._visitor.visitProgram(program_context)
+        self._unify_solver = None
+        self._inference_cache = InferenceCache()
+        self._check_budget = check_budget
+        self._visitor = None
+
+    def check(self, program: syntaxTree.Program, declaration_index: DeclarationIndex) -> None:
+        self._create_visitor(program)
+        try:
+            self._visitor.visit_program(program, declaration_index)
+        finally:
+            self._inference_cache.clear_fingerprints()
+
+    def check_stream(self, program: syntaxTree.Program, declaration_index: DeclarationIndex, decls: Iterable[syntaxTree.Decl]) -> None:
+        self._create_visitor(program)
+        try:
+            self._visitor.visit_signatures(declaration_index)
+            for index, decl in enumerate(decls):
+                declaration: Declaration = declaration_index.declarations[index]
+                self._visitor.visit_declaration(Declaration(decl, declaration.name, declaration.arity, declaration.signature))
+            self._visitor.solve()
+        finally:
+            self._inference_cache.clear_fingerprints()
+
+    def _create_visitor(self, program: syntaxTree.Program) -> None:
+        self._extension_manager = ExtensionManager()
+        self._inference_cache.clear()
+        register_extensions(program, self._extension_manager)
+        match self._extension_manager.features.profile:
+            case ExtensionProfile.TYPE_RECONSTRUCTION:
+                self._unify_solver = UnifySolver(self._check_budget)
+            case _:
+                self._unify_solver = DisabledUnifySolver()
+        self._visitor = TypeVisitor(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, check_budget = self._check_budget)
+
+
+def register_extensions(program: syntaxTree.Program, extension_manager: ExtensionManager) -> None:
+    for extension_name in program.extensions:
+        extension_manager.register_extension(ExtensionKind.from_str(extension_name))
@@ -1,20 +1,70 @@
+from functools import partial
+from typing import Callable
+
 from antlr.stellaParser import stellaParser
-from checker.checker import Checker, StructureChecker, TypeChecker
+from checker.passManager import PassManager
 from error.error import Error
-from error.errorManager import ErrorManager
+from error.errorManager import CheckCancelledError, ErrorManager
+from parsing.declarationStream import DeclarationStream
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_program
+from type.checkBudget import CheckBudget
 
 
 class CheckerManager:
     _error_manager: ErrorManager
-    _checkers: list[Checker]
+    _pass_manager: PassManager
+    _check_budget: CheckBudget | None
+
+    def __init__(self, is_recovery_mode: bool = False, max_errors: int | None = None, is_strict_extensions: bool = False, check_budget: CheckBudget | None = None):
+        self._error_manager = ErrorManager(is_recovery_mode, max_errors)
+        self._pass_manager = PassManager(self._error_manager, is_strict_extensions, check_budget)
+        self._check_budget = check_budget
+
+    @property
+    def warnings(self) -> list[Error]:
+        return self._error_manager.warnings
+
+    def reset(self) -> None:
+        self._error_manager.clear()
 
-    def __init__(self):
-        self._error_manager = ErrorManager()
-        self._checkers = []
-        self._checkers.append(StructureChecker(self._error_manager))
-        self._checkers.append(TypeChecker(self._error_manager))
+    def check(self, program: stellaParser.ProgramContext | syntaxTree.Program | DeclarationStream) -> list[Error]:
+        is_budget_started: bool = self._check_budget is not None and not self._check_budget.is_running
+        if is_budget_started:
+            self._check_budget.start()
+        try:
+            match program:
+                case DeclarationStream():
+                    self._pass_manager.run_stream(program)
+                case stellaParser.ProgramContext():
+                    self._pass_manager.run(lower_program(program))
+                case _:
+                    self._pass_manager.run(program)
+        finally:
+            if is_budget_started:
+                self._check_budget.stop()
+        return self._error_manager.errors
+
+    def check_first(self, program: stellaParser.ProgramContext | syntaxTree.Program | DeclarationStream) -> Error | None:
+        errors: list[Error] = self.stream_errors(program, self._stop_check)
+        return errors[0] if errors else None
 
-    def check(self, program_context: stellaParser.ProgramContext) -> list[Error]:
-        for checker in self._checkers:
-            checker.check(program_context)
+    def stream_errors(self, program: stellaParser.ProgramContext | syntaxTree.Program | DeclarationStream, handle_error: Callable[[Error], bool]) -> list[Error]:
+        listener: Callable[[Error], None] = partial(self._publish_error, handle_error)
+        self._error_manager.add_listener(listener)
+        try:
+            self.check(program)
+        except CheckCancelledError:
+            pass
+        finally:
+            self._error_manager.remove_listener(listener)
         return self._error_manager.errors
+
+    @classmethod
+    def _publish_error(cls, handle_error: Callable[[Error], bool], error: Error) -> None:
+        if not handle_error(error):
+            raise CheckCancelledError()
+
+    @classmethod
+    def _stop_check(cls, error: Error) -> bool:
+        return False
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+from antlr.stellaParser import stellaParser
+from checker.checkerManager import CheckerManager
+from error.error import Error, format_error, format_errors, format_warning
+from error.errorKind import ErrorKind
+from parsing.programParser import ParseError, ProgramParser
+from type.checkBudget import BudgetExceededError, CheckBudget
+from type.type import TypeVariable
+
+
+@dataclass(frozen = True, slots = True)
+class CheckResult:
+    errors: list[Error]
+    warnings: list[Error]
+    message: str
+    exceeded_resource: str | None = None
+
+    @property
+    def is_ok(self) -> bool:
+        return not self.errors and self.exceeded_resource is None
+
+    @property
+    def error_kind(self) -> ErrorKind | None:
+        return self.errors[0].error_kind if self.errors else None
+
+
+class CheckerSession:
+    is_recovery_mode: bool
+    checks_count: int
+    _program_parser: ProgramParser
+    _checker_manager: CheckerManager
+    _check_budget: CheckBudget | None
+    _type_variable_count: int
+
+    def __init__(self, is_recovery_mode: bool = False, max_errors: int | None = None, is_strict_extensions: bool = False, is_regex_lexer: bool = False, check_budget: CheckBudget | None = None):
+        self.is_recovery_mode = is_recovery_mode
+        self.checks_count = 0
+        self._program_parser = ProgramParser('', is_regex_lexer)
+        self._checker_manager = CheckerManager(is_recovery_mode, max_errors, is_strict_extensions, check_budget)
+        self._check_budget = check_budget
+        self._type_variable_count = TypeVariable.get_count()
+
+    def check(self, text: str) -> CheckResult:
+        self.checks_count += 1
+        TypeVariable.reset_count(self._type_variable_count)
+        self._checker_manager.reset()
+        self._program_parser.set_source(text)
+        if self._check_budget:
+            self._check_budget.start()
+        try:
+            return self._check_program(text)
+        except BudgetExceededError as budget_exceeded_error:
+            return CheckResult([], [], f'Type checking stopped!\n{budget_exceeded_error}\n', budget_exceeded_error.resource)
+        finally:
+            if self._check_budget:
+                self._check_budget.stop()
+
+    def _check_program(self, text: str) -> CheckResult:
+        try:
+            program_context: stellaParser.ProgramContext = self._program_parser.parse()
+        except ParseError as parse_error:
+            return self._make_result(parse_error.errors if self.is_recovery_mode else parse_error.errors[:1], [], '')
+        if self._check_budget:
+            self._check_budget.poll()
+        if self.is_recovery_mode:
+            return self._make_result(self._checker_manager.check(program_context), self._checker_manager.warnings, text)
+        error: Error | None = self._checker_manager.check_first(program_context)
+        return self._make_result([error] if error else [], self._checker_manager.warnings, text)
+
+    def _make_result(self, errors: list[Error], warnings: list[Error], source: str) -> CheckResult:
+        message: str = ''.join(f'{format_warning(warning, source)}\n' for warning in warnings)
+        if errors:
+            message += format_errors(errors, source) if self.is_recovery_mode else format_error(errors[0], source)
+        return CheckResult(list(errors), list(warnings), message)
@@ -0,0 +1,86 @@
+from dataclasses import replace
+from typing import Final, Self
+
+from syntax import syntaxTree
+from type.type import FunctionalType, GenericType, Type, UniversalWrapperType
+from type.typeVisitor import get_type
+
+
+class Declaration:
+    decl: syntaxTree.Decl
+    name: str | None
+    arity: int
+    signature: Type | None
+    _local_index: Self | None
+
+    def __init__(self, decl: syntaxTree.Decl, name: str | None, arity: int, signature: Type | None):
+        self.decl = decl
+        self.name = name
+        self.arity = arity
+        self.signature = signature
+        self._local_index = None
+
+    @property
+    def local_index(self) -> 'DeclarationIndex':
+        if self._local_index is None:
+            self._local_index = DeclarationIndex.build(self.decl.localDecls if isinstance(self.decl, syntaxTree.DeclFun) else [])
+        return self._local_index
+
+    def drop_body(self) -> None:
+        if isinstance(self.decl, syntaxTree.DeclFun | syntaxTree.DeclFunGeneric):
+            self.decl = replace(self.decl, localDecls = [], returnExpr = None)
+        self._local_index = None
+
+
+class DeclarationIndex:
+    __main_function_name: Final[str] = 'main'
+    declarations: list[Declaration]
+    functions: dict[str, Declaration]
+    main: Declaration | None
+
+    def __init__(self):
+        self.declarations = []
+        self.functions = {}
+        self.main = None
+
+    @classmethod
+    def build(cls, decls: list[syntaxTree.Decl]) -> Self:
+        declaration_index: DeclarationIndex = cls()
+        for decl in decls:
+            declaration_index.add(decl)
+        return declaration_index
+
+    def add(self, decl: syntaxTree.Decl) -> Declaration:
+        return self.add_declaration(self._index_declaration(decl))
+
+    def add_declaration(self, declaration: Declaration) -> Declaration:
+        decl: syntaxTree.Decl = declaration.decl
+        self.declarations.append(declaration)
+        if declaration.name is None:
+            return declaration
+        self.functions[declaration.name] = declaration
+        if not self.main and isinstance(decl, syntaxTree.DeclFun) and declaration.name == self.__main_function_name:
+            self.main = declaration
+        return declaration
+
+    def lookup(self, name: str) -> Declaration | None:
+        return self.functions.get(name)
+
+    @classmethod
+    def _index_declaration(cls, decl: syntaxTree.Decl) -> Declaration:
+        match decl:
+            case syntaxTree.DeclFun():
+                return Declaration(decl, decl.name, len(decl.paramDecls), cls._get_signature(decl))
+            case syntaxTree.DeclFunGeneric():
+                signature: FunctionalType | None = cls._get_signature(decl)
+                if signature:
+                    signature = UniversalWrapperType([GenericType(generic) for generic in decl.generics], signature)
+                return Declaration(decl, decl.name, len(decl.paramDecls), signature)
+            case _:
+                return Declaration(decl, None, 0, None)
+
+    @classmethod
+    def _get_signature(cls, decl: syntaxTree.DeclFun | syntaxTree.DeclFunGeneric) -> FunctionalType | None:
+        if not decl.paramDecls:
+            return None
+        return FunctionalType(get_type(decl.paramDecls[0].paramType), get_type(decl.returnType))
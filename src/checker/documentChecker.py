@@ -0,0 +1,183 @@
+from antlr4 import Token
+from dataclasses import dataclass, replace
+from typing import Self
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from checker.checker import StructureChecker, SyntaxChecker, register_extensions
+from checker.checkerManager import CheckerManager
+from checker.declarationIndex import Declaration, DeclarationIndex
+from checker.syntaxGate import SyntaxGate, SyntaxReport
+from checker.visitor import TypeVisitor
+from error.error import Error, format_diagnostic
+from error.errorManager import ErrorManager
+from error.sourceSpan import SourceSpan
+from extension.extensionFeatures import ExtensionFeatures, ExtensionProfile
+from extension.extensionManager import ExtensionManager
+from parsing.incrementalParser import IncrementalParser
+from parsing.programParser import ParseError
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_decl, lower_header, lower_program
+from type.inferenceCache import InferenceCache
+from type.type import TypeVariable
+from unification.unifySolver import DisabledUnifySolver
+
+
+@dataclass(frozen = True, slots = True)
+class Diagnostic:
+    start: int
+    stop: int
+    message: str
+    is_warning: bool = False
+
+    def shift(self, delta: int) -> Self:
+        return replace(self, start = self.start + delta, stop = self.stop + delta)
+
+
+class _DeclarationResult:
+    signatures: dict[str, tuple[int, str | None] | None]
+    diagnostics: list[Diagnostic]
+
+    def __init__(self, signatures: dict[str, tuple[int, str | None] | None], diagnostics: list[Diagnostic]):
+        self.signatures = signatures
+        self.diagnostics = diagnostics
+
+
+class DocumentChecker:
+    parser: IncrementalParser
+    is_strict_extensions: bool
+    checked_decls: int
+    _parse_errors: list[Error]
+    _declarations: dict[stellaParser.DeclContext, tuple[Declaration, tuple[int, str | None]]]
+    _results: dict[tuple[str, int], _DeclarationResult]
+    _environment: tuple[object, ...] | None
+    _type_variable_count: int
+
+    def __init__(self, source: str, is_strict_extensions: bool = False):
+        self.is_strict_extensions = is_strict_extensions
+        self.checked_decls = 0
+        self._declarations = {}
+        self._results = {}
+        self._environment = None
+        self._type_variable_count = TypeVariable.get_count()
+        self.set_source(source)
+
+    @property
+    def source(self) -> str:
+        return self.parser.source
+
+    def set_source(self, source: str) -> None:
+        self.parser = IncrementalParser(source)
+        try:
+            self.parser.parse()
+            self._parse_errors = []
+        except ParseError as parse_error:
+            self._parse_errors = parse_error.errors
+
+    def edit(self, start: int, stop: int, text: str) -> None:
+        try:
+            self.parser.edit(start, stop, text)
+            self._parse_errors = []
+        except ParseError as parse_error:
+            self._parse_errors = parse_error.errors
+
+    def check(self) -> list[Diagnostic]:
+        if self._parse_errors:
+            self.checked_decls = 0
+            return [self._make_parse_diagnostic(error) for error in self._parse_errors]
+        program_context: stellaParser.ProgramContext = self.parser.program_context
+        program: syntaxTree.Program = lower_header(program_context)
+        error_manager: ErrorManager = ErrorManager(is_recovery_mode = True)
+        syntax_checker: SyntaxChecker = SyntaxChecker(error_manager, self.is_strict_extensions)
+        features: ExtensionFeatures = syntax_checker.get_features(program)
+        if features.profile == ExtensionProfile.TYPE_RECONSTRUCTION:
+            return self._check_program(program_context)
+        declarations: dict[stellaParser.DeclContext, tuple[Declaration, tuple[int, str | None]]] = {}
+        declaration_index: DeclarationIndex = DeclarationIndex()
+        signature_keys: dict[str, tuple[int, str | None]] = {}
+        texts: list[str] = []
+        for ctx in program_context.decls:
+            if ctx in self._declarations:
+                declaration, signature_key = self._declarations[ctx]
+                declaration_index.add_declaration(declaration)
+            else:
+                declaration = declaration_index.add(lower_decl(ctx))
+                signature_key = (declaration.arity, declaration.signature.name if declaration.signature else None)
+            declarations[ctx] = (declaration, signature_key)
+            if declaration.name is not None:
+                signature_keys[declaration.name] = signature_key
+            texts.append(self.source[ctx.start.start:ctx.stop.stop + 1])
+        self._declarations = declarations
+        environment: tuple[object, ...] = (tuple(program.extensions), *(text for ctx, text in zip(program_context.decls, texts) if not isinstance(ctx, stellaParser.DeclFunContext)))
+        if environment != self._environment:
+            self._results = {}
+            self._environment = environment
+        extension_manager: ExtensionManager = ExtensionManager()
+        register_extensions(program, extension_manager)
+        type_visitor: TypeVisitor = TypeVisitor(error_manager, extension_manager, DisabledUnifySolver(), InferenceCache())
+        type_visitor.visit_signatures(declaration_index)
+        results: dict[tuple[str, int], _DeclarationResult] = {}
+        diagnostics: list[Diagnostic] = []
+        environment_decls: int = 0
+        self.checked_decls = 0
+        for ctx, text, declaration in zip(program_context.decls, texts, declaration_index.declarations):
+            key: tuple[str, int] = (text, environment_decls)
+            result: _DeclarationResult | None = self._results.get(key)
+            if not isinstance(ctx, stellaParser.DeclFunContext):
+                environment_decls += 1
+                result = None
+            if result is None or any(signature_keys.get(name) != signature_key for name, signature_key in result.signatures.items()):
+                result = self._check_declaration(ctx, declaration, signature_keys, features, error_manager, syntax_checker, type_visitor)
+                self.checked_decls += 1
+            results[key] = result
+            diagnostics.extend(diagnostic.shift(ctx.start.start) for diagnostic in result.diagnostics)
+        self._results = results
+        error_manager.clear()
+        StructureChecker(error_manager).check(program, declaration_index)
+        main_ctx: stellaParser.DeclContext | None = program_context.decls[declaration_index.declarations.index(declaration_index.main)] if declaration_index.main else None
+        diagnostics.extend(self._make_diagnostic(error, self._get_name_range(main_ctx or program_context)) for error in error_manager.errors)
+        return diagnostics
+
+    def _check_declaration(self, ctx: stellaParser.DeclContext, declaration: Declaration, signature_keys: dict[str, tuple[int, str | None]], features: ExtensionFeatures, error_manager: ErrorManager, syntax_checker: SyntaxChecker, type_visitor: TypeVisitor) -> _DeclarationResult:
+        decl: syntaxTree.Decl = lower_decl(ctx)
+        error_manager.clear()
+        syntax_checker.check_report(SyntaxGate.scan_decls([decl], features, SyntaxReport()))
+        if not error_manager.errors:
+            type_visitor.visit_declaration(Declaration(decl, declaration.name, declaration.arity, declaration.signature))
+        references: set[str] = {token.text for token in self.parser.tokens[ctx.start.tokenIndex:ctx.stop.tokenIndex + 1] if token.type == stellaLexer.StellaIdent}
+        name_range: tuple[int, int] = self._get_name_range(ctx)
+        diagnostics: list[Diagnostic] = [self._make_diagnostic(error, name_range) for error in error_manager.errors]
+        diagnostics.extend(self._make_diagnostic(warning, name_range, is_warning = True) for warning in error_manager.warnings)
+        return _DeclarationResult({name: signature_keys.get(name) for name in references}, [diagnostic.shift(-ctx.start.start) for diagnostic in diagnostics])
+
+    def _check_program(self, program_context: stellaParser.ProgramContext) -> list[Diagnostic]:
+        TypeVariable.reset_count(self._type_variable_count)
+        program: syntaxTree.Program = lower_program(program_context)
+        checker_manager: CheckerManager = CheckerManager(True, None, self.is_strict_extensions)
+        errors: list[Error] = checker_manager.check(program)
+        self._declarations = {}
+        self._results = {}
+        self._environment = None
+        self.checked_decls = len(program.decls)
+        name_range: tuple[int, int] = self._get_name_range(program_context)
+        diagnostics: list[Diagnostic] = [self._make_diagnostic(error, name_range) for error in errors]
+        diagnostics.extend(self._make_diagnostic(warning, name_range, is_warning = True) for warning in checker_manager.warnings)
+        return diagnostics
+
+    def _make_diagnostic(self, error: Error, fallback: tuple[int, int], is_warning: bool = False) -> Diagnostic:
+        span: SourceSpan | None = next((arg for arg in error.args if isinstance(arg, SourceSpan)), None)
+        start, stop = (span.start, span.stop + 1) if span else fallback
+        return Diagnostic(start, stop, format_diagnostic(error, self.source), is_warning)
+
+    def _make_parse_diagnostic(self, error: Error) -> Diagnostic:
+        line, column = error.args[0], error.args[1]
+        start: int = 0
+        for _ in range(line - 1):
+            start = self.source.find('\n', start) + 1
+        start = min(start + column - 1, len(self.source))
+        return Diagnostic(start, min(start + 1, len(self.source)), format_diagnostic(error, self.source))
+
+    @classmethod
+    def _get_name_range(cls, ctx: stellaParser.DeclContext | stellaParser.ProgramContext) -> tuple[int, int]:
+        token: Token = getattr(ctx, 'name', None) or ctx.start
+        return token.start, token.stop + 1
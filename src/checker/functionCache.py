@@ -0,0 +1,70 @@
+import os
+import pickle
+
+from antlr4.Token import Token
+from hashlib import sha256
+from pathlib import Path
+from typing import Callable, Final
+
+from checker.resultCache import ResultCache
+from checker.syntaxGate import SyntaxReport
+from error.error import Error
+from error.sourceSpan import SourceSpan
+from extension.extensionKind import ExtensionKind
+from syntax import syntaxTree
+
+
+class FunctionCache(ResultCache):
+    __function_suffix: Final[str] = '.function'
+
+    def get_function_key(self, environment: str, text: str, signatures: list[str]) -> str:
+        function_hash = sha256(self.options.encode())
+        for part in (environment, text, *signatures):
+            function_hash.update(f'\x1d{part}'.encode())
+        return function_hash.hexdigest()
+
+    def load_function(self, function_key: str, start: Token) -> tuple[list[Error], SyntaxReport] | None:
+        function_path: Path = self._get_function_path(function_key)
+        try:
+            errors, missing_extensions, unsupported_syntax = pickle.loads(function_path.read_bytes())
+            report: SyntaxReport = SyntaxReport()
+            report.missing_extensions = {extensions: syntaxTree.Node(self._make_absolute(span, start)) for extensions, span in missing_extensions}
+            report.unsupported_syntax = unsupported_syntax
+            result: tuple[list[Error], SyntaxReport] = [self._move_error(error, start, self._make_absolute) for error in errors], report
+            os.utime(function_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, AttributeError, ValueError, TypeError, pickle.UnpicklingError):
+            function_path.unlink(missing_ok = True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def store_function(self, function_key: str, start: Token, stop: Token, errors: list[Error], report: SyntaxReport) -> None:
+        spans: list[SourceSpan] = [arg for error in errors for arg in error.args if isinstance(arg, SourceSpan)]
+        spans.extend(ctx.span for ctx in report.missing_extensions.values())
+        if any(span.start < start.start or span.stop > stop.stop for span in spans):
+            return None
+        missing_extensions: list[tuple[tuple[ExtensionKind, ...], SourceSpan]] = [(extensions, self._make_relative(ctx.span, start)) for extensions, ctx in report.missing_extensions.items()]
+        entry: tuple[list[Error], list[tuple[tuple[ExtensionKind, ...], SourceSpan]], dict[str, int]] = [self._move_error(self._encode_error(error), start, self._make_relative) for error in errors], missing_extensions, dict(report.unsupported_syntax)
+        self._write(self._get_function_path(function_key), pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+        self._count_store()
+        return None
+
+    def _get_function_path(self, function_key: str) -> Path:
+        return self.directory / f'{function_key}{self.__function_suffix}'
+
+    @classmethod
+    def _move_error(cls, error: Error, start: Token, move_span: Callable[[SourceSpan, Token], SourceSpan]) -> Error:
+        return Error(error.error_kind, [move_span(arg, start) if isinstance(arg, SourceSpan) else arg for arg in error.args])
+
+    @classmethod
+    def _make_relative(cls, span: SourceSpan, start: Token) -> SourceSpan:
+        line: int = span.line - start.line
+        return SourceSpan(span.start - start.start, span.stop - start.start, line, span.column - start.column if line == 0 else span.column)
+
+    @classmethod
+    def _make_absolute(cls, span: SourceSpan, start: Token) -> SourceSpan:
+        return SourceSpan(span.start + start.start, span.stop + start.start, span.line + start.line, span.column + start.column if span.line == 0 else span.column)
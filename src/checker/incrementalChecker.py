@@ -0,0 +1,118 @@
+from antlr.stellaParser import stellaParser
+from checker.checker import StructureChecker, SyntaxChecker, register_extensions
+from checker.declarationIndex import Declaration, DeclarationIndex
+from checker.functionCache import FunctionCache
+from checker.passManager import PassManager
+from checker.syntaxGate import SyntaxGate, SyntaxReport
+from checker.visitor import TypeVisitor
+from error.error import Error
+from error.errorManager import ErrorManager
+from extension.extensionFeatures import ExtensionFeatures, ExtensionProfile
+from extension.extensionManager import ExtensionManager
+from parsing.regexLexer import find_identifiers
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_decl, lower_header, lower_signature
+from type.checkBudget import CheckBudget
+from type.inferenceCache import InferenceCache
+from unification.unifySolver import DisabledUnifySolver
+
+
+class _PendingDeclaration:
+    ctx: stellaParser.DeclContext
+    declaration: Declaration
+    function_key: str | None
+    report: SyntaxReport
+    errors: list[Error] | None
+
+    def __init__(self, ctx: stellaParser.DeclContext, declaration: Declaration, function_key: str | None, report: SyntaxReport, errors: list[Error] | None):
+        self.ctx = ctx
+        self.declaration = declaration
+        self.function_key = function_key
+        self.report = report
+        self.errors = errors
+
+
+class IncrementalChecker:
+    function_cache: FunctionCache
+    checked_decls: int
+    _error_manager: ErrorManager
+    _syntax_checker: SyntaxChecker
+    _pass_manager: PassManager
+    _check_budget: CheckBudget | None
+
+    def __init__(self, function_cache: FunctionCache, is_recovery_mode: bool = False, max_errors: int | None = None, is_strict_extensions: bool = False, check_budget: CheckBudget | None = None):
+        self.function_cache = function_cache
+        self.checked_decls = 0
+        self._error_manager = ErrorManager(is_recovery_mode, max_errors)
+        self._syntax_checker = SyntaxChecker(self._error_manager, is_strict_extensions)
+        self._pass_manager = PassManager(self._error_manager, is_strict_extensions, check_budget)
+        self._check_budget = check_budget
+
+    @property
+    def warnings(self) -> list[Error]:
+        return self._error_manager.warnings
+
+    def check(self, program_context: stellaParser.ProgramContext, source: str) -> list[Error]:
+        program: syntaxTree.Program = lower_header(program_context)
+        features: ExtensionFeatures = self._syntax_checker.get_features(program)
+        if features.profile == ExtensionProfile.TYPE_RECONSTRUCTION:
+            program.decls.extend(lower_decl(ctx) for ctx in program_context.decls)
+            self.checked_decls = len(program.decls)
+            self._pass_manager.run(program)
+            return self._error_manager.errors
+        program.decls.extend(lower_signature(ctx) for ctx in program_context.decls)
+        declaration_index: DeclarationIndex = DeclarationIndex.build(program.decls)
+        pending_declarations: list[_PendingDeclaration] = self._load_declarations(program, program_context, declaration_index, features, source)
+        report: SyntaxReport = SyntaxReport()
+        for pending_declaration in pending_declarations:
+            report.update(pending_declaration.report)
+        self._syntax_checker.check_report(report)
+        if self._error_manager.errors:
+            return self._error_manager.errors
+        StructureChecker(self._error_manager).check(program, declaration_index)
+        if self._error_manager.errors and not self._error_manager.is_recovery_mode:
+            return self._error_manager.errors
+        self._check_declarations(program, declaration_index, pending_declarations)
+        return self._error_manager.errors
+
+    def _load_declarations(self, program: syntaxTree.Program, program_context: stellaParser.ProgramContext, declaration_index: DeclarationIndex, features: ExtensionFeatures, source: str) -> list[_PendingDeclaration]:
+        signatures: dict[str, str] = {name: f'{name}:{declaration.arity}:{declaration.signature.name if declaration.signature else ""}' for name, declaration in declaration_index.functions.items()}
+        texts: list[str] = [source[ctx.start.start:ctx.stop.stop + 1] for ctx in program_context.decls]
+        environment: str = '\x1e'.join([*program.extensions, *(text for text, ctx in zip(texts, program_context.decls) if not isinstance(ctx, stellaParser.DeclFunContext))])
+        environment_decls: int = 0
+        pending_declarations: list[_PendingDeclaration] = []
+        for ctx, text, declaration in zip(program_context.decls, texts, declaration_index.declarations):
+            if not isinstance(ctx, stellaParser.DeclFunContext):
+                environment_decls += 1
+                pending_declarations.append(_PendingDeclaration(ctx, declaration, None, SyntaxGate.scan_decls([declaration.decl], features, SyntaxReport()), None))
+                continue
+            function_key: str = self.function_cache.get_function_key(f'{environment}\x1e{environment_decls}', text, [signatures[name] for name in sorted(find_identifiers(text)) if name in signatures])
+            result: tuple[list[Error], SyntaxReport] | None = self.function_cache.load_function(function_key, ctx.start)
+            if result:
+                pending_declarations.append(_PendingDeclaration(ctx, declaration, function_key, result[1], result[0]))
+                continue
+            declaration = Declaration(lower_decl(ctx), declaration.name, declaration.arity, declaration.signature)
+            pending_declarations.append(_PendingDeclaration(ctx, declaration, function_key, SyntaxGate.scan_decls([declaration.decl], features, SyntaxReport()), None))
+        return pending_declarations
+
+    def _check_declarations(self, program: syntaxTree.Program, declaration_index: DeclarationIndex, pending_declarations: list[_PendingDeclaration]) -> None:
+        extension_manager: ExtensionManager = ExtensionManager()
+        register_extensions(program, extension_manager)
+        declaration_errors: ErrorManager = ErrorManager(self._error_manager.is_recovery_mode)
+        type_visitor: TypeVisitor = TypeVisitor(declaration_errors, extension_manager, DisabledUnifySolver(), InferenceCache(), check_budget = self._check_budget)
+        type_visitor.visit_signatures(declaration_index)
+        self.checked_decls = 0
+        for pending_declaration in pending_declarations:
+            errors: list[Error] | None = pending_declaration.errors
+            if errors is None:
+                declaration_errors.clear()
+                type_visitor.visit_declaration(pending_declaration.declaration)
+                errors = declaration_errors.errors
+                self.checked_decls += 1
+                if pending_declaration.function_key:
+                    self.function_cache.store_function(pending_declaration.function_key, pending_declaration.ctx.start, pending_declaration.ctx.stop, errors, pending_declaration.report)
+            for error in errors:
+                self._error_manager.register_error(error.error_kind, *error.args)
+            if errors and not self._error_manager.is_recovery_mode:
+                return None
+        return None
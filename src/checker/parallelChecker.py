@@ -0,0 +1,233 @@
+import multiprocessing
+
+from dataclasses import replace
+from io import StringIO
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Final
+
+from checker.checker import StructureChecker, SyntaxChecker, register_extensions
+from checker.declarationIndex import Declaration, DeclarationIndex
+from checker.syntaxGate import SyntaxGate, SyntaxReport
+from checker.visitor import TypeVisitor
+from error.error import Error
+from error.errorManager import ErrorManager
+from extension.extensionFeatures import ExtensionFeatures, ExtensionProfile
+from extension.extensionManager import ExtensionManager
+from parsing.declarationStream import DeclarationStream
+from parsing.programParser import ParseError, ProgramParser
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_program
+from type.inferenceCache import InferenceCache
+from unification.unifySolver import DisabledUnifySolver
+
+
+class ChunkChecker:
+    decls: list[syntaxTree.Decl]
+
+    def __init__(self):
+        self.decls = []
+
+    def handle(self, message: tuple[object, ...]) -> object:
+        match message:
+            case ('parse', program, chunks):
+                return self.parse(program, chunks)
+            case ('check', program, first, is_recovery_mode):
+                return self.check(program, first, is_recovery_mode)
+            case _:
+                raise ValueError(f'Unexpected value: {message}')
+
+    def parse(self, program: syntaxTree.Program, chunks: list[tuple[int, str, list[tuple[int, int, int, int, int]]]]) -> list[tuple[syntaxTree.Decl, SyntaxReport]] | None:
+        self.decls = []
+        for chunk in chunks:
+            decls: list[syntaxTree.Decl] | None = DeclarationStream.parse_chunk(*chunk)
+            if decls is None:
+                return None
+            self.decls.extend(decls)
+        features: ExtensionFeatures = SyntaxChecker(ErrorManager()).get_features(program)
+        return [(self._get_signature(decl), self._scan(decl, features)) for decl in self.decls]
+
+    def check(self, program: syntaxTree.Program, first: int, is_recovery_mode: bool) -> list[list[Error] | Exception]:
+        extension_manager: ExtensionManager = ExtensionManager()
+        register_extensions(program, extension_manager)
+        error_manager: ErrorManager = ErrorManager(is_recovery_mode)
+        type_visitor: TypeVisitor = TypeVisitor(error_manager, extension_manager, DisabledUnifySolver(), InferenceCache())
+        declaration_index: DeclarationIndex = DeclarationIndex.build(program.decls)
+        type_visitor.visit_signatures(declaration_index)
+        results: list[list[Error] | Exception] = []
+        for index, declaration in enumerate(declaration_index.declarations[:first + len(self.decls)]):
+            if index < first and isinstance(declaration.decl, syntaxTree.DeclFun):
+                continue
+            if index >= first:
+                declaration = Declaration(self.decls[index - first], declaration.name, declaration.arity, declaration.signature)
+            error_manager.clear()
+            try:
+                type_visitor.visit_declaration(declaration)
+            except Exception as exception:
+                if index >= first:
+                    results.append(exception)
+                continue
+            if index >= first:
+                results.append(error_manager.errors)
+        return results
+
+    @classmethod
+    def _get_signature(cls, decl: syntaxTree.Decl) -> syntaxTree.Decl:
+        if isinstance(decl, syntaxTree.DeclFun | syntaxTree.DeclFunGeneric):
+            return replace(decl, localDecls = [], returnExpr = None)
+        return decl
+
+    @classmethod
+    def _scan(cls, decl: syntaxTree.Decl, features: ExtensionFeatures) -> SyntaxReport:
+        report: SyntaxReport = SyntaxGate.scan_decls([decl], features, SyntaxReport())
+        report.missing_extensions = {extensions: syntaxTree.Node(ctx.span) for extensions, ctx in report.missing_extensions.items()}
+        return report
+
+
+class ChunkWorker:
+    __stop_timeout: Final[float] = 5.0
+    process: BaseProcess
+    connection: Connection
+
+    def __init__(self):
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context('spawn')
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target = run_chunk_worker, args = (worker_connection,))
+        self.process.start()
+        worker_connection.close()
+        self.connection.recv()
+
+    def send(self, message: tuple[object, ...]) -> None:
+        self.connection.send(message)
+
+    def receive(self) -> object:
+        return self.connection.recv()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(self.__stop_timeout)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ParallelChecker:
+    jobs: int
+    is_recovery_mode: bool
+    max_errors: int | None
+    is_strict_extensions: bool
+    _error_manager: ErrorManager
+    _workers: list[ChunkWorker]
+
+    def __init__(self, jobs: int, is_recovery_mode: bool = False, max_errors: int | None = None, is_strict_extensions: bool = False):
+        self.jobs = jobs
+        self.is_recovery_mode = is_recovery_mode
+        self.max_errors = max_errors
+        self.is_strict_extensions = is_strict_extensions
+        self._error_manager = ErrorManager(is_recovery_mode, max_errors)
+        self._workers = []
+
+    @property
+    def warnings(self) -> list[Error]:
+        return self._error_manager.warnings
+
+    def check(self, source: str) -> list[Error] | None:
+        try:
+            return self._check(source)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def _check(self, source: str) -> list[Error] | None:
+        self._error_manager = ErrorManager(self.is_recovery_mode, self.max_errors)
+        chunks: list[tuple[int, str, list[tuple[int, int, int, int, int]]]] = list(DeclarationStream(StringIO(source), is_regex_lexer = True, block_size = len(source) + 1).iter_chunks())
+        try:
+            program: syntaxTree.Program = lower_program(ProgramParser(chunks[0][1], is_regex_lexer = True).parse())
+        except ParseError:
+            return None
+        syntax_checker: SyntaxChecker = SyntaxChecker(self._error_manager, self.is_strict_extensions)
+        features: ExtensionFeatures = syntax_checker.get_features(program)
+        if program.decls or features.profile == ExtensionProfile.TYPE_RECONSTRUCTION:
+            return None
+        groups: list[list[tuple[int, str, list[tuple[int, int, int, int, int]]]]] = self._split_chunks(chunks[1:], self.jobs)
+        workers: list[ChunkWorker] = self._get_workers()[:len(groups)]
+        for worker, group in zip(workers, groups):
+            worker.send(('parse', program, group))
+        parsed_groups: list[list[tuple[syntaxTree.Decl, SyntaxReport]] | None] = self._receive(workers)
+        if any(parsed_group is None for parsed_group in parsed_groups):
+            return None
+        report: SyntaxReport = SyntaxReport()
+        for parsed_group in parsed_groups:
+            for decl, decl_report in parsed_group:
+                program.decls.append(decl)
+                report.update(decl_report)
+        syntax_checker.check_report(report)
+        if self._error_manager.errors:
+            return self._error_manager.errors
+        StructureChecker(self._error_manager).check(program, DeclarationIndex.build(program.decls))
+        if self._error_manager.errors and not self.is_recovery_mode:
+            return self._error_manager.errors
+        first: int = 0
+        for worker, parsed_group in zip(workers, parsed_groups):
+            worker.send(('check', program, first, self.is_recovery_mode))
+            first += len(parsed_group)
+        for checked_group in self._receive(workers):
+            for errors in checked_group:
+                if isinstance(errors, Exception):
+                    raise errors
+                for error in errors:
+                    self._error_manager.register_error(error.error_kind, *error.args)
+                if errors and not self.is_recovery_mode:
+                    return self._error_manager.errors
+        return self._error_manager.errors
+
+    def _get_workers(self) -> list[ChunkWorker]:
+        while len(self._workers) < self.jobs:
+            self._workers.append(ChunkWorker())
+        return self._workers
+
+    @classmethod
+    def _receive(cls, workers: list[ChunkWorker]) -> list[object]:
+        results: list[object] = [worker.receive() for worker in workers]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    @classmethod
+    def _split_chunks(cls, chunks: list[tuple[int, str, list[tuple[int, int, int, int, int]]]], groups_count: int) -> list[list[tuple[int, str, list[tuple[int, int, int, int, int]]]]]:
+        total_size: int = sum(len(text) for _, text, _ in chunks)
+        groups: list[list[tuple[int, str, list[tuple[int, int, int, int, int]]]]] = [[]]
+        size: int = 0
+        for chunk in chunks:
+            if size >= total_size * len(groups) / groups_count and len(groups) < groups_count:
+                groups.append([])
+            groups[-1].append(chunk)
+            size += len(chunk[1])
+        return groups
+
+
+def run_chunk_worker(connection: Connection) -> None:
+    chunk_checker: ChunkChecker = ChunkChecker()
+    connection.send(True)
+    while True:
+        try:
+            message: tuple[object, ...] | None = connection.recv()
+        except EOFError:
+            return None
+        if message is None:
+            return None
+        try:
+            result: object = chunk_checker.handle(message)
+        except Exception as exception:
+            result = exception
+        connection.send(result)
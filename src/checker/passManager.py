@@ -0,0 +1,57 @@
+from typing import Iterator
+
+from checker.checker import Checker, StructureChecker, SyntaxChecker, TypeChecker
+from checker.declarationIndex import DeclarationIndex
+from checker.syntaxGate import SyntaxGate, SyntaxReport
+from error.errorManager import ErrorManager
+from extension.extensionFeatures import ExtensionFeatures, ExtensionProfile
+from parsing.declarationStream import DeclarationStream
+from syntax import syntaxTree
+from type.checkBudget import CheckBudget
+
+
+class PassManager:
+    _error_manager: ErrorManager
+    _syntax_checker: SyntaxChecker
+    _checkers: list[Checker]
+
+    def __init__(self, error_manager: ErrorManager, is_strict_extensions: bool = False, check_budget: CheckBudget | None = None):
+        self._error_manager = error_manager
+        self._syntax_checker = SyntaxChecker(error_manager, is_strict_extensions)
+        self._checkers = []
+        self._checkers.append(StructureChecker(error_manager))
+        self._checkers.append(TypeChecker(error_manager, check_budget))
+
+    def run(self, program: syntaxTree.Program) -> None:
+        declaration_index: DeclarationIndex = DeclarationIndex.build(program.decls)
+        self._syntax_checker.check(program, declaration_index)
+        if self._error_manager.errors:
+            return None
+        for checker in self._checkers:
+            checker.check(program, declaration_index)
+        return None
+
+    def run_stream(self, stream: DeclarationStream) -> None:
+        program: syntaxTree.Program = stream.read_header()
+        features: ExtensionFeatures = self._syntax_checker.get_features(program)
+        declaration_index: DeclarationIndex = DeclarationIndex()
+        report: SyntaxReport = SyntaxReport()
+        for decl in stream.iter_decls():
+            missing_extensions_count: int = len(report.missing_extensions)
+            SyntaxGate.scan_decls([decl], features, report)
+            if len(report.missing_extensions) > missing_extensions_count:
+                stream.retain()
+            declaration_index.add(decl).drop_body()
+        self._syntax_checker.check_report(report)
+        if self._error_manager.errors:
+            return None
+        for checker in self._checkers:
+            checker.check_stream(program, declaration_index, self._iter_checked_decls(stream, features.profile == ExtensionProfile.TYPE_RECONSTRUCTION))
+        return None
+
+    def _iter_checked_decls(self, stream: DeclarationStream, is_retained: bool) -> Iterator[syntaxTree.Decl]:
+        for decl in stream.iter_decls():
+            errors_count: int = len(self._error_manager.errors)
+            yield decl
+            if is_retained or len(self._error_manager.errors) > errors_count:
+                stream.retain()
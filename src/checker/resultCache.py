@@ -0,0 +1,182 @@
+import os
+import pickle
+
+from antlr4.Token import Token
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Final
+
+from antlr.stellaLexer import serializedATN as serialized_lexer_atn
+from error.error import Error
+from error.sourceSpan import SourceSpan
+from type.type import Type
+from utils.cacheDirectory import CacheDirectory
+from version import CHECKER_VERSION
+
+
+@dataclass(frozen = True, slots = True)
+class _TokenSpan:
+    start: int
+    stop: int | None
+
+
+class ResultCache:
+    __default_max_size: Final[int] = 64 * 1024 * 1024
+    __evict_interval: Final[int] = 64
+    __entry_suffix: Final[str] = '.result'
+    __source_suffix: Final[str] = '.source'
+    directory: Path
+    options: str
+    max_size: int
+    hits: int
+    misses: int
+    _stores: int
+    _cache_directory: CacheDirectory
+
+    def __init__(self, directory: str | Path, options: str = '', max_size: int = __default_max_size):
+        self._cache_directory = CacheDirectory(directory, self.get_version_key(), 'result')
+        self.directory = self._cache_directory.open()
+        self.options = options
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @classmethod
+    def get_version_key(cls) -> str:
+        version_hash = sha256(CHECKER_VERSION.encode())
+        version_hash.update(bytes(str(serialized_lexer_atn()), 'ascii'))
+        return version_hash.hexdigest()[:16]
+
+    def get_key(self, tokens: list[Token]) -> str:
+        token_hash = sha256(self.options.encode())
+        for token in tokens:
+            token_hash.update(f'\x1d{token.type}\x1f{token.text}'.encode())
+        return token_hash.hexdigest()
+
+    def get_source_key(self, source: str) -> str:
+        source_hash = sha256(self.options.encode())
+        source_hash.update(b'\x1d')
+        source_hash.update(source.encode())
+        return source_hash.hexdigest()
+
+    def load_source(self, source_key: str) -> tuple[list[Error], list[Error]] | None:
+        entry: tuple[int, list[Error], list[Error]] | None = self._read_entry(self._get_source_path(source_key))
+        if entry is None:
+            return None
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def load(self, key: str, tokens: list[Token]) -> tuple[list[Error], list[Error]] | None:
+        entry: tuple[int, list[Error], list[Error]] | None = self._read_entry(self._get_entry_path(key))
+        if entry is None or entry[0] != len(tokens):
+            self.misses += 1
+            return None
+        try:
+            result: tuple[list[Error], list[Error]] = [self._decode_error(error, tokens) for error in entry[1]], [self._decode_error(warning, tokens) for warning in entry[2]]
+        except IndexError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def store(self, key: str, tokens: list[Token], errors: list[Error], warnings: list[Error], source_key: str | None = None) -> None:
+        starts: dict[int, int] = {token.start: index for index, token in enumerate(tokens)}
+        stops: dict[int, int] = {token.stop: index for index, token in enumerate(tokens)}
+        try:
+            entry: tuple[int, list[Error], list[Error]] = len(tokens), [self._encode_error(error, starts, stops) for error in errors], [self._encode_error(warning, starts, stops) for warning in warnings]
+        except KeyError:
+            return None
+        self._write(self._get_entry_path(key), pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+        if source_key:
+            source_entry: tuple[int, list[Error], list[Error]] = len(tokens), [self._encode_error(error) for error in errors], [self._encode_error(warning) for warning in warnings]
+            self._write(self._get_source_path(source_key), pickle.dumps(source_entry, pickle.HIGHEST_PROTOCOL))
+        self._count_store()
+        return None
+
+    def clear(self) -> None:
+        for path in self._cache_directory.iter_entries():
+            path.unlink(missing_ok = True)
+
+    def _read_entry(self, path: Path) -> tuple[int, list[Error], list[Error]] | None:
+        try:
+            token_count, errors, warnings = pickle.loads(path.read_bytes())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, AttributeError, ValueError, TypeError, pickle.UnpicklingError):
+            path.unlink(missing_ok = True)
+            return None
+        return token_count, errors, warnings
+
+    def _write(self, path: Path, data: bytes) -> None:
+        try:
+            with NamedTemporaryFile(dir = self.directory, prefix = '.', delete = False) as file:
+                temporary_path: Path = Path(file.name)
+                file.write(data)
+            os.replace(temporary_path, path)
+        except FileNotFoundError:
+            self._cache_directory.create()
+        except OSError:
+            return None
+        return None
+
+    def _count_store(self) -> None:
+        if self._stores % self.__evict_interval == 0:
+            self._evict()
+        self._stores += 1
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._cache_directory.iter_entries():
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok = True)
+            total_size -= size
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.directory / f'{key}{self.__entry_suffix}'
+
+    def _get_source_path(self, source_key: str) -> Path:
+        return self.directory / f'{source_key}{self.__source_suffix}'
+
+    @classmethod
+    def _encode_error(cls, error: Error, starts: dict[int, int] | None = None, stops: dict[int, int] | None = None) -> Error:
+        args: list[object] = []
+        for arg in error.args:
+            match arg:
+                case SourceSpan() if starts is None:
+                    args.append(arg)
+                case SourceSpan():
+                    args.append(_TokenSpan(starts[arg.start], None if arg.stop < arg.start else stops[arg.stop]))
+                case Type():
+                    args.append(arg.name)
+                case _:
+                    args.append(str(arg))
+        return Error(error.error_kind, args)
+
+    @classmethod
+    def _decode_error(cls, error: Error, tokens: list[Token]) -> Error:
+        args: list[object] = []
+        for arg in error.args:
+            match arg:
+                case _TokenSpan():
+                    start: Token = tokens[arg.start]
+                    args.append(SourceSpan(start.start, start.start - 1 if arg.stop is None else tokens[arg.stop].stop, start.line, start.column))
+                case _:
+                    args.append(arg)
+        return Error(error.error_kind, args)
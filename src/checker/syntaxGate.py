@@ -0,0 +1,158 @@
+from typing import Final
+
+from extension.extensionFeatures import ExtensionFeatures
+from extension.extensionKind import ExtensionKind
+from syntax import syntaxTree
+
+
+class SyntaxReport:
+    missing_extensions: dict[tuple[ExtensionKind, ...], syntaxTree.Node]
+    unsupported_syntax: dict[str, int]
+
+    def __init__(self):
+        self.missing_extensions = {}
+        self.unsupported_syntax = {}
+
+    @property
+    def is_accepted(self) -> bool:
+        return not self.missing_extensions and not self.unsupported_syntax
+
+    def update(self, report: 'SyntaxReport') -> None:
+        for extensions, ctx in report.missing_extensions.items():
+            self.missing_extensions.setdefault(extensions, ctx)
+        for name, count in report.unsupported_syntax.items():
+            self.unsupported_syntax[name] = self.unsupported_syntax.get(name, 0) + count
+
+
+class SyntaxGate:
+    __required_extensions: Final[dict[type, tuple[ExtensionKind, ...]]] = {
+        syntaxTree.DeclFunGeneric: (ExtensionKind.UNIVERSAL_TYPES,),
+        syntaxTree.DeclExceptionType: (ExtensionKind.EXCEPTION_TYPE_DECLARATION,),
+        syntaxTree.DeclExceptionVariant: (ExtensionKind.OPEN_VARIANT_EXCEPTIONS,),
+        syntaxTree.Add: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.Subtract: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.Multiply: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.Divide: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.LessThan: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.LessThanOrEqual: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.GreaterThan: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.GreaterThanOrEqual: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.Equal: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.NotEqual: (ExtensionKind.ARITHMETIC_OPERATORS,),
+        syntaxTree.ConstUnit: (ExtensionKind.UNIT_TYPE, ExtensionKind.UNIT_TYPES),
+        syntaxTree.Sequence: (ExtensionKind.SEQUENCING,),
+        syntaxTree.TypeAsc: (ExtensionKind.TYPE_ASCRIPTIONS,),
+        syntaxTree.Let: (ExtensionKind.LET_BINDINGS, ExtensionKind.LET_MANY_BINDINGS, ExtensionKind.LET_PATTERNS),
+        syntaxTree.LetRec: (ExtensionKind.LETREC_BINDINGS, ExtensionKind.LETREC_MANY_BINDINGS),
+        syntaxTree.Tuple: (ExtensionKind.PAIRS, ExtensionKind.TUPLES),
+        syntaxTree.DotTuple: (ExtensionKind.PAIRS, ExtensionKind.TUPLES),
+        syntaxTree.Record: (ExtensionKind.RECORDS,),
+        syntaxTree.DotRecord: (ExtensionKind.RECORDS,),
+        syntaxTree.Inl: (ExtensionKind.SUM_TYPES,),
+        syntaxTree.Inr: (ExtensionKind.SUM_TYPES,),
+        syntaxTree.Variant: (ExtensionKind.VARIANTS,),
+        syntaxTree.Fix: (ExtensionKind.FIXPOINT_COMBINATOR,),
+        syntaxTree.List: (ExtensionKind.LISTS,),
+        syntaxTree.ConsList: (ExtensionKind.LISTS,),
+        syntaxTree.Head: (ExtensionKind.LISTS,),
+        syntaxTree.IsEmpty: (ExtensionKind.LISTS,),
+        syntaxTree.Tail: (ExtensionKind.LISTS,),
+        syntaxTree.Ref: (ExtensionKind.REFERENCES,),
+        syntaxTree.Deref: (ExtensionKind.REFERENCES,),
+        syntaxTree.Assign: (ExtensionKind.REFERENCES,),
+        syntaxTree.ConstMemory: (ExtensionKind.REFERENCES,),
+        syntaxTree.Panic: (ExtensionKind.PANIC,),
+        syntaxTree.Throw: (ExtensionKind.EXCEPTIONS,),
+        syntaxTree.TryWith: (ExtensionKind.EXCEPTIONS,),
+        syntaxTree.TryCatch: (ExtensionKind.EXCEPTIONS,),
+        syntaxTree.TypeCast: (ExtensionKind.TYPE_CAST,),
+        syntaxTree.TryCastAs: (ExtensionKind.TRY_CAST_AS,),
+        syntaxTree.TypeAbstraction: (ExtensionKind.UNIVERSAL_TYPES,),
+        syntaxTree.TypeApplication: (ExtensionKind.UNIVERSAL_TYPES,),
+        syntaxTree.PatternAsc: (ExtensionKind.PATTERN_ASCRIPTIONS,),
+        syntaxTree.PatternCastAs: (ExtensionKind.TYPE_CAST_PATTERNS,),
+        syntaxTree.PatternInl: (ExtensionKind.SUM_TYPES,),
+        syntaxTree.PatternInr: (ExtensionKind.SUM_TYPES,),
+        syntaxTree.PatternVariant: (ExtensionKind.VARIANTS,),
+        syntaxTree.PatternTuple: (ExtensionKind.PAIRS, ExtensionKind.TUPLES),
+        syntaxTree.PatternRecord: (ExtensionKind.RECORDS,),
+        syntaxTree.PatternList: (ExtensionKind.LISTS,),
+        syntaxTree.PatternCons: (ExtensionKind.LISTS,),
+        syntaxTree.PatternUnit: (ExtensionKind.UNIT_TYPE, ExtensionKind.UNIT_TYPES),
+        syntaxTree.TypeUnit: (ExtensionKind.UNIT_TYPE, ExtensionKind.UNIT_TYPES),
+        syntaxTree.TypeTuple: (ExtensionKind.PAIRS, ExtensionKind.TUPLES),
+        syntaxTree.TypeRecord: (ExtensionKind.RECORDS,),
+        syntaxTree.TypeSum: (ExtensionKind.SUM_TYPES,),
+        syntaxTree.TypeVariant: (ExtensionKind.VARIANTS,),
+        syntaxTree.TypeList: (ExtensionKind.LISTS,),
+        syntaxTree.TypeRef: (ExtensionKind.REFERENCES,),
+        syntaxTree.TypeTop: (ExtensionKind.TOP_TYPE,),
+        syntaxTree.TypeBottom: (ExtensionKind.BOTTOM_TYPE,),
+        syntaxTree.TypeAuto: (ExtensionKind.TYPE_RECONSTRUCTION,),
+        syntaxTree.TypeForAll: (ExtensionKind.UNIVERSAL_TYPES,)
+    }
+    __unsupported_syntax: Final[frozenset[type]] = frozenset({
+        syntaxTree.DeclTypeAlias,
+        syntaxTree.DeclExceptionVariant,
+        syntaxTree.Add,
+        syntaxTree.Subtract,
+        syntaxTree.Multiply,
+        syntaxTree.Divide,
+        syntaxTree.LogicAnd,
+        syntaxTree.LogicOr,
+        syntaxTree.LogicNot,
+        syntaxTree.LessThan,
+        syntaxTree.LessThanOrEqual,
+        syntaxTree.GreaterThan,
+        syntaxTree.GreaterThanOrEqual,
+        syntaxTree.Equal,
+        syntaxTree.NotEqual,
+        syntaxTree.LetRec,
+        syntaxTree.Fold,
+        syntaxTree.Unfold,
+        syntaxTree.TryCastAs,
+        syntaxTree.PatternCastAs,
+        syntaxTree.TypeRec
+    })
+
+    @classmethod
+    def scan(cls, program: syntaxTree.Program, features: ExtensionFeatures) -> SyntaxReport:
+        return cls.scan_decls(program.decls, features, SyntaxReport())
+
+    @classmethod
+    def scan_decls(cls, decls: list[syntaxTree.Decl], features: ExtensionFeatures, report: SyntaxReport) -> SyntaxReport:
+        stack: list[tuple[syntaxTree.Node, syntaxTree.Node | None]] = [(decl, None) for decl in reversed(decls) if decl]
+        while stack:
+            ctx, parent = stack.pop()
+            ctx_type: type = type(ctx)
+            required_extensions: tuple[ExtensionKind, ...] | None = cls.__required_extensions.get(ctx_type) or cls._get_arity_extensions(ctx, parent)
+            if required_extensions and required_extensions not in report.missing_extensions and not any(features.has(extension) for extension in required_extensions):
+                report.missing_extensions[required_extensions] = ctx
+            if ctx_type in cls.__unsupported_syntax:
+                report.unsupported_syntax[ctx_type.__name__] = report.unsupported_syntax.get(ctx_type.__name__, 0) + 1
+            stack.extend((child, ctx) for child in reversed(list(ctx.iter_children())))
+        return report
+
+    @classmethod
+    def _get_arity_extensions(cls, ctx: syntaxTree.Node, parent: syntaxTree.Node | None) -> tuple[ExtensionKind, ...] | None:
+        match ctx:
+            case syntaxTree.DeclFun():
+                if isinstance(parent, syntaxTree.DeclFun):
+                    return ExtensionKind.NESTED_FUNCTION_DECLARATIONS,
+                return cls._get_params_extensions(len(ctx.paramDecls))
+            case syntaxTree.Abstraction():
+                return cls._get_params_extensions(len(ctx.paramDecls))
+            case syntaxTree.ConstInt():
+                return (ExtensionKind.NATURAL_LITERALS,) if ctx.n != '0' else None
+            case _:
+                return None
+
+    @classmethod
+    def _get_params_extensions(cls, params_count: int) -> tuple[ExtensionKind, ...] | None:
+        match params_count:
+            case 0:
+                return ExtensionKind.NULLARY_FUNCTIONS,
+            case 1:
+                return None
+            case _:
+                return ExtensionKind.MULTIPARAMETER_FUNCTIONS,
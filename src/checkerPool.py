@@ -0,0 +1,194 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from io import StringIO
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Final, Self
+from weakref import WeakKeyDictionary
+
+from batch import BatchResult, BatchWorker
+from main import add_arguments
+
+
+class PoolWorker:
+    __stop_timeout: Final[float] = 5.0
+    process: BaseProcess
+    connection: Connection
+
+    def __init__(self, args: Namespace):
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context('spawn')
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target = run_pool_worker, args = (args, worker_connection), daemon = True)
+        self.process.start()
+        worker_connection.close()
+        self.connection.recv()
+
+    def check(self, name: str, source: str) -> BatchResult:
+        self.connection.send((name, source))
+        return self.connection.recv()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(self.__stop_timeout)
+        self.kill()
+
+    def kill(self, check: Future | None = None) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        if check is not None:
+            wait([check])
+        self.connection.close()
+
+
+class CheckerPool:
+    __start_attempts: Final[int] = 3
+    __retry_delay: Final[float] = 0.5
+    _default_pools: WeakKeyDictionary[asyncio.AbstractEventLoop, 'CheckerPool'] = WeakKeyDictionary()
+    args: Namespace
+    workers: int
+    timeout: float | None
+    _idle_workers: asyncio.Queue[PoolWorker | None]
+    _slots: asyncio.Queue[None]
+    _executor: ThreadPoolExecutor
+    _replacements: set[asyncio.Task]
+    _start_lock: asyncio.Lock
+    _is_started: bool
+    _is_closed: bool
+    _worker_count: int
+    _start_error: Exception | None
+
+    def __init__(self, args: Namespace | None = None, workers: int = 1, max_pending: int = 64, timeout: float | None = None):
+        self.args = args or add_arguments(ArgumentParser()).parse_args([])
+        self.workers = workers
+        self.timeout = timeout
+        self._idle_workers = asyncio.Queue()
+        self._slots = asyncio.Queue(max_pending)
+        self._executor = ThreadPoolExecutor(workers)
+        self._replacements = set()
+        self._start_lock = asyncio.Lock()
+        self._is_started = False
+        self._is_closed = False
+        self._worker_count = 0
+        self._start_error = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def pending_count(self) -> int:
+        return self._slots.qsize()
+
+    @classmethod
+    def get_default(cls) -> Self:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        checker_pool: Self | None = cls._default_pools.get(loop)
+        if checker_pool is None or checker_pool._is_closed:
+            checker_pool = cls._default_pools[loop] = cls(workers = os.cpu_count() or 1)
+        return checker_pool
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._is_started:
+                return None
+            for worker in await asyncio.gather(*(self._start_worker() for _ in range(self.workers))):
+                self._idle_workers.put_nowait(worker)
+            self._worker_count = self.workers
+            self._is_started = True
+        return None
+
+    async def check_source(self, text: str, *, name: str = '', timeout: float | None = None) -> BatchResult:
+        if self._is_closed:
+            raise RuntimeError('checker pool is closed')
+        timeout = self.timeout if timeout is None else timeout
+        await self._slots.put(None)
+        try:
+            await self.start()
+            worker: PoolWorker = await self._get_idle_worker()
+            check: Future = self._executor.submit(worker.check, name, text)
+            try:
+                result: BatchResult = await asyncio.wait_for(asyncio.wrap_future(check), timeout)
+            except TimeoutError:
+                self._replace_worker(worker, check)
+                return BatchResult(name, 'timeout', 1, None, f'check did not finish in {timeout} s\n')
+            except (EOFError, OSError):
+                self._replace_worker(worker, check)
+                return BatchResult(name, 'crash', 1, None, 'worker process terminated abruptly\n')
+            except asyncio.CancelledError:
+                self._replace_worker(worker, check)
+                raise
+            self._idle_workers.put_nowait(worker)
+            return result
+        finally:
+            self._slots.get_nowait()
+            self._slots.task_done()
+
+    async def close(self) -> None:
+        self._is_closed = True
+        await self._slots.join()
+        if self._replacements:
+            await asyncio.wait(self._replacements)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while not self._idle_workers.empty():
+            worker: PoolWorker | None = self._idle_workers.get_nowait()
+            if worker is not None:
+                await loop.run_in_executor(self._executor, worker.stop)
+        self._executor.shutdown()
+
+    async def _get_idle_worker(self) -> PoolWorker:
+        worker: PoolWorker | None = await self._idle_workers.get()
+        if worker is None:
+            self._idle_workers.put_nowait(None)
+            raise RuntimeError('checker pool has no workers left') from self._start_error
+        return worker
+
+    async def _start_worker(self) -> PoolWorker:
+        return await asyncio.get_running_loop().run_in_executor(None, PoolWorker, self.args)
+
+    def _replace_worker(self, worker: PoolWorker, check: Future) -> None:
+        replacement: asyncio.Task = asyncio.create_task(self._restart_worker(worker, check))
+        self._replacements.add(replacement)
+        replacement.add_done_callback(self._replacements.discard)
+
+    async def _restart_worker(self, worker: PoolWorker, check: Future) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, worker.kill, check)
+        for attempt in range(self.__start_attempts):
+            if attempt:
+                await asyncio.sleep(self.__retry_delay * attempt)
+            try:
+                self._idle_workers.put_nowait(await self._start_worker())
+                return None
+            except Exception as error:
+                self._start_error = error
+        self._worker_count -= 1
+        if not self._worker_count:
+            self._idle_workers.put_nowait(None)
+        return None
+
+
+async def check_source(text: str, *, timeout: float | None = None) -> BatchResult:
+    return await CheckerPool.get_default().check_source(text, timeout = timeout)
+
+def run_pool_worker(args: Namespace, connection: Connection) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    BatchWorker.initialize(args)
+    connection.send(True)
+    try:
+        while (request := connection.recv()) is not None:
+            name, source = request
+            connection.send(BatchWorker.check_input(name, StringIO(source)))
+    except EOFError:
+        pass
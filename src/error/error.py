@@ -1,8 +1,7 @@
-from antlr4 import ParserRuleContext
 from dataclasses import dataclass
 
-from antlr.stellaParser import stellaParser
 from error.errorKind import ErrorKind
+from error.sourceSpan import SourceSpan
 from type.type import Type
 
 
@@ -102,17 +101,23 @@ class Error:
                 return 'type variable {} is undefined'
             case ErrorKind.ERROR_AMBIGUOUS_PATTERN_TYPE:
                 return 'cam\'t infer the pattern {} type'
+            case ErrorKind.ERROR_MISSING_EXTENSION:
+                return 'extension {} is required for {}'
+            case ErrorKind.ERROR_UNSUPPORTED_SYNTAX:
+                return 'unsupported syntax for {}'
+            case ErrorKind.ERROR_INVALID_SYNTAX:
+                return 'invalid syntax at line {}, column {}: {}'
             case _:
                 return 'unknown error'
 
-    def _format(self, parser: stellaParser) -> str:
+    def _format(self, source: str) -> str:
         formatted: list[str] = []
         formatted.append(f'ERROR: {self.error_kind.name}')
         args: list[str] = []
         for arg in self.args:
             match arg:
-                case ParserRuleContext():
-                    args.append(parser.getTokenStream().getText(arg.start, arg.stop))
+                case SourceSpan():
+                    args.append(arg.get_text(source))
                 case Type():
                     args.append(arg.name)
                 case _:
@@ -121,8 +126,14 @@ class Error:
         return '\n'.join(formatted)
 
 
-def format_error(error: Error, parser: stellaParser) -> str:
-    return f'An error occurred during type checking!\n{error._format(parser)}'
+def format_error(error: Error, source: str) -> str:
+    return f'An error occurred during type checking!\n{error._format(source)}'
 
-def format_errors(errors: list[Error], parser: stellaParser) -> str:
-    return f'Errors occurred during type checking!{"".join([f"\n{error._format(parser)}" for error in errors])}'
+def format_warning(warning: Error, source: str) -> str:
+    return f'A warning occurred during type checking!\n{warning._format(source)}'
+
+def format_diagnostic(error: Error, source: str) -> str:
+    return error._format(source)
+
+def format_errors(errors: list[Error], source: str) -> str:
+    return f'Errors occurred during type checking!{"".join([f"\n{error._format(source)}" for error in errors])}'
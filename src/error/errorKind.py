@@ -46,3 +46,6 @@ class ErrorKind(Enum):
     ERROR_INCORRECT_NUMBER_OF_TYPE_ARGUMENTS = 42
     ERROR_UNDEFINED_TYPE_VARIABLE = 43
     ERROR_AMBIGUOUS_PATTERN_TYPE = 44
+    ERROR_MISSING_EXTENSION = 45
+    ERROR_UNSUPPORTED_SYNTAX = 46
+    ERROR_INVALID_SYNTAX = 47
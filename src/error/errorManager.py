@@ -1,12 +1,55 @@
+from typing import Callable
+
 from error.error import Error
 from error.errorKind import ErrorKind
+from syntax.syntaxTree import Node
+from type.type import Type
+
+
+class CheckCancelledError(Exception):
+    pass
 
 
 class ErrorManager:
     errors: list[Error]
+    warnings: list[Error]
+    is_recovery_mode: bool
+    max_errors: int | None
+    _error_keys: set[tuple[object, ...]]
+    _listeners: list[Callable[[Error], None]]
+
+    def __init__(self, is_recovery_mode: bool = False, max_errors: int | None = None):
+        self.errors = []
+        self.warnings = []
+        self.is_recovery_mode = is_recovery_mode
+        self.max_errors = max_errors
+        self._error_keys = set()
+        self._listeners = []
+
+    def add_listener(self, listener: Callable[[Error], None]) -> None:
+        self._listeners.append(listener)
 
-    def __init__(self):
+    def remove_listener(self, listener: Callable[[Error], None]) -> None:
+        self._listeners.remove(listener)
+
+    def clear(self) -> None:
         self.errors = []
+        self.warnings = []
+        self._error_keys = set()
 
     def register_error(self, error_kind: ErrorKind, *args: list[object]) -> None:
-        self.errors.append(Error(error_kind, args))
+        if any(isinstance(arg, Type) and arg.contains_error_type() for arg in args):
+            return None
+        args = tuple(arg.span if isinstance(arg, Node) else arg for arg in args)
+        if self.is_recovery_mode:
+            error_key: tuple[object, ...] = (error_kind, *(arg.name if isinstance(arg, Type) else arg for arg in args))
+            if error_key in self._error_keys or (self.max_errors is not None and len(self.errors) >= self.max_errors):
+                return None
+            self._error_keys.add(error_key)
+        error: Error = Error(error_kind, args)
+        self.errors.append(error)
+        for listener in self._listeners:
+            listener(error)
+
+    def register_warning(self, error_kind: ErrorKind, *args: list[object]) -> None:
+        self.warnings.append(Error(error_kind, tuple(arg.span if isinstance(arg, Node) else arg for arg in args)))
@@ -0,0 +1,19 @@
+from antlr4 import ParserRuleContext
+from dataclasses import dataclass
+from typing import Self
+
+
+@dataclass(frozen = True, slots = True)
+class SourceSpan:
+    start: int
+    stop: int
+    line: int
+    column: int
+
+    @classmethod
+    def from_context(cls, ctx: ParserRuleContext) -> Self:
+        stop: int = ctx.stop.stop if ctx.stop else ctx.start.start - 1
+        return cls(ctx.start.start, stop, ctx.start.line, ctx.start.column)
+
+    def get_text(self, source: str) -> str:
+        return source[self.start:self.stop + 1]
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Self
+
+from extension.extensionKind import ExtensionKind
+
+
+class ExtensionProfile(Enum):
+    SIMPLY_TYPED = 1
+    STRUCTURAL_SUBTYPING = 2
+    TYPE_RECONSTRUCTION = 3
+
+
+@dataclass(frozen = True, slots = True)
+class ExtensionFeatures:
+    mask: int
+    profile: ExtensionProfile
+    is_type_reconstruction: bool
+    is_structural_subtyping: bool
+    is_ambiguous_type_as_bottom: bool
+    is_universal_types: bool
+    is_inference_cacheable: bool
+
+    @classmethod
+    def compile(cls, extensions: set[ExtensionKind]) -> Self:
+        mask: int = 0
+        for extension in extensions:
+            mask |= 1 << extension.num
+        is_type_reconstruction: bool = ExtensionKind.TYPE_RECONSTRUCTION in extensions
+        is_structural_subtyping: bool = ExtensionKind.STRUCTURAL_SUBTYPING in extensions
+        is_universal_types: bool = ExtensionKind.UNIVERSAL_TYPES in extensions
+        if is_type_reconstruction:
+            profile: ExtensionProfile = ExtensionProfile.TYPE_RECONSTRUCTION
+        elif is_structural_subtyping:
+            profile: ExtensionProfile = ExtensionProfile.STRUCTURAL_SUBTYPING
+        else:
+            profile: ExtensionProfile = ExtensionProfile.SIMPLY_TYPED
+        return cls(mask, profile, is_type_reconstruction, is_structural_subtyping, ExtensionKind.AMBIGUOUS_TYPE_AS_BOTTOM in extensions, is_universal_types, not is_type_reconstruction and not is_universal_types)
+
+    def has(self, extension: ExtensionKind) -> bool:
+        return bool(self.mask & (1 << extension.num))
@@ -1,11 +1,20 @@
+from extension.extensionFeatures import ExtensionFeatures
 from extension.extensionKind import ExtensionKind
 
 
 class ExtensionManager:
     _extensions: set[ExtensionKind]
+    _features: ExtensionFeatures | None
 
     def __init__(self):
         self._extensions = set()
+        self._features = None
+
+    @property
+    def features(self) -> ExtensionFeatures:
+        if not self._features:
+            self._features = ExtensionFeatures.compile(self._extensions)
+        return self._features
 
     def is_predecessor(self) -> bool:
         return ExtensionKind.PREDECESSOR in self._extensions
@@ -127,3 +136,4 @@ class ExtensionManager:
     def register_extension(self, extension: ExtensionKind) -> None:
         if extension:
             self._extensions.add(extension)
+            self._features = None
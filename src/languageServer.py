@@ -0,0 +1,242 @@
+import json
+import queue
+import sys
+import time
+import traceback
+
+from argparse import ArgumentParser, Namespace
+from bisect import bisect_right
+from threading import Thread
+from typing import BinaryIO, Final
+
+from checker.documentChecker import Diagnostic, DocumentChecker
+
+
+class TextDocument:
+    uri: str
+    version: int | None
+    checker: DocumentChecker
+    is_utf16: bool
+    deadline: float | None
+    _line_starts: list[int] | None
+
+    def __init__(self, uri: str, version: int | None, text: str, is_strict_extensions: bool, is_utf16: bool):
+        self.uri = uri
+        self.version = version
+        self.checker = DocumentChecker(text, is_strict_extensions)
+        self.is_utf16 = is_utf16
+        self.deadline = None
+        self._line_starts = None
+
+    @property
+    def line_starts(self) -> list[int]:
+        if self._line_starts is None:
+            source: str = self.checker.source
+            self._line_starts = [0]
+            position: int = source.find('\n')
+            while position >= 0:
+                self._line_starts.append(position + 1)
+                position = source.find('\n', position + 1)
+        return self._line_starts
+
+    def apply_change(self, change: dict[str, object]) -> None:
+        if 'range' in change:
+            self.checker.edit(self.get_offset(change['range']['start']), self.get_offset(change['range']['end']), change['text'])
+        else:
+            self.checker.set_source(change['text'])
+        self._line_starts = None
+
+    def get_offset(self, position: dict[str, int]) -> int:
+        source: str = self.checker.source
+        if position['line'] >= len(self.line_starts):
+            return len(source)
+        line_start: int = self.line_starts[position['line']]
+        line_stop: int = self.line_starts[position['line'] + 1] - 1 if position['line'] + 1 < len(self.line_starts) else len(source)
+        if not self.is_utf16 or source.isascii():
+            return min(line_start + position['character'], line_stop)
+        units: int = 0
+        for offset in range(line_start, line_stop):
+            if units >= position['character']:
+                return offset
+            units += 2 if ord(source[offset]) > 0xFFFF else 1
+        return line_stop
+
+    def get_position(self, offset: int) -> dict[str, int]:
+        line: int = bisect_right(self.line_starts, offset) - 1
+        line_start: int = self.line_starts[line]
+        character: int = offset - line_start
+        if self.is_utf16:
+            character += sum(1 for char in self.checker.source[line_start:offset] if ord(char) > 0xFFFF)
+        return {'line': line, 'character': character}
+
+    def to_lsp(self, diagnostic: Diagnostic) -> dict[str, object]:
+        kind, _, message = diagnostic.message.partition('\n')
+        return {
+            'range': {'start': self.get_position(diagnostic.start), 'end': self.get_position(diagnostic.stop)},
+            'severity': 2 if diagnostic.is_warning else 1,
+            'code': kind.removeprefix('ERROR: '),
+            'source': 'stella',
+            'message': message or kind
+        }
+
+
+class LanguageServer:
+    __parse_error: Final[int] = -32700
+    __invalid_request: Final[int] = -32600
+    __method_not_found: Final[int] = -32601
+    __invalid_params: Final[int] = -32602
+    args: Namespace
+    output: BinaryIO
+    documents: dict[str, TextDocument]
+    is_shutdown: bool
+    is_utf16: bool
+    _messages: queue.Queue[object]
+
+    def __init__(self, args: Namespace, output: BinaryIO):
+        self.args = args
+        self.output = output
+        self.documents = {}
+        self.is_shutdown = False
+        self.is_utf16 = True
+        self._messages = queue.Queue()
+
+    def run(self, input: BinaryIO) -> int:
+        Thread(target = self._read_messages, args = (input,), daemon = True).start()
+        while True:
+            try:
+                message: dict[str, object] | None = self._messages.get(timeout = self._get_timeout())
+            except queue.Empty:
+                self._check_due_documents()
+                continue
+            if message is None:
+                return 1
+            if isinstance(message, ValueError):
+                self._send({'jsonrpc': '2.0', 'id': None, 'error': {'code': self.__parse_error, 'message': f'invalid message: {message}'}})
+                continue
+            if not isinstance(message, dict):
+                self._send({'jsonrpc': '2.0', 'id': None, 'error': {'code': self.__invalid_request, 'message': 'message is not an object'}})
+                continue
+            if message.get('method') == 'exit':
+                return 0 if self.is_shutdown else 1
+            self.handle_message(message)
+
+    def handle_message(self, message: dict[str, object]) -> None:
+        try:
+            self._dispatch(message)
+        except (AttributeError, IndexError, KeyError, TypeError) as error:
+            if 'id' in message and 'method' in message:
+                self._send({'jsonrpc': '2.0', 'id': message['id'], 'error': {'code': self.__invalid_params, 'message': f'invalid params of {message["method"]}: {error!r}'}})
+            else:
+                self._send({'jsonrpc': '2.0', 'method': 'window/logMessage', 'params': {'type': 1, 'message': f'ignored invalid {message.get("method")} notification: {error!r}'}})
+        return None
+
+    def _dispatch(self, message: dict[str, object]) -> None:
+        params: dict[str, object] = message.get('params') or {}
+        match message.get('method'):
+            case 'initialize':
+                position_encodings: list[str] = params.get('capabilities', {}).get('general', {}).get('positionEncodings', [])
+                self.is_utf16 = 'utf-32' not in position_encodings
+                self._respond(message, {
+                    'capabilities': {'positionEncoding': 'utf-16' if self.is_utf16 else 'utf-32', 'textDocumentSync': {'openClose': True, 'change': 2}},
+                    'serverInfo': {'name': 'stella-type-checker'}
+                })
+            case 'shutdown':
+                self.is_shutdown = True
+                self._respond(message, None)
+            case 'textDocument/didOpen':
+                text_document: dict[str, object] = params['textDocument']
+                document: TextDocument = TextDocument(text_document['uri'], text_document.get('version'), text_document['text'], self.args.require_extensions, self.is_utf16)
+                self.documents[document.uri] = document
+                self._publish(document)
+            case 'textDocument/didChange':
+                document = self.documents.get(params['textDocument']['uri'])
+                if document is None:
+                    return None
+                for change in params['contentChanges']:
+                    document.apply_change(change)
+                document.version = params['textDocument'].get('version')
+                document.deadline = time.monotonic() + self.args.debounce / 1000
+            case 'textDocument/didClose':
+                document = self.documents.pop(params['textDocument']['uri'], None)
+                if document is not None:
+                    self._send({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics', 'params': {'uri': document.uri, 'diagnostics': []}})
+            case _ if 'id' in message and 'method' in message:
+                self._send({'jsonrpc': '2.0', 'id': message['id'], 'error': {'code': self.__method_not_found, 'message': f'unsupported method {message["method"]}'}})
+            case _ if 'id' in message and 'result' not in message and 'error' not in message:
+                self._send({'jsonrpc': '2.0', 'id': message['id'], 'error': {'code': self.__invalid_request, 'message': 'missing method'}})
+        return None
+
+    def _get_timeout(self) -> float | None:
+        deadlines: list[float] = [document.deadline for document in self.documents.values() if document.deadline is not None]
+        return max(min(deadlines) - time.monotonic(), 0.0) if deadlines else None
+
+    def _check_due_documents(self) -> None:
+        now: float = time.monotonic()
+        for document in list(self.documents.values()):
+            if document.deadline is not None and document.deadline <= now:
+                self._publish(document)
+
+    def _publish(self, document: TextDocument) -> None:
+        document.deadline = None
+        try:
+            diagnostics: list[Diagnostic] = document.checker.check()
+        except Exception:
+            self._send({'jsonrpc': '2.0', 'method': 'window/logMessage', 'params': {'type': 1, 'message': f'checking {document.uri} failed\n{traceback.format_exc()}'}})
+            return None
+        self._send({'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics', 'params': {'uri': document.uri, 'version': document.version, 'diagnostics': [document.to_lsp(diagnostic) for diagnostic in diagnostics]}})
+        return None
+
+    def _read_messages(self, input: BinaryIO) -> None:
+        try:
+            while True:
+                try:
+                    message: object = read_message(input)
+                except ValueError as error:
+                    self._messages.put(error)
+                    continue
+                if message is None:
+                    return None
+                self._messages.put(message)
+                if isinstance(message, dict) and message.get('method') == 'exit':
+                    return None
+        finally:
+            self._messages.put(None)
+
+    def _respond(self, request: dict[str, object], result: object) -> None:
+        self._send({'jsonrpc': '2.0', 'id': request['id'], 'result': result})
+
+    def _send(self, message: dict[str, object]) -> None:
+        write_message(self.output, message)
+
+
+def read_message(input: BinaryIO) -> object:
+    content_length: int | None = None
+    while True:
+        line: bytes = input.readline()
+        if not line:
+            return None
+        if not line.strip():
+            break
+        name, _, value = line.decode('ascii').partition(':')
+        if name.strip().lower() == 'content-length':
+            content_length = int(value)
+    if content_length is None:
+        return None
+    return json.loads(input.read(content_length))
+
+def write_message(output: BinaryIO, message: dict[str, object]) -> None:
+    body: bytes = json.dumps(message, ensure_ascii = False).encode()
+    output.write(f'Content-Length: {len(body)}\r\n\r\n'.encode() + body)
+    output.flush()
+
+def parse_args() -> Namespace:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Stella language server over stdio publishing type checking diagnostics')
+    argument_parser.add_argument('--debounce', type = float, default = 20, help = 'milliseconds to wait after an edit before re-checking the document')
+    argument_parser.add_argument('--require-extensions', action = 'store_true', help = 'reject programs using syntax that is unsupported or not enabled by an extension')
+    return argument_parser.parse_args()
+
+def main() -> None:
+    sys.exit(LanguageServer(parse_args(), sys.stdout.buffer).run(sys.stdin.buffer))
+
+if __name__ == '__main__':
+    main()
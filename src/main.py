@@ -1,26 +1,66 @@
 import sys
 
-from antlr4 import CommonTokenStream
-from antlr4.InputStream import InputStream
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from pathlib import Path
 
-from antlr.stellaLexer import stellaLexer
-from antlr.stellaParser import stellaParser
-from checker.checkerManager import CheckerManager
-from error.error import Error, format_error
+from checkRunner import CheckRunner
+from utils.cacheDirectory import CacheDirectory, UnsafeCacheDirectoryError, UnsafeCacheFileError
+from watch import DirectoryWatcher
 
 
+def add_arguments(argument_parser: ArgumentParser) -> ArgumentParser:
+    argument_parser.add_argument('--all-errors', action = 'store_true', help = 'recover from type errors and report every independent error')
+    argument_parser.add_argument('--deadline', metavar = 'SECONDS', type = float, help = 'stop a check that runs longer than SECONDS')
+    argument_parser.add_argument('--check-jobs', type = int, default = 1, help = 'parse and check top-level declarations of large programs on N worker processes, 0 for one per CPU')
+    argument_parser.add_argument('--dfa-cache', metavar = 'FILE', type = get_cache_file, help = 'load the parser prediction cache from FILE at startup and store it back when it grows; FILE and its directory must be owned by the current user and not writable by other users')
+    argument_parser.add_argument('--function-cache', metavar = 'DIR', type = get_cache_directory, help = 'reuse type check results of functions whose text and referenced signatures are unchanged, stored in the private directory DIR')
+    argument_parser.add_argument('--max-constraints', type = int, help = 'stop a check after the type reconstruction solver has handled this many constraints')
+    argument_parser.add_argument('--max-errors', type = int, default = 100, help = 'maximum number of errors reported with --all-errors')
+    argument_parser.add_argument('--max-memory', metavar = 'MB', type = int, help = 'stop a check when the process uses more memory, or when the check allocates more with --trace-memory')
+    argument_parser.add_argument('--max-nodes', type = int, help = 'stop a check after type inference has visited this many expression nodes')
+    argument_parser.add_argument('--max-type-size', type = int, help = 'stop a check when an inferred or solved type has more components')
+    argument_parser.add_argument('--parallel-threshold', metavar = 'BYTES', type = int, default = 1 << 17, help = 'minimum program size checked on worker processes with --check-jobs')
+    argument_parser.add_argument('--parse-cache', metavar = 'DIR', type = get_cache_directory, help = 'reuse syntax trees of previously parsed programs stored in the private directory DIR')
+    argument_parser.add_argument('--result-cache', metavar = 'DIR', type = get_cache_directory, help = 'reuse check results of programs with the same token stream stored in the private directory DIR')
+    argument_parser.add_argument('--regex-lexer', action = 'store_true', help = 'tokenize with the regular expression lexer instead of the generated one')
+    argument_parser.add_argument('--require-extensions', action = 'store_true', help = 'reject programs using syntax that is unsupported or not enabled by an extension')
+    argument_parser.add_argument('--trace-memory', action = 'store_true', help = 'measure --max-memory with tracemalloc as memory allocated by the check instead of process memory')
+    argument_parser.add_argument('--stream', action = 'store_true', help = 'parse and check one top-level declaration at a time, keeping only function signatures in memory')
+    argument_parser.add_argument('--watch', metavar = 'DIR', type = Path, help = 'check every *.stella file in DIR and re-check files as they change')
+    argument_parser.add_argument('--watch-interval', metavar = 'SECONDS', type = float, default = 0.5, help = 'polling interval of --watch')
+    return argument_parser
+
+def get_cache_directory(value: str) -> str:
+    try:
+        CacheDirectory.check_private(Path(value))
+    except UnsafeCacheDirectoryError as unsafe_cache_directory_error:
+        raise ArgumentTypeError(str(unsafe_cache_directory_error))
+    return value
+
+def get_cache_file(value: str) -> str:
+    try:
+        CacheDirectory.check_private_file(Path(value))
+    except (UnsafeCacheDirectoryError, UnsafeCacheFileError) as unsafe_cache_error:
+        raise ArgumentTypeError(str(unsafe_cache_error))
+    return value
+
+def parse_args() -> Namespace:
+    return add_arguments(ArgumentParser(description = 'Stella type checker')).parse_args()
+
 def main() -> None:
-    input: str = sys.stdin.read()
-    lexer: stellaLexer = stellaLexer(InputStream(input))
-    stream: CommonTokenStream = CommonTokenStream(lexer)
-    parser: stellaParser = stellaParser(stream)
-    context: stellaParser.ProgramContext = parser.program()
-    checker_manager: CheckerManager = CheckerManager()
-    errors: list[Error] = checker_manager.check(context)
-    if errors:
-        sys.stderr.write(format_error(errors[0], parser))
-        sys.exit(-1)
-    sys.exit(0)
+    args: Namespace = parse_args()
+    check_runner: CheckRunner = CheckRunner(args)
+    try:
+        if args.watch:
+            DirectoryWatcher(args.watch, check_runner).watch(sys.stdout, args.watch_interval)
+            exit_code: int = 0
+        else:
+            exit_code = check_runner.run(sys.stdin, sys.stderr)
+    except KeyboardInterrupt:
+        exit_code = 0
+    finally:
+        check_runner.close()
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,194 @@
+from antlr4 import Token
+from bisect import bisect_right, insort
+from typing import Final, Iterator, TextIO
+
+from antlr.stellaLexer import stellaLexer
+from parsing.programParser import ParseError, ProgramParser, parse_decls
+from parsing.regexLexer import HIDDEN_TOKEN_TYPES, TokenBuffer, TokenBufferSource, iter_tokens
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_decl, lower_program
+
+
+class SourceText:
+    _offsets: list[int]
+    _texts: dict[int, str]
+
+    def __init__(self):
+        self._offsets = []
+        self._texts = {}
+
+    def add(self, offset: int, text: str) -> bool:
+        if offset in self._texts:
+            return False
+        insort(self._offsets, offset)
+        self._texts[offset] = text
+        return True
+
+    def remove(self, offset: int) -> None:
+        del self._texts[offset]
+        self._offsets.remove(offset)
+
+    def clear(self) -> None:
+        self._offsets.clear()
+        self._texts.clear()
+
+    def __getitem__(self, key: slice) -> str:
+        index: int = bisect_right(self._offsets, key.start) - 1
+        if index < 0:
+            return ''
+        offset: int = self._offsets[index]
+        return self._texts[offset][key.start - offset:key.stop - offset]
+
+
+class DeclarationStream:
+    __fn: Final[int] = stellaLexer.literalNames.index('\'fn\'')
+    __inline: Final[int] = stellaLexer.literalNames.index('\'inline\'')
+    __generic: Final[int] = stellaLexer.literalNames.index('\'generic\'')
+    __type: Final[int] = stellaLexer.literalNames.index('\'type\'')
+    __exception: Final[int] = stellaLexer.literalNames.index('\'exception\'')
+    __slash: Final[int] = stellaLexer.literalNames.index('\'/\'')
+    __star: Final[int] = stellaLexer.literalNames.index('\'*\'')
+    __opening_brackets: Final[frozenset[int]] = frozenset(stellaLexer.literalNames.index(f'\'{bracket}\'') for bracket in '([{')
+    __closing_brackets: Final[frozenset[int]] = frozenset(stellaLexer.literalNames.index(f'\'{bracket}\'') for bracket in ')]}')
+    file: TextIO
+    is_regex_lexer: bool
+    block_size: int
+    source: SourceText
+    _program: syntaxTree.Program | None
+    _is_retained: bool
+
+    def __init__(self, file: TextIO, is_regex_lexer: bool = False, block_size: int = 1 << 16):
+        self.file = file
+        self.is_regex_lexer = is_regex_lexer
+        self.block_size = block_size
+        self.source = SourceText()
+        self._program = None
+        self._is_retained = False
+
+    def read_header(self) -> syntaxTree.Program:
+        if not self._program:
+            offset, text, _ = next(self.iter_chunks())
+            self.source.add(offset, text)
+            try:
+                return lower_program(ProgramParser(text, is_regex_lexer = True).parse())
+            except ParseError:
+                self._parse_source()
+        return syntaxTree.Program(self._program.span, self._program.extensions, [])
+
+    def iter_decls(self) -> Iterator[syntaxTree.Decl]:
+        if self._program:
+            yield from self._program.decls
+            return None
+        chunks: Iterator[tuple[int, str, list[tuple[int, int, int, int, int]]]] = self.iter_chunks()
+        next(chunks)
+        for index, (offset, text, tokens) in enumerate(chunks):
+            self._is_retained = not self.source.add(offset, text)
+            decls: list[syntaxTree.Decl] | None = self.parse_chunk(offset, text, tokens)
+            if decls is None:
+                yield from self._parse_source().decls[index:]
+                return None
+            yield from decls
+            if not self._is_retained:
+                self.source.remove(offset)
+        return None
+
+    def retain(self) -> None:
+        self._is_retained = True
+
+    def iter_chunks(self) -> Iterator[tuple[int, str, list[tuple[int, int, int, int, int]]]]:
+        self.file.seek(0)
+        text: str = ''
+        offset: int = 0
+        tokens: list[tuple[int, int, int, int, int]] = []
+        position, line, line_start = 0, 1, 0
+        scanned: int = 0
+        depth: int = 0
+        previous_type: int = Token.INVALID_TYPE
+        function_index: int | None = None
+        is_eof: bool = False
+        while not is_eof:
+            block: str = self.file.read(self.block_size)
+            block += self.file.readline()
+            is_eof = not block
+            text += block
+            new_tokens: list[tuple[int, int, int, int, int]] = list(iter_tokens(text, position, line, line_start))
+            final_count: int = len(new_tokens) if is_eof else self._count_final_tokens(new_tokens)
+            tokens.extend(new_tokens[:final_count])
+            if final_count < len(new_tokens):
+                position, line, line_start = new_tokens[final_count][1], new_tokens[final_count][3], new_tokens[final_count][1] - new_tokens[final_count][4]
+            else:
+                position = len(text)
+            boundaries: list[int] = []
+            for index in range(scanned, len(tokens)):
+                token_type: int = tokens[index][0]
+                if token_type in HIDDEN_TOKEN_TYPES:
+                    continue
+                if function_index is not None and token_type == stellaLexer.StellaIdent:
+                    boundaries.append(function_index)
+                function_index = None
+                if depth == 0:
+                    match token_type:
+                        case self.__fn if previous_type not in (self.__inline, self.__generic):
+                            function_index = index
+                        case self.__inline if previous_type != self.__inline:
+                            boundaries.append(index)
+                        case self.__generic if previous_type != self.__inline:
+                            boundaries.append(index)
+                        case self.__type if previous_type != self.__exception:
+                            boundaries.append(index)
+                        case self.__exception:
+                            boundaries.append(index)
+                if token_type in self.__opening_brackets:
+                    depth += 1
+                elif token_type in self.__closing_brackets:
+                    depth = max(depth - 1, 0)
+                previous_type = token_type
+            scanned = len(tokens)
+            chunk_start: int = 0
+            for boundary in boundaries:
+                yield self._make_chunk(offset, text, tokens, chunk_start, boundary)
+                chunk_start = boundary
+            if chunk_start > 0:
+                cut: int = tokens[chunk_start][1]
+                text = text[cut:]
+                offset += cut
+                tokens = [(token_type, start - cut, stop - cut, token_line, column) for token_type, start, stop, token_line, column in tokens[chunk_start:]]
+                position -= cut
+                line_start -= cut
+                scanned -= chunk_start
+                function_index = None if function_index is None else function_index - chunk_start
+        yield self._make_chunk(offset, text, tokens, 0, len(tokens))
+
+    @classmethod
+    def parse_chunk(cls, offset: int, text: str, tokens: list[tuple[int, int, int, int, int]]) -> list[syntaxTree.Decl] | None:
+        chunk_source: SourceText = SourceText()
+        chunk_source.add(offset, text)
+        buffer: TokenBuffer = TokenBuffer(chunk_source)
+        for token_type, start, stop, line, column in tokens:
+            buffer.append(token_type, offset + start, offset + stop, line, column)
+        buffer.append(Token.EOF, offset + len(text), offset + len(text) - 1, *tokens[-1][3:])
+        region: tuple[list, list[Token]] | None = parse_decls(TokenBufferSource(buffer))
+        if region is None:
+            return None
+        return [lower_decl(decl) for decl in region[0]]
+
+    def _parse_source(self) -> syntaxTree.Program:
+        self.file.seek(0)
+        text: str = self.file.read()
+        self._program = lower_program(ProgramParser(text, self.is_regex_lexer).parse())
+        self.source.clear()
+        self.source.add(0, text)
+        return self._program
+
+    @classmethod
+    def _make_chunk(cls, offset: int, text: str, tokens: list[tuple[int, int, int, int, int]], start: int, stop: int) -> tuple[int, str, list[tuple[int, int, int, int, int]]]:
+        text_start: int = tokens[start][1] if start > 0 else 0
+        text_stop: int = tokens[stop][1] if stop < len(tokens) else len(text)
+        return offset + text_start, text[text_start:text_stop], [(token_type, start - text_start, stop - text_start, line, column) for token_type, start, stop, line, column in tokens[start:stop]]
+
+    @classmethod
+    def _count_final_tokens(cls, tokens: list[tuple[int, int, int, int, int]]) -> int:
+        for index in range(len(tokens) - 1):
+            if tokens[index][0] == cls.__slash and tokens[index + 1][0] == cls.__star and tokens[index + 1][1] == tokens[index][2] + 1:
+                return index
+        return max(len(tokens) - 1, 0)
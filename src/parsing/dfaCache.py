@@ -0,0 +1,158 @@
+import os
+import pickle
+
+from antlr4.PredictionContext import ArrayPredictionContext, PredictionContext, SingletonPredictionContext
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from hashlib import sha256
+from importlib.metadata import version
+from io import BufferedWriter
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from types import MethodType
+from typing import Final, Iterable
+
+from antlr.stellaLexer import serializedATN as serialized_lexer_atn, stellaLexer
+from antlr.stellaParser import serializedATN as serialized_parser_atn, stellaParser
+from parsing.programParser import ParseError, ProgramParser
+from utils.cacheDirectory import CacheDirectory
+from version import CHECKER_VERSION
+
+
+class _DfaPickler(pickle.Pickler):
+    __singletons: Final[dict[int, str]] = {
+        id(PredictionContext.EMPTY): 'empty_context',
+        id(SemanticContext.NONE): 'no_semantic_context',
+        id(ATNSimulator.ERROR): 'parser_error_state',
+        id(LexerATNSimulator.ERROR): 'lexer_error_state'
+    }
+
+    def __init__(self, file: BufferedWriter):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+
+    def persistent_id(self, obj: object) -> int | str | None:
+        if isinstance(obj, ATNState):
+            return -obj.stateNumber - 1 if obj.atn is stellaLexer.atn else obj.stateNumber
+        if isinstance(obj, MethodType) and obj == DfaCache.make_config_set:
+            return 'make_config_set'
+        return self.__singletons.get(id(obj))
+
+    def reducer_override(self, obj: object) -> tuple[object, tuple[object, ...]]:
+        match obj:
+            case ArrayPredictionContext():
+                return ArrayPredictionContext, (obj.parents, obj.returnStates)
+            case SingletonPredictionContext():
+                return SingletonPredictionContext, (obj.parentCtx, obj.returnState)
+            case LexerActionExecutor():
+                return LexerActionExecutor, (obj.lexerActions,)
+            case ATNConfigSet():
+                return DfaCache.make_config_set, (obj.configs, obj.fullCtx, obj.uniqueAlt, obj.conflictingAlts, obj.hasSemanticContext, obj.dipsIntoOuterContext)
+            case _:
+                return NotImplemented
+
+
+class _DfaUnpickler(pickle.Unpickler):
+    __singletons: Final[dict[str, object]] = {
+        'empty_context': PredictionContext.EMPTY,
+        'no_semantic_context': SemanticContext.NONE,
+        'parser_error_state': ATNSimulator.ERROR,
+        'lexer_error_state': LexerATNSimulator.ERROR
+    }
+
+    def find_class(self, module_name: str, name: str) -> type:
+        if module_name.startswith('antlr4.') and '.' not in name:
+            found: object = super().find_class(module_name, name)
+            if isinstance(found, type):
+                return found
+        raise pickle.UnpicklingError(f'forbidden global {module_name}.{name}')
+
+    def persistent_load(self, pid: int | str) -> object:
+        if isinstance(pid, int):
+            return stellaParser.atn.states[pid] if pid >= 0 else stellaLexer.atn.states[-pid - 1]
+        if pid == 'make_config_set':
+            return DfaCache.make_config_set
+        if pid not in self.__singletons:
+            raise pickle.UnpicklingError(f'unknown persistent id {pid}')
+        return self.__singletons[pid]
+
+
+class DfaCache:
+    path: Path
+    loaded_states: int
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.loaded_states = 0
+
+    @classmethod
+    def get_version_key(cls) -> str:
+        version_hash = sha256(CHECKER_VERSION.encode())
+        version_hash.update(version('antlr4-python3-runtime').encode())
+        version_hash.update(bytes(str(serialized_lexer_atn()), 'ascii'))
+        version_hash.update(bytes(str(serialized_parser_atn()), 'ascii'))
+        return version_hash.hexdigest()[:16]
+
+    @classmethod
+    def get_state_count(cls) -> int:
+        return sum(len(dfa.states) for dfa in stellaLexer.decisionsToDFA + stellaParser.decisionsToDFA)
+
+    @classmethod
+    def warm_up(cls, sources: Iterable[str], is_regex_lexer: bool = False) -> None:
+        for source in sources:
+            try:
+                ProgramParser(source, is_regex_lexer).parse()
+            except ParseError:
+                continue
+
+    @classmethod
+    def make_config_set(cls, configs: list, full_ctx: bool, unique_alt: int, conflicting_alts: set[int] | None, has_semantic_context: bool, dips_into_outer_context: bool) -> ATNConfigSet:
+        config_set: ATNConfigSet = ATNConfigSet(full_ctx)
+        config_set.configs = configs
+        config_set.uniqueAlt = unique_alt
+        config_set.conflictingAlts = conflicting_alts
+        config_set.hasSemanticContext = has_semantic_context
+        config_set.dipsIntoOuterContext = dips_into_outer_context
+        config_set.readonly = True
+        config_set.configLookup = None
+        return config_set
+
+    def load(self) -> bool:
+        CacheDirectory.check_private_file(self.path)
+        try:
+            with self.path.open('rb') as file:
+                if _DfaUnpickler(file).load() != self.get_version_key():
+                    return False
+                lexer_dfas, parser_dfas = _DfaUnpickler(file).load()
+        except (OSError, EOFError, AttributeError, ImportError, IndexError, ValueError, TypeError, RecursionError, pickle.UnpicklingError):
+            return False
+        if len(lexer_dfas) != len(stellaLexer.decisionsToDFA) or len(parser_dfas) != len(stellaParser.decisionsToDFA):
+            return False
+        stellaLexer.decisionsToDFA[:] = lexer_dfas
+        stellaParser.decisionsToDFA[:] = parser_dfas
+        self.loaded_states = self.get_state_count()
+        return True
+
+    def save(self) -> bool:
+        lexer_dfas: list[DFA] = stellaLexer.decisionsToDFA
+        parser_dfas: list[DFA] = stellaParser.decisionsToDFA
+        try:
+            self.path.parent.mkdir(0o700, parents = True, exist_ok = True)
+            with NamedTemporaryFile(dir = self.path.parent, prefix = '.', delete = False) as file:
+                temporary_path: Path = Path(file.name)
+                try:
+                    pickle.dump(self.get_version_key(), file, pickle.HIGHEST_PROTOCOL)
+                    _DfaPickler(file).dump((lexer_dfas, parser_dfas))
+                except (RecursionError, pickle.PicklingError):
+                    file.close()
+                    temporary_path.unlink(missing_ok = True)
+                    return False
+            os.replace(temporary_path, self.path)
+        except OSError:
+            return False
+        self.loaded_states = self.get_state_count()
+        return True
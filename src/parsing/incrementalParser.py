@@ -0,0 +1,149 @@
+from antlr4 import Token
+from array import array
+from bisect import bisect_left, bisect_right
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from parsing.programParser import ProgramParser, parse_decls
+from parsing.regexLexer import HIDDEN_TOKEN_TYPES, TokenBuffer, TokenBufferSource, iter_tokens
+
+
+class _Shift:
+    delta: int
+    line_delta: int
+    column_delta: int
+    line: int
+
+    def __init__(self, old_source: str, new_source: str, start: int, stop: int, text: str):
+        new_stop: int = start + len(text)
+        self.delta = len(text) - (stop - start)
+        self.line_delta = text.count('\n') - old_source.count('\n', start, stop)
+        self.column_delta = (new_stop - new_source.rfind('\n', 0, new_stop) - 1) - (stop - old_source.rfind('\n', 0, stop) - 1)
+        self.line = old_source.count('\n', 0, stop) + 1
+
+    def shift_tokens(self, tokens: list[Token]) -> None:
+        delta, line_delta = self.delta, self.line_delta
+        for token in tokens:
+            if token.line == self.line:
+                token.column += self.column_delta
+            token.start += delta
+            token.stop += delta
+            token.line += line_delta
+
+    def shift_buffer(self, buffer: TokenBuffer, start: int, new_buffer: TokenBuffer) -> None:
+        delta, line_delta = self.delta, self.line_delta
+        new_buffer.types.extend(buffer.types[start:])
+        new_buffer.starts.extend(array('i', [value + delta for value in buffer.starts[start:]]) if delta else buffer.starts[start:])
+        new_buffer.stops.extend(array('i', [value + delta for value in buffer.stops[start:]]) if delta else buffer.stops[start:])
+        new_buffer.lines.extend(array('i', [value + line_delta for value in buffer.lines[start:]]) if line_delta else buffer.lines[start:])
+        column_start: int = len(new_buffer.columns)
+        new_buffer.columns.extend(buffer.columns[start:])
+        for index in range(start, len(buffer)):
+            if buffer.lines[index] != self.line:
+                break
+            new_buffer.columns[column_start + index - start] += self.column_delta
+
+
+class IncrementalParser:
+    source: str
+    buffer: TokenBuffer
+    tokens: list[Token]
+    program_context: stellaParser.ProgramContext | None
+    reparsed_decls: int
+
+    def __init__(self, source: str):
+        self.source = source
+        self.buffer = TokenBuffer(source)
+        self.tokens = []
+        self.program_context = None
+        self.reparsed_decls = 0
+
+    def parse(self) -> stellaParser.ProgramContext:
+        program_parser: ProgramParser = ProgramParser(self.source, is_regex_lexer = True)
+        self.buffer = program_parser.lexer.buffer
+        self.tokens = program_parser.get_tokens()
+        self.program_context = None
+        self.program_context = program_parser.parse()
+        self.reparsed_decls = len(self.program_context.decls)
+        return self.program_context
+
+    def edit(self, start: int, stop: int, text: str) -> stellaParser.ProgramContext:
+        old_source: str = self.source
+        self.source = old_source[:start] + text + old_source[stop:]
+        if self.program_context is None:
+            return self.parse()
+        shift: _Shift = _Shift(old_source, self.source, start, stop, text)
+        restart, resync, relexed_tokens = self._relex(start, text, shift)
+        first: int = bisect_left(self.tokens, restart, key = lambda token: token.start)
+        last: int = bisect_left(self.tokens, resync, key = lambda token: token.start)
+        if first == last and not relexed_tokens:
+            shift.shift_tokens(self.tokens[first:])
+            self.reparsed_decls = 0
+            return self.program_context
+        decls: list[stellaParser.DeclContext] = self.program_context.decls
+        if not decls or first < decls[0].start.tokenIndex:
+            return self.parse()
+        first_decl: int = next(index for index, decl in enumerate(decls) if decl.stop.tokenIndex >= first - 1)
+        last_decl: int = max((index for index, decl in enumerate(decls) if decl.start.tokenIndex < last), default = first_decl)
+        region_start: int = decls[first_decl].start.tokenIndex
+        region_stop: int = decls[last_decl].stop.tokenIndex + 1
+        buffer_start: int = bisect_left(self.buffer.starts, min(self.tokens[region_start].start, restart))
+        buffer_stop: int = bisect_left(self.buffer.starts, self.tokens[region_stop].start + shift.delta)
+        region: tuple[list[stellaParser.DeclContext], list[Token]] | None = parse_decls(TokenBufferSource(self.buffer, buffer_start, buffer_stop))
+        if region is None:
+            return self.parse()
+        region_decls, region_tokens = region
+        for decl in region_decls:
+            decl.parentCtx = self.program_context
+            decl.invokingState = decls[first_decl].invokingState
+        shift.shift_tokens(self.tokens[region_stop:])
+        self.tokens[region_start:region_stop] = region_tokens
+        for index in range(region_start, len(self.tokens)):
+            self.tokens[index].tokenIndex = index
+        children: list = self.program_context.children
+        child_start: int = next(index for index, child in enumerate(children) if child is decls[first_decl])
+        children[child_start:child_start + last_decl - first_decl + 1] = region_decls
+        decls[first_decl:last_decl + 1] = region_decls
+        self.program_context.stop = self.tokens[-2]
+        self.reparsed_decls = len(region_decls)
+        return self.program_context
+
+    def _relex(self, start: int, text: str, shift: _Shift) -> tuple[int, int, bool]:
+        buffer: TokenBuffer = self.buffer
+        index: int = max(bisect_right(buffer.starts, start - 1) - 1, 0)
+        while index > 0 and buffer.types[index] not in HIDDEN_TOKEN_TYPES and buffer.types[index - 1] not in HIDDEN_TOKEN_TYPES:
+            index -= 1
+        if self._has_open_comment(index):
+            index = 0
+        position: int = buffer.starts[index]
+        new_stop: int = start + len(text)
+        relexed: list[tuple[int, int, int, int, int]] = []
+        resync: int = len(buffer) - 1
+        for token in iter_tokens(self.source, position, buffer.lines[index], position - buffer.columns[index]):
+            if token[1] >= new_stop:
+                old_index: int = bisect_left(buffer.starts, token[1] - shift.delta, index)
+                if buffer.starts[old_index] == token[1] - shift.delta:
+                    resync = old_index
+                    break
+            relexed.append(token)
+        new_buffer: TokenBuffer = TokenBuffer(self.source)
+        for field, values in zip(('types', 'starts', 'stops', 'lines', 'columns'), zip(*relexed) if relexed else ((), (), (), (), ())):
+            setattr(new_buffer, field, getattr(buffer, field)[:index] + array('i', values))
+        shift.shift_buffer(buffer, resync, new_buffer)
+        self.buffer = new_buffer
+        return position, buffer.starts[resync], any(token[0] not in HIDDEN_TOKEN_TYPES for token in relexed)
+
+    def _has_open_comment(self, index: int) -> bool:
+        buffer: TokenBuffer = self.buffer
+        slash: int = stellaLexer.Surrogate_id_SYMB_24
+        if slash not in buffer.types:
+            return False
+        slash_index: int = buffer.types.index(slash)
+        while slash_index < index:
+            if buffer.types[slash_index + 1] in (slash, stellaLexer.Surrogate_id_SYMB_23) and buffer.starts[slash_index + 1] == buffer.stops[slash_index] + 1:
+                return True
+            try:
+                slash_index = buffer.types.index(slash, slash_index + 1)
+            except ValueError:
+                return False
+        return False
@@ -0,0 +1,188 @@
+import os
+import pickle
+
+from antlr4.Parser import Parser
+from antlr4.Token import CommonToken, Token
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Final
+
+from antlr.stellaLexer import serializedATN as serialized_lexer_atn
+from antlr.stellaParser import serializedATN as serialized_parser_atn, stellaParser
+from parsing.programParser import ProgramParser
+from utils.cacheDirectory import CacheDirectory
+from version import CHECKER_VERSION
+
+
+class _TreePickler(pickle.Pickler):
+    _token_indices: dict[Token, int]
+
+    def __init__(self, file: BytesIO, token_indices: dict[Token, int]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._token_indices = token_indices
+
+    def persistent_id(self, obj: object) -> int | None:
+        if isinstance(obj, Token):
+            return self._token_indices[obj]
+        if isinstance(obj, Parser):
+            return -1
+        return None
+
+
+class _TreeUnpickler(pickle.Unpickler):
+    _tokens: list[Token]
+
+    def __init__(self, file: BytesIO, tokens: list[Token]):
+        super().__init__(file)
+        self._tokens = tokens
+
+    def persistent_load(self, pid: int) -> Token | None:
+        return self._tokens[pid] if pid >= 0 else None
+
+
+class ParseCache:
+    __default_max_size: Final[int] = 64 * 1024 * 1024
+    __evict_interval: Final[int] = 64
+    __entry_suffix: Final[str] = '.tree'
+    __alias_suffix: Final[str] = '.alias'
+    directory: Path
+    max_size: int
+    is_regex_lexer: bool
+    hits: int
+    misses: int
+    _stores: int
+    _cache_directory: CacheDirectory
+
+    def __init__(self, directory: str | Path, max_size: int = __default_max_size, is_regex_lexer: bool = False):
+        self._cache_directory = CacheDirectory(directory, self.get_version_key(), 'parse')
+        self.directory = self._cache_directory.open()
+        self.max_size = max_size
+        self.is_regex_lexer = is_regex_lexer
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @classmethod
+    def get_version_key(cls) -> str:
+        version_hash = sha256(CHECKER_VERSION.encode())
+        version_hash.update(bytes(str(serialized_lexer_atn()), 'ascii'))
+        version_hash.update(bytes(str(serialized_parser_atn()), 'ascii'))
+        return version_hash.hexdigest()[:16]
+
+    @classmethod
+    def get_token_key(cls, tokens: list[Token]) -> str:
+        token_hash = sha256()
+        for token in tokens:
+            token_hash.update(f'{token.type}\x1f{token.text}\x1e'.encode())
+        return token_hash.hexdigest()
+
+    def parse(self, source: str) -> stellaParser.ProgramContext:
+        source_key: str = sha256(source.encode()).hexdigest()
+        program_context: stellaParser.ProgramContext | None = self._load_alias(source_key)
+        if program_context:
+            self.hits += 1
+            return program_context
+        program_parser: ProgramParser = ProgramParser(source, self.is_regex_lexer)
+        tokens: list[Token] = program_parser.get_tokens()
+        token_key: str = self.get_token_key(tokens)
+        program_context = self._load_entry(token_key, tokens) if not program_parser.errors else None
+        if program_context:
+            self.hits += 1
+            self._write(self._get_alias_path(source_key), token_key.encode())
+            return program_context
+        self.misses += 1
+        program_context = program_parser.parse()
+        self._store(source_key, token_key, tokens, program_context)
+        return program_context
+
+    def clear(self) -> None:
+        for path in self._cache_directory.iter_entries():
+            path.unlink(missing_ok = True)
+
+    def _load_alias(self, source_key: str) -> stellaParser.ProgramContext | None:
+        try:
+            token_key: str = self._get_alias_path(source_key).read_text()
+        except OSError:
+            return None
+        return self._load_entry(token_key, None)
+
+    def _load_entry(self, token_key: str, tokens: list[Token] | None) -> stellaParser.ProgramContext | None:
+        entry_path: Path = self._get_entry_path(token_key)
+        try:
+            token_rows, tree = pickle.loads(entry_path.read_bytes())
+            if tokens is None:
+                tokens = [self._make_token(*token_row) for token_row in token_rows]
+            program_context: stellaParser.ProgramContext = _TreeUnpickler(BytesIO(tree), tokens).load()
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, IndexError, ValueError, TypeError, pickle.UnpicklingError):
+            entry_path.unlink(missing_ok = True)
+            return None
+        return program_context
+
+    def _store(self, source_key: str, token_key: str, tokens: list[Token], program_context: stellaParser.ProgramContext) -> None:
+        tree: BytesIO = BytesIO()
+        try:
+            _TreePickler(tree, {token: index for index, token in enumerate(tokens)}).dump(program_context)
+        except (KeyError, RecursionError, pickle.PicklingError):
+            return None
+        token_rows: list[tuple[object, ...]] = [(token.type, token.text, token.start, token.stop, token.line, token.column, token.tokenIndex) for token in tokens]
+        self._write(self._get_entry_path(token_key), pickle.dumps((token_rows, tree.getvalue()), pickle.HIGHEST_PROTOCOL))
+        self._write(self._get_alias_path(source_key), token_key.encode())
+        self._count_store()
+        return None
+
+    def _write(self, path: Path, data: bytes) -> None:
+        try:
+            with NamedTemporaryFile(dir = self.directory, prefix = '.', delete = False) as file:
+                temporary_path: Path = Path(file.name)
+                file.write(data)
+            os.replace(temporary_path, path)
+        except FileNotFoundError:
+            self._cache_directory.create()
+        except OSError:
+            return None
+        return None
+
+    def _count_store(self) -> None:
+        if self._stores % self.__evict_interval == 0:
+            self._evict()
+        self._stores += 1
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._cache_directory.iter_entries():
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok = True)
+            total_size -= size
+
+    def _get_entry_path(self, token_key: str) -> Path:
+        return self.directory / f'{token_key}{self.__entry_suffix}'
+
+    def _get_alias_path(self, source_key: str) -> Path:
+        return self.directory / f'{source_key}{self.__alias_suffix}'
+
+    @classmethod
+    def _make_token(cls, type: int, text: str, start: int, stop: int, line: int, column: int, token_index: int) -> CommonToken:
+        token: CommonToken = CommonToken(CommonToken.EMPTY_SOURCE, type, Token.DEFAULT_CHANNEL, start, stop)
+        token.text = text
+        token.line = line
+        token.column = column
+        token.tokenIndex = token_index
+        return token
@@ -0,0 +1,111 @@
+from antlr4 import CommonTokenStream
+from antlr4.InputStream import InputStream
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import Token
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException, RecognitionException
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from error.error import Error
+from error.errorKind import ErrorKind
+from parsing.regexLexer import TokenBufferSource, tokenize
+
+
+class ParseError(Exception):
+    errors: list[Error]
+
+    def __init__(self, errors: list[Error]):
+        super().__init__(f'{len(errors)} syntax errors')
+        self.errors = errors
+
+
+class _SyntaxErrorListener(ErrorListener):
+    errors: list[Error]
+
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer: Recognizer, offendingSymbol: Token | None, line: int, column: int, msg: str, e: RecognitionException | None) -> None:
+        self.errors.append(Error(ErrorKind.ERROR_INVALID_SYNTAX, [line, column + 1, msg]))
+
+
+class ProgramParser:
+    lexer: stellaLexer | TokenBufferSource
+    stream: CommonTokenStream
+    parser: stellaParser
+    is_sll_parsed: bool
+    _error_listener: _SyntaxErrorListener
+
+    def __init__(self, source: str, is_regex_lexer: bool = False):
+        self._error_listener = _SyntaxErrorListener()
+        if is_regex_lexer:
+            self.lexer = TokenBufferSource(tokenize(source))
+        else:
+            self.lexer = stellaLexer(InputStream(source))
+            self.lexer.removeErrorListeners()
+            self.lexer.addErrorListener(self._error_listener)
+        self.stream = CommonTokenStream(self.lexer)
+        self.parser = stellaParser(self.stream)
+        self.parser.removeErrorListeners()
+        self.is_sll_parsed = False
+
+    def set_source(self, source: str) -> None:
+        if isinstance(self.lexer, TokenBufferSource):
+            self.lexer = TokenBufferSource(tokenize(source))
+        else:
+            self.lexer.inputStream = InputStream(source)
+        self.stream.setTokenSource(self.lexer)
+        self.parser.setTokenStream(self.stream)
+        self._error_listener.errors.clear()
+        self.is_sll_parsed = False
+
+    @property
+    def errors(self) -> list[Error]:
+        return sorted(self._error_listener.errors, key = lambda error: (error.args[0], error.args[1]))
+
+    def get_tokens(self) -> list[Token]:
+        self.stream.fill()
+        return [token for token in self.stream.tokens if token.channel == Token.DEFAULT_CHANNEL]
+
+    def parse(self) -> stellaParser.ProgramContext:
+        self.parser._interp.predictionMode = PredictionMode.SLL
+        self.parser._errHandler = BailErrorStrategy()
+        try:
+            program_context: stellaParser.ProgramContext = self.parser.start_Program().x
+            self.is_sll_parsed = True
+        except ParseCancellationException:
+            self.stream.seek(0)
+            self.parser.reset()
+            self.parser._interp.predictionMode = PredictionMode.LL
+            self.parser._errHandler = DefaultErrorStrategy()
+            self.parser.addErrorListener(self._error_listener)
+            program_context = self.parser.start_Program().x
+            self.parser.removeErrorListeners()
+        errors: list[Error] = self.errors
+        if errors:
+            raise ParseError(errors)
+        return program_context
+
+
+def parse_program(source: str, is_regex_lexer: bool = False) -> stellaParser.ProgramContext:
+    return ProgramParser(source, is_regex_lexer).parse()
+
+def parse_decls(token_source: TokenBufferSource) -> tuple[list[stellaParser.DeclContext], list[Token]] | None:
+    stream: CommonTokenStream = CommonTokenStream(token_source)
+    parser: stellaParser = stellaParser(stream)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    for prediction_mode in (PredictionMode.SLL, PredictionMode.LL):
+        parser.reset()
+        parser._interp.predictionMode = prediction_mode
+        decls: list[stellaParser.DeclContext] = []
+        try:
+            while stream.LA(1) != Token.EOF:
+                decls.append(parser.decl())
+        except ParseCancellationException:
+            continue
+        return decls, stream.tokens[:-1]
+    return None
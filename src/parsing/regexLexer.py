@@ -0,0 +1,137 @@
+import re
+
+from antlr4 import Token
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken
+from array import array
+from typing import Final, Iterator
+
+from antlr.stellaLexer import stellaLexer
+
+
+HIDDEN_TOKEN_TYPES: Final[frozenset[int]] = frozenset({stellaLexer.WS, stellaLexer.COMMENT_antlr_builtin, stellaLexer.MULTICOMMENT_antlr_builtin})
+
+__letter: Final[str] = 'A-Za-z\u00C0-\u00D6\u00D8-\u00DE\u00DF-\u00F6\u00F8-\u00FF'
+__literal_types: Final[dict[str, int]] = {literal_name[1:-1].encode().decode('unicode_escape'): token_type for token_type, literal_name in enumerate(stellaLexer.literalNames) if literal_name.startswith('\'')}
+__identifier: Final[re.Pattern[str]] = re.compile(f'[_{__letter}][!\\-:?_0-9{__letter}]*')
+__group_types: Final[dict[str, int]] = {
+    'WS': stellaLexer.WS,
+    'COMMENT': stellaLexer.COMMENT_antlr_builtin,
+    'MULTICOMMENT': stellaLexer.MULTICOMMENT_antlr_builtin,
+    'ExtensionName': stellaLexer.ExtensionName,
+    'MemoryAddress': stellaLexer.MemoryAddress,
+    'INTEGER': stellaLexer.INTEGER,
+    'ErrorToken': stellaLexer.ErrorToken
+}
+__pattern: Final[re.Pattern[str]] = re.compile('|'.join([
+    '(?P<WS>[ \\r\\t\\n\\f]+)',
+    '(?P<COMMENT>//[^\\r\\n]*(?:\\r?\\n|\\Z))',
+    '(?P<MULTICOMMENT>/\\*[\\s\\S]*?\\*/)',
+    f'(?P<StellaIdent>{__identifier.pattern})',
+    f'(?P<ExtensionName>#[\\-_0-9{__letter}]+)',
+    '(?P<MemoryAddress><0x[0-9A-Fa-f]+>)',
+    '(?P<INTEGER>[0-9]+)',
+    f'(?P<Literal>{"|".join(re.escape(literal) for literal in sorted(__literal_types, key = len, reverse = True) if not __identifier.fullmatch(literal))})',
+    '(?P<ErrorToken>[\\s\\S])'
+]))
+
+
+class TokenBuffer:
+    source: str
+    types: array
+    starts: array
+    stops: array
+    lines: array
+    columns: array
+
+    def __init__(self, source: str):
+        self.source = source
+        self.types = array('i')
+        self.starts = array('i')
+        self.stops = array('i')
+        self.lines = array('i')
+        self.columns = array('i')
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append(self, token_type: int, start: int, stop: int, line: int, column: int) -> None:
+        self.types.append(token_type)
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def get_text(self, index: int) -> str:
+        return self.source[self.starts[index]:self.stops[index] + 1] if self.types[index] != Token.EOF else '<EOF>'
+
+    def get_channel(self, index: int) -> int:
+        return Token.HIDDEN_CHANNEL if self.types[index] in HIDDEN_TOKEN_TYPES else Token.DEFAULT_CHANNEL
+
+
+class TokenBufferSource:
+    buffer: TokenBuffer
+    index: int
+    stop: int
+    line: int
+    column: int
+    _factory: CommonTokenFactory
+
+    def __init__(self, buffer: TokenBuffer, start: int = 0, stop: int | None = None):
+        self.buffer = buffer
+        self.index = start
+        self.stop = len(buffer) - 1 if stop is None else stop
+        self.line = 1
+        self.column = 0
+        self._factory = CommonTokenFactory.DEFAULT
+
+    def nextToken(self) -> CommonToken:
+        buffer: TokenBuffer = self.buffer
+        while self.index < self.stop and buffer.types[self.index] in HIDDEN_TOKEN_TYPES:
+            self.index += 1
+        index: int = self.index
+        self.line = buffer.lines[index]
+        self.column = buffer.columns[index]
+        if index >= self.stop:
+            token: CommonToken = CommonToken((self, None), Token.EOF, Token.DEFAULT_CHANNEL, buffer.starts[index], buffer.starts[index] - 1)
+            token.text = '<EOF>'
+            return token
+        self.index += 1
+        token = CommonToken((self, None), buffer.types[index], Token.DEFAULT_CHANNEL, buffer.starts[index], buffer.stops[index])
+        token.text = buffer.get_text(index)
+        return token
+
+    def getSourceName(self) -> str:
+        return '<unknown>'
+
+    def getInputStream(self) -> None:
+        return None
+
+
+def tokenize(source: str) -> TokenBuffer:
+    buffer: TokenBuffer = TokenBuffer(source)
+    for token in iter_tokens(source, 0, 1, 0):
+        buffer.append(*token)
+    buffer.append(Token.EOF, len(source), len(source) - 1, source.count('\n') + 1, len(source) - source.rfind('\n') - 1)
+    return buffer
+
+def find_identifiers(source: str) -> set[str]:
+    return set(__identifier.findall(source))
+
+def iter_tokens(source: str, position: int, line: int, line_start: int) -> Iterator[tuple[int, int, int, int, int]]:
+    for token_match in __pattern.finditer(source, position):
+        group: str = token_match.lastgroup
+        start, end = token_match.span()
+        match group:
+            case 'StellaIdent':
+                token_type: int = __literal_types.get(token_match.group(), stellaLexer.StellaIdent)
+            case 'Literal':
+                token_type = __literal_types[token_match.group()]
+            case _:
+                token_type = __group_types[group]
+        yield token_type, start, end - 1, line, start - line_start
+        if token_type in HIDDEN_TOKEN_TYPES:
+            newlines: int = source.count('\n', start, end)
+            if newlines:
+                line += newlines
+                line_start = source.rindex('\n', start, end) + 1
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import signal
+import sys
+import time
+
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict
+from pathlib import Path
+
+from batch import BatchResult
+from checkerPool import CheckerPool
+from main import add_arguments
+
+
+class CheckServer:
+    args: Namespace
+    requests_count: int
+    _checker_pool: CheckerPool
+    _readers: set[asyncio.StreamReader]
+    _connections: set[asyncio.Task]
+    _is_draining: bool
+
+    def __init__(self, args: Namespace):
+        self.args = args
+        self.requests_count = 0
+        self._checker_pool = CheckerPool(args, args.workers, args.max_pending, args.timeout)
+        self._readers = set()
+        self._connections = set()
+        self._is_draining = False
+
+    async def serve(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signal_number, self.drain)
+        async with self._checker_pool:
+            if self.args.socket:
+                await self._serve_socket(self.args.socket)
+            else:
+                await self._serve_stdio()
+
+    def drain(self) -> None:
+        self._is_draining = True
+        for reader in self._readers:
+            reader.feed_eof()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._readers.add(reader)
+        responses: set[asyncio.Task] = set()
+        try:
+            while not self._is_draining:
+                line: bytes | None = await self._read_line(reader)
+                if line is None:
+                    await self._write_response(self._make_invalid_response(f'request line is longer than {self.args.max_request_size} bytes'), writer)
+                    continue
+                if not line:
+                    break
+                if line.strip():
+                    response: asyncio.Task = asyncio.create_task(self._respond(line, writer))
+                    responses.add(response)
+                    response.add_done_callback(responses.discard)
+            if responses:
+                await asyncio.wait(responses)
+        finally:
+            self._readers.discard(reader)
+            writer.close()
+
+    async def handle_request(self, line: bytes) -> dict[str, object]:
+        try:
+            request: dict[str, object] = json.loads(line)
+            request_id: object = request.get('id')
+            source: str = request['source']
+            if not isinstance(source, str):
+                raise TypeError('source must be a string')
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            return self._make_invalid_response(str(error))
+        if self._is_draining:
+            return self._make_response(request_id, BatchResult('', 'unavailable', 1, None, 'server is shutting down\n'), 0.0)
+        if self._checker_pool.pending_count >= self.args.max_pending:
+            return self._make_response(request_id, BatchResult('', 'busy', 1, None, f'more than {self.args.max_pending} requests are pending\n'), 0.0)
+        start: float = time.perf_counter()
+        result: BatchResult = await self._checker_pool.check_source(source, name = str(request_id))
+        self.requests_count += 1
+        return self._make_response(request_id, result, time.perf_counter() - start)
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        await self._write_response(await self.handle_request(line), writer)
+
+    async def _write_response(self, response: dict[str, object], writer: asyncio.StreamWriter) -> None:
+        writer.write(json.dumps(response, ensure_ascii = False).encode() + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _serve_socket(self, path: Path) -> None:
+        path.unlink(missing_ok = True)
+        server: asyncio.Server = await asyncio.start_unix_server(self._track_connection, path = str(path), limit = self.args.max_request_size)
+        try:
+            while not self._is_draining:
+                await asyncio.sleep(0.1)
+        finally:
+            server.close()
+            if self._connections:
+                await asyncio.wait(self._connections)
+            path.unlink(missing_ok = True)
+
+    async def _serve_stdio(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        reader: asyncio.StreamReader = asyncio.StreamReader(limit = self.args.max_request_size)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+        await self.handle_connection(reader, asyncio.StreamWriter(transport, protocol, reader, loop))
+
+    async def _track_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection: asyncio.Task = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            await self.handle_connection(reader, writer)
+        finally:
+            self._connections.discard(connection)
+
+    @classmethod
+    async def _read_line(cls, reader: asyncio.StreamReader) -> bytes | None:
+        is_oversized: bool = False
+        while True:
+            try:
+                line: bytes = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as incomplete_read_error:
+                line = incomplete_read_error.partial
+            except asyncio.LimitOverrunError as limit_overrun_error:
+                await reader.readexactly(limit_overrun_error.consumed)
+                is_oversized = True
+                continue
+            return None if is_oversized else line
+
+    @classmethod
+    def _make_invalid_response(cls, message: str) -> dict[str, object]:
+        return {'id': None, 'status': 'invalid', 'exit_code': 1, 'error_kind': None, 'message': f'invalid request: {message}\n'}
+
+    @classmethod
+    def _make_response(cls, request_id: object, result: BatchResult, elapsed: float) -> dict[str, object]:
+        response: dict[str, object] = {'id': request_id, **asdict(result), 'elapsed_ms': round(elapsed * 1000, 3)}
+        del response['path']
+        return response
+
+
+def parse_args() -> Namespace:
+    argument_parser: ArgumentParser = ArgumentParser(description = 'Serve newline-delimited JSON check requests from warm worker processes')
+    argument_parser.add_argument('--socket', type = Path, help = 'listen on this Unix domain socket instead of stdin and stdout')
+    argument_parser.add_argument('--workers', type = int, default = 1, help = 'number of worker processes checking requests concurrently')
+    argument_parser.add_argument('--max-pending', type = int, default = 64, help = 'reject requests with status busy while this many are pending')
+    argument_parser.add_argument('--max-request-size', type = int, default = 64 * 1024 * 1024, help = 'maximum size of one request line in bytes')
+    argument_parser.add_argument('--timeout', type = float, help = 'seconds after which a check is abandoned and its worker restarted')
+    return add_arguments(argument_parser).parse_args()
+
+def main() -> None:
+    args: Namespace = parse_args()
+    check_server: CheckServer = CheckServer(args)
+    asyncio.run(check_server.serve())
+    sys.stderr.write(f'served {check_server.requests_count} requests\n')
+
+if __name__ == '__main__':
+    main()
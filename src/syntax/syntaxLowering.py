@@ -0,0 +1,288 @@
+from antlr4 import Token
+
+from antlr.stellaParser import stellaParser
+from error.sourceSpan import SourceSpan
+from syntax import syntaxTree
+
+
+def lower_program(ctx: stellaParser.ProgramContext) -> syntaxTree.Program:
+    program: syntaxTree.Program = lower_header(ctx)
+    program.decls.extend(__lower_decl(decl) for decl in ctx.decls)
+    return program
+
+def lower_header(ctx: stellaParser.ProgramContext) -> syntaxTree.Program:
+    extensions: list[str] = []
+    for extension_context in ctx.extensions:
+        if isinstance(extension_context, stellaParser.AnExtensionContext):
+            extensions.extend(extension_name.text[1:] for extension_name in extension_context.extensionNames)
+    return syntaxTree.Program(SourceSpan.from_context(ctx), extensions, [])
+
+def lower_decl(ctx: stellaParser.DeclContext) -> syntaxTree.Decl:
+    return __lower_decl(ctx)
+
+def lower_signature(ctx: stellaParser.DeclContext) -> syntaxTree.Decl:
+    match ctx:
+        case stellaParser.DeclFunContext():
+            return syntaxTree.DeclFun(SourceSpan.from_context(ctx), __get_text(ctx.name), [__lower_param_decl(item) for item in ctx.paramDecls], __lower_type(ctx.returnType), [__lower_type(item) for item in ctx.throwTypes], [], None)
+        case _:
+            return __lower_decl(ctx)
+
+def __lower_decl(ctx: stellaParser.DeclContext | None) -> syntaxTree.Decl | None:
+    match ctx:
+        case None:
+            return None
+        case stellaParser.DeclFunContext():
+            return syntaxTree.DeclFun(SourceSpan.from_context(ctx), __get_text(ctx.name), [__lower_param_decl(item) for item in ctx.paramDecls], __lower_type(ctx.returnType), [__lower_type(item) for item in ctx.throwTypes], [__lower_decl(item) for item in ctx.localDecls], __lower_expression(ctx.returnExpr))
+        case stellaParser.DeclFunGenericContext():
+            return syntaxTree.DeclFunGeneric(SourceSpan.from_context(ctx), __get_text(ctx.name), [__get_text(item) for item in ctx.generics], [__lower_param_decl(item) for item in ctx.paramDecls], __lower_type(ctx.returnType), [__lower_type(item) for item in ctx.throwTypes], [__lower_decl(item) for item in ctx.localDecls], __lower_expression(ctx.returnExpr))
+        case stellaParser.DeclTypeAliasContext():
+            return syntaxTree.DeclTypeAlias(SourceSpan.from_context(ctx), __get_text(ctx.name), __lower_type(ctx.atype))
+        case stellaParser.DeclExceptionTypeContext():
+            return syntaxTree.DeclExceptionType(SourceSpan.from_context(ctx), __lower_type(ctx.exceptionType))
+        case stellaParser.DeclExceptionVariantContext():
+            return syntaxTree.DeclExceptionVariant(SourceSpan.from_context(ctx), __get_text(ctx.name), __lower_type(ctx.variantType))
+        case _:
+            return syntaxTree.Decl(SourceSpan.from_context(ctx))
+
+def __lower_expression(ctx: stellaParser.ExprContext | None) -> syntaxTree.Expr | None:
+    match ctx:
+        case None:
+            return None
+        case stellaParser.DotRecordContext():
+            return syntaxTree.DotRecord(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_), __get_text(ctx.label))
+        case stellaParser.DotTupleContext():
+            return syntaxTree.DotTuple(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_), __get_text(ctx.index))
+        case stellaParser.ConstTrueContext():
+            return syntaxTree.ConstTrue(SourceSpan.from_context(ctx))
+        case stellaParser.ConstFalseContext():
+            return syntaxTree.ConstFalse(SourceSpan.from_context(ctx))
+        case stellaParser.ConstUnitContext():
+            return syntaxTree.ConstUnit(SourceSpan.from_context(ctx))
+        case stellaParser.ConstIntContext():
+            return syntaxTree.ConstInt(SourceSpan.from_context(ctx), __get_text(ctx.n))
+        case stellaParser.ConstMemoryContext():
+            return syntaxTree.ConstMemory(SourceSpan.from_context(ctx), __get_text(ctx.mem))
+        case stellaParser.VarContext():
+            return syntaxTree.Var(SourceSpan.from_context(ctx), __get_text(ctx.name))
+        case stellaParser.PanicContext():
+            return syntaxTree.Panic(SourceSpan.from_context(ctx))
+        case stellaParser.ThrowContext():
+            return syntaxTree.Throw(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.TryCatchContext():
+            return syntaxTree.TryCatch(SourceSpan.from_context(ctx), __lower_expression(ctx.tryExpr), __lower_pattern(ctx.pat), __lower_expression(ctx.fallbackExpr))
+        case stellaParser.TryCastAsContext():
+            return syntaxTree.TryCastAs(SourceSpan.from_context(ctx), __lower_expression(ctx.tryExpr), __lower_type(ctx.type_), __lower_pattern(ctx.pattern_), __lower_expression(ctx.expr_), __lower_expression(ctx.fallbackExpr))
+        case stellaParser.TryWithContext():
+            return syntaxTree.TryWith(SourceSpan.from_context(ctx), __lower_expression(ctx.tryExpr), __lower_expression(ctx.fallbackExpr))
+        case stellaParser.InlContext():
+            return syntaxTree.Inl(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.InrContext():
+            return syntaxTree.Inr(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.ConsListContext():
+            return syntaxTree.ConsList(SourceSpan.from_context(ctx), __lower_expression(ctx.head), __lower_expression(ctx.tail))
+        case stellaParser.HeadContext():
+            return syntaxTree.Head(SourceSpan.from_context(ctx), __lower_expression(ctx.list_))
+        case stellaParser.IsEmptyContext():
+            return syntaxTree.IsEmpty(SourceSpan.from_context(ctx), __lower_expression(ctx.list_))
+        case stellaParser.TailContext():
+            return syntaxTree.Tail(SourceSpan.from_context(ctx), __lower_expression(ctx.list_))
+        case stellaParser.SuccContext():
+            return syntaxTree.Succ(SourceSpan.from_context(ctx), __lower_expression(ctx.n))
+        case stellaParser.LogicNotContext():
+            return syntaxTree.LogicNot(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.PredContext():
+            return syntaxTree.Pred(SourceSpan.from_context(ctx), __lower_expression(ctx.n))
+        case stellaParser.IsZeroContext():
+            return syntaxTree.IsZero(SourceSpan.from_context(ctx), __lower_expression(ctx.n))
+        case stellaParser.FixContext():
+            return syntaxTree.Fix(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.NatRecContext():
+            return syntaxTree.NatRec(SourceSpan.from_context(ctx), __lower_expression(ctx.n), __lower_expression(ctx.initial), __lower_expression(ctx.step))
+        case stellaParser.FoldContext():
+            return syntaxTree.Fold(SourceSpan.from_context(ctx), __lower_type(ctx.type_), __lower_expression(ctx.expr_))
+        case stellaParser.UnfoldContext():
+            return syntaxTree.Unfold(SourceSpan.from_context(ctx), __lower_type(ctx.type_), __lower_expression(ctx.expr_))
+        case stellaParser.ApplicationContext():
+            return syntaxTree.Application(SourceSpan.from_context(ctx), __lower_expression(ctx.fun), [__lower_expression(item) for item in ctx.args])
+        case stellaParser.TypeApplicationContext():
+            return syntaxTree.TypeApplication(SourceSpan.from_context(ctx), __lower_expression(ctx.fun), [__lower_type(item) for item in ctx.types])
+        case stellaParser.MultiplyContext():
+            return syntaxTree.Multiply(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.DivideContext():
+            return syntaxTree.Divide(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.LogicAndContext():
+            return syntaxTree.LogicAnd(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.RefContext():
+            return syntaxTree.Ref(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.DerefContext():
+            return syntaxTree.Deref(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_))
+        case stellaParser.AddContext():
+            return syntaxTree.Add(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.SubtractContext():
+            return syntaxTree.Subtract(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.LogicOrContext():
+            return syntaxTree.LogicOr(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.TypeAscContext():
+            return syntaxTree.TypeAsc(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_), __lower_type(ctx.type_))
+        case stellaParser.TypeCastContext():
+            return syntaxTree.TypeCast(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_), __lower_type(ctx.type_))
+        case stellaParser.AbstractionContext():
+            return syntaxTree.Abstraction(SourceSpan.from_context(ctx), [__lower_param_decl(item) for item in ctx.paramDecls], __lower_expression(ctx.returnExpr))
+        case stellaParser.TupleContext():
+            return syntaxTree.Tuple(SourceSpan.from_context(ctx), [__lower_expression(item) for item in ctx.exprs])
+        case stellaParser.RecordContext():
+            return syntaxTree.Record(SourceSpan.from_context(ctx), [__lower_binding(item) for item in ctx.bindings])
+        case stellaParser.VariantContext():
+            return syntaxTree.Variant(SourceSpan.from_context(ctx), __get_text(ctx.label), __lower_expression(ctx.rhs))
+        case stellaParser.MatchContext():
+            return syntaxTree.Match(SourceSpan.from_context(ctx), __lower_expression(ctx.expr_), [__lower_match_case(item) for item in ctx.cases])
+        case stellaParser.ListContext():
+            return syntaxTree.List(SourceSpan.from_context(ctx), [__lower_expression(item) for item in ctx.exprs])
+        case stellaParser.LessThanContext():
+            return syntaxTree.LessThan(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.LessThanOrEqualContext():
+            return syntaxTree.LessThanOrEqual(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.GreaterThanContext():
+            return syntaxTree.GreaterThan(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.GreaterThanOrEqualContext():
+            return syntaxTree.GreaterThanOrEqual(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.EqualContext():
+            return syntaxTree.Equal(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.NotEqualContext():
+            return syntaxTree.NotEqual(SourceSpan.from_context(ctx), __lower_expression(ctx.left), __lower_expression(ctx.right))
+        case stellaParser.AssignContext():
+            return syntaxTree.Assign(SourceSpan.from_context(ctx), __lower_expression(ctx.lhs), __lower_expression(ctx.rhs))
+        case stellaParser.IfContext():
+            return syntaxTree.If(SourceSpan.from_context(ctx), __lower_expression(ctx.condition), __lower_expression(ctx.thenExpr), __lower_expression(ctx.elseExpr))
+        case stellaParser.SequenceContext():
+            return syntaxTree.Sequence(SourceSpan.from_context(ctx), __lower_expression(ctx.expr1), __lower_expression(ctx.expr2))
+        case stellaParser.LetContext():
+            return syntaxTree.Let(SourceSpan.from_context(ctx), [__lower_pattern_binding(item) for item in ctx.patternBindings], __lower_expression(ctx.body))
+        case stellaParser.LetRecContext():
+            return syntaxTree.LetRec(SourceSpan.from_context(ctx), [__lower_pattern_binding(item) for item in ctx.patternBindings], __lower_expression(ctx.body))
+        case stellaParser.TypeAbstractionContext():
+            return syntaxTree.TypeAbstraction(SourceSpan.from_context(ctx), [__get_text(item) for item in ctx.generics], __lower_expression(ctx.expr_))
+        case stellaParser.ParenthesisedExprContext():
+            return __lower_expression(ctx.expr_)
+        case stellaParser.TerminatingSemicolonContext():
+            return __lower_expression(ctx.expr_)
+        case _:
+            return syntaxTree.Expr(SourceSpan.from_context(ctx))
+
+def __lower_pattern(ctx: stellaParser.PatternContext | None) -> syntaxTree.Pattern | None:
+    match ctx:
+        case None:
+            return None
+        case stellaParser.PatternVariantContext():
+            return syntaxTree.PatternVariant(SourceSpan.from_context(ctx), __get_text(ctx.label), __lower_pattern(ctx.pattern_))
+        case stellaParser.PatternInlContext():
+            return syntaxTree.PatternInl(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_))
+        case stellaParser.PatternInrContext():
+            return syntaxTree.PatternInr(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_))
+        case stellaParser.PatternTupleContext():
+            return syntaxTree.PatternTuple(SourceSpan.from_context(ctx), [__lower_pattern(item) for item in ctx.patterns])
+        case stellaParser.PatternRecordContext():
+            return syntaxTree.PatternRecord(SourceSpan.from_context(ctx), [__lower_labelled_pattern(item) for item in ctx.patterns])
+        case stellaParser.PatternListContext():
+            return syntaxTree.PatternList(SourceSpan.from_context(ctx), [__lower_pattern(item) for item in ctx.patterns])
+        case stellaParser.PatternConsContext():
+            return syntaxTree.PatternCons(SourceSpan.from_context(ctx), __lower_pattern(ctx.head), __lower_pattern(ctx.tail))
+        case stellaParser.PatternFalseContext():
+            return syntaxTree.PatternFalse(SourceSpan.from_context(ctx))
+        case stellaParser.PatternTrueContext():
+            return syntaxTree.PatternTrue(SourceSpan.from_context(ctx))
+        case stellaParser.PatternUnitContext():
+            return syntaxTree.PatternUnit(SourceSpan.from_context(ctx))
+        case stellaParser.PatternIntContext():
+            return syntaxTree.PatternInt(SourceSpan.from_context(ctx), __get_text(ctx.n))
+        case stellaParser.PatternSuccContext():
+            return syntaxTree.PatternSucc(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_))
+        case stellaParser.PatternVarContext():
+            return syntaxTree.PatternVar(SourceSpan.from_context(ctx), __get_text(ctx.name))
+        case stellaParser.PatternAscContext():
+            return syntaxTree.PatternAsc(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_), __lower_type(ctx.type_))
+        case stellaParser.PatternCastAsContext():
+            return syntaxTree.PatternCastAs(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_), __lower_type(ctx.type_))
+        case stellaParser.ParenthesisedPatternContext():
+            return __lower_pattern(ctx.pattern_)
+        case _:
+            return syntaxTree.Pattern(SourceSpan.from_context(ctx))
+
+def __lower_type(ctx: stellaParser.StellatypeContext | None) -> syntaxTree.Stellatype | None:
+    match ctx:
+        case None:
+            return None
+        case stellaParser.TypeBoolContext():
+            return syntaxTree.TypeBool(SourceSpan.from_context(ctx))
+        case stellaParser.TypeNatContext():
+            return syntaxTree.TypeNat(SourceSpan.from_context(ctx))
+        case stellaParser.TypeRefContext():
+            return syntaxTree.TypeRef(SourceSpan.from_context(ctx), __lower_type(ctx.type_))
+        case stellaParser.TypeSumContext():
+            return syntaxTree.TypeSum(SourceSpan.from_context(ctx), __lower_type(ctx.left), __lower_type(ctx.right))
+        case stellaParser.TypeFunContext():
+            return syntaxTree.TypeFun(SourceSpan.from_context(ctx), [__lower_type(item) for item in ctx.paramTypes], __lower_type(ctx.returnType))
+        case stellaParser.TypeForAllContext():
+            return syntaxTree.TypeForAll(SourceSpan.from_context(ctx), [__get_text(item) for item in ctx.types], __lower_type(ctx.type_))
+        case stellaParser.TypeRecContext():
+            return syntaxTree.TypeRec(SourceSpan.from_context(ctx), __get_text(ctx.var), __lower_type(ctx.type_))
+        case stellaParser.TypeTupleContext():
+            return syntaxTree.TypeTuple(SourceSpan.from_context(ctx), [__lower_type(item) for item in ctx.types])
+        case stellaParser.TypeRecordContext():
+            return syntaxTree.TypeRecord(SourceSpan.from_context(ctx), [__lower_record_field_type(item) for item in ctx.fieldTypes])
+        case stellaParser.TypeVariantContext():
+            return syntaxTree.TypeVariant(SourceSpan.from_context(ctx), [__lower_variant_field_type(item) for item in ctx.fieldTypes])
+        case stellaParser.TypeListContext():
+            return syntaxTree.TypeList(SourceSpan.from_context(ctx), __lower_type(ctx.type_))
+        case stellaParser.TypeUnitContext():
+            return syntaxTree.TypeUnit(SourceSpan.from_context(ctx))
+        case stellaParser.TypeTopContext():
+            return syntaxTree.TypeTop(SourceSpan.from_context(ctx))
+        case stellaParser.TypeBottomContext():
+            return syntaxTree.TypeBottom(SourceSpan.from_context(ctx))
+        case stellaParser.TypeAutoContext():
+            return syntaxTree.TypeAuto(SourceSpan.from_context(ctx))
+        case stellaParser.TypeVarContext():
+            return syntaxTree.TypeVar(SourceSpan.from_context(ctx), __get_text(ctx.name))
+        case stellaParser.TypeParensContext():
+            return __lower_type(ctx.type_)
+        case _:
+            return syntaxTree.Stellatype(SourceSpan.from_context(ctx))
+
+def __lower_param_decl(ctx: stellaParser.ParamDeclContext | None) -> syntaxTree.ParamDecl | None:
+    if ctx is None:
+        return None
+    return syntaxTree.ParamDecl(SourceSpan.from_context(ctx), __get_text(ctx.name), __lower_type(ctx.paramType))
+
+def __lower_pattern_binding(ctx: stellaParser.PatternBindingContext | None) -> syntaxTree.PatternBinding | None:
+    if ctx is None:
+        return None
+    return syntaxTree.PatternBinding(SourceSpan.from_context(ctx), __lower_pattern(ctx.pat), __lower_expression(ctx.rhs))
+
+def __lower_binding(ctx: stellaParser.BindingContext | None) -> syntaxTree.Binding | None:
+    if ctx is None:
+        return None
+    return syntaxTree.Binding(SourceSpan.from_context(ctx), __get_text(ctx.name), __lower_expression(ctx.rhs))
+
+def __lower_match_case(ctx: stellaParser.MatchCaseContext | None) -> syntaxTree.MatchCase | None:
+    if ctx is None:
+        return None
+    return syntaxTree.MatchCase(SourceSpan.from_context(ctx), __lower_pattern(ctx.pattern_), __lower_expression(ctx.expr_))
+
+def __lower_labelled_pattern(ctx: stellaParser.LabelledPatternContext | None) -> syntaxTree.LabelledPattern | None:
+    if ctx is None:
+        return None
+    return syntaxTree.LabelledPattern(SourceSpan.from_context(ctx), __get_text(ctx.label), __lower_pattern(ctx.pattern_))
+
+def __lower_record_field_type(ctx: stellaParser.RecordFieldTypeContext | None) -> syntaxTree.RecordFieldType | None:
+    if ctx is None:
+        return None
+    return syntaxTree.RecordFieldType(SourceSpan.from_context(ctx), __get_text(ctx.label), __lower_type(ctx.type_))
+
+def __lower_variant_field_type(ctx: stellaParser.VariantFieldTypeContext | None) -> syntaxTree.VariantFieldType | None:
+    if ctx is None:
+        return None
+    return syntaxTree.VariantFieldType(SourceSpan.from_context(ctx), __get_text(ctx.label), __lower_type(ctx.type_))
+
+def __get_text(token: Token | None) -> str | None:
+    return token.text if token else None
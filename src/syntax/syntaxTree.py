@@ -0,0 +1,617 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Iterator
+
+from error.sourceSpan import SourceSpan
+
+
+@dataclass(eq = False, slots = True)
+class Node:
+    span: SourceSpan
+
+    def iter_children(self) -> Iterator[Node]:
+        for field_name in get_node_fields(type(self)):
+            value: object = getattr(self, field_name)
+            if isinstance(value, Node):
+                yield value
+            elif isinstance(value, list):
+                yield from (item for item in value if isinstance(item, Node))
+
+
+@dataclass(eq = False, slots = True)
+class Program(Node):
+    extensions: list[str]
+    decls: list[Decl]
+
+
+@dataclass(eq = False, slots = True)
+class Decl(Node):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class DeclFun(Decl):
+    name: str
+    paramDecls: list[ParamDecl]
+    returnType: Stellatype | None
+    throwTypes: list[Stellatype]
+    localDecls: list[Decl]
+    returnExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class DeclFunGeneric(Decl):
+    name: str
+    generics: list[str]
+    paramDecls: list[ParamDecl]
+    returnType: Stellatype | None
+    throwTypes: list[Stellatype]
+    localDecls: list[Decl]
+    returnExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class DeclTypeAlias(Decl):
+    name: str
+    atype: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class DeclExceptionType(Decl):
+    exceptionType: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class DeclExceptionVariant(Decl):
+    name: str
+    variantType: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class ParamDecl(Node):
+    name: str
+    paramType: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class Expr(Node):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class DotRecord(Expr):
+    expr_: Expr
+    label: str
+
+
+@dataclass(eq = False, slots = True)
+class DotTuple(Expr):
+    expr_: Expr
+    index: str
+
+
+@dataclass(eq = False, slots = True)
+class ConstTrue(Expr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class ConstFalse(Expr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class ConstUnit(Expr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class ConstInt(Expr):
+    n: str
+
+
+@dataclass(eq = False, slots = True)
+class ConstMemory(Expr):
+    mem: str
+
+
+@dataclass(eq = False, slots = True)
+class Var(Expr):
+    name: str
+
+
+@dataclass(eq = False, slots = True)
+class Panic(Expr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Throw(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class TryCatch(Expr):
+    tryExpr: Expr
+    pat: Pattern
+    fallbackExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class TryCastAs(Expr):
+    tryExpr: Expr
+    type_: Stellatype
+    pattern_: Pattern
+    expr_: Expr
+    fallbackExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class TryWith(Expr):
+    tryExpr: Expr
+    fallbackExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Inl(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Inr(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class ConsList(Expr):
+    head: Expr
+    tail: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Head(Expr):
+    list_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class IsEmpty(Expr):
+    list_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Tail(Expr):
+    list_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Succ(Expr):
+    n: Expr
+
+
+@dataclass(eq = False, slots = True)
+class LogicNot(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Pred(Expr):
+    n: Expr
+
+
+@dataclass(eq = False, slots = True)
+class IsZero(Expr):
+    n: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Fix(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class NatRec(Expr):
+    n: Expr
+    initial: Expr
+    step: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Fold(Expr):
+    type_: Stellatype
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Unfold(Expr):
+    type_: Stellatype
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Application(Expr):
+    fun: Expr
+    args: list[Expr]
+
+
+@dataclass(eq = False, slots = True)
+class TypeApplication(Expr):
+    fun: Expr
+    types: list[Stellatype]
+
+
+@dataclass(eq = False, slots = True)
+class BinaryExpr(Expr):
+    left: Expr
+    right: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Multiply(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Divide(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class LogicAnd(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Ref(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Deref(Expr):
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Add(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Subtract(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class LogicOr(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeAsc(Expr):
+    expr_: Expr
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeCast(Expr):
+    expr_: Expr
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class Abstraction(Expr):
+    paramDecls: list[ParamDecl]
+    returnExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Tuple(Expr):
+    exprs: list[Expr]
+
+
+@dataclass(eq = False, slots = True)
+class Record(Expr):
+    bindings: list[Binding]
+
+
+@dataclass(eq = False, slots = True)
+class Variant(Expr):
+    label: str
+    rhs: Expr | None
+
+
+@dataclass(eq = False, slots = True)
+class Match(Expr):
+    expr_: Expr
+    cases: list[MatchCase]
+
+
+@dataclass(eq = False, slots = True)
+class List(Expr):
+    exprs: list[Expr]
+
+
+@dataclass(eq = False, slots = True)
+class LessThan(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class LessThanOrEqual(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class GreaterThan(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class GreaterThanOrEqual(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Equal(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class NotEqual(BinaryExpr):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class Assign(Expr):
+    lhs: Expr
+    rhs: Expr
+
+
+@dataclass(eq = False, slots = True)
+class If(Expr):
+    condition: Expr
+    thenExpr: Expr
+    elseExpr: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Sequence(Expr):
+    expr1: Expr
+    expr2: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Let(Expr):
+    patternBindings: list[PatternBinding]
+    body: Expr
+
+
+@dataclass(eq = False, slots = True)
+class LetRec(Expr):
+    patternBindings: list[PatternBinding]
+    body: Expr
+
+
+@dataclass(eq = False, slots = True)
+class TypeAbstraction(Expr):
+    generics: list[str]
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class PatternBinding(Node):
+    pat: Pattern
+    rhs: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Binding(Node):
+    name: str
+    rhs: Expr
+
+
+@dataclass(eq = False, slots = True)
+class MatchCase(Node):
+    pattern_: Pattern
+    expr_: Expr
+
+
+@dataclass(eq = False, slots = True)
+class Pattern(Node):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class PatternVariant(Pattern):
+    label: str
+    pattern_: Pattern | None
+
+
+@dataclass(eq = False, slots = True)
+class PatternInl(Pattern):
+    pattern_: Pattern
+
+
+@dataclass(eq = False, slots = True)
+class PatternInr(Pattern):
+    pattern_: Pattern
+
+
+@dataclass(eq = False, slots = True)
+class PatternTuple(Pattern):
+    patterns: list[Pattern]
+
+
+@dataclass(eq = False, slots = True)
+class PatternRecord(Pattern):
+    patterns: list[LabelledPattern]
+
+
+@dataclass(eq = False, slots = True)
+class PatternList(Pattern):
+    patterns: list[Pattern]
+
+
+@dataclass(eq = False, slots = True)
+class PatternCons(Pattern):
+    head: Pattern
+    tail: Pattern
+
+
+@dataclass(eq = False, slots = True)
+class PatternFalse(Pattern):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class PatternTrue(Pattern):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class PatternUnit(Pattern):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class PatternInt(Pattern):
+    n: str
+
+
+@dataclass(eq = False, slots = True)
+class PatternSucc(Pattern):
+    pattern_: Pattern
+
+
+@dataclass(eq = False, slots = True)
+class PatternVar(Pattern):
+    name: str
+
+
+@dataclass(eq = False, slots = True)
+class PatternAsc(Pattern):
+    pattern_: Pattern
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class PatternCastAs(Pattern):
+    pattern_: Pattern
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class LabelledPattern(Node):
+    label: str
+    pattern_: Pattern
+
+
+@dataclass(eq = False, slots = True)
+class Stellatype(Node):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeBool(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeNat(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeRef(Stellatype):
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeSum(Stellatype):
+    left: Stellatype
+    right: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeFun(Stellatype):
+    paramTypes: list[Stellatype]
+    returnType: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeForAll(Stellatype):
+    types: list[str]
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeRec(Stellatype):
+    var: str
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeTuple(Stellatype):
+    types: list[Stellatype]
+
+
+@dataclass(eq = False, slots = True)
+class TypeRecord(Stellatype):
+    fieldTypes: list[RecordFieldType]
+
+
+@dataclass(eq = False, slots = True)
+class TypeVariant(Stellatype):
+    fieldTypes: list[VariantFieldType]
+
+
+@dataclass(eq = False, slots = True)
+class TypeList(Stellatype):
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class TypeUnit(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeTop(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeBottom(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeAuto(Stellatype):
+    pass
+
+
+@dataclass(eq = False, slots = True)
+class TypeVar(Stellatype):
+    name: str
+
+
+@dataclass(eq = False, slots = True)
+class RecordFieldType(Node):
+    label: str
+    type_: Stellatype
+
+
+@dataclass(eq = False, slots = True)
+class VariantFieldType(Node):
+    label: str
+    type_: Stellatype | None
+
+
+__node_fields: dict[type, tuple[str, ...]] = {}
+
+def get_node_fields(node_type: type) -> tuple[str, ...]:
+    node_fields: tuple[str, ...] | None = __node_fields.get(node_type)
+    if node_fields is None:
+        node_fields = tuple(field.name for field in fields(node_type) if field.name != 'span')
+        __node_fields[node_type] = node_fields
+    return node_fields
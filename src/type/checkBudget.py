@@ -0,0 +1,132 @@
+import os
+import resource
+import time
+import tracemalloc
+
+from typing import Final
+
+from type.type import FunctionalType, ListType, RecordType, RefType, SumType, TupleType, Type, UniversalWrapperType, VariantType
+
+
+class BudgetExceededError(Exception):
+    resource: str
+    limit: float
+
+    def __init__(self, resource: str, limit: float):
+        super().__init__(f'check exceeded its {resource} budget of {limit}')
+        self.resource = resource
+        self.limit = limit
+
+
+class CheckBudget:
+    __poll_interval: Final[int] = 1024
+    deadline: float | None
+    max_nodes: int | None
+    max_constraints: int | None
+    max_type_size: int | None
+    max_memory: int | None
+    is_traced_memory: bool
+    nodes: int
+    constraints: int
+    is_running: bool
+    _expires_at: float | None
+    _memory_base: int
+    _steps: int
+    _is_tracing_started: bool
+
+    def __init__(self, deadline: float | None = None, max_nodes: int | None = None, max_constraints: int | None = None, max_type_size: int | None = None, max_memory: int | None = None, is_traced_memory: bool = False):
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.max_constraints = max_constraints
+        self.max_type_size = max_type_size
+        self.max_memory = max_memory
+        self.is_traced_memory = is_traced_memory
+        self.nodes = 0
+        self.constraints = 0
+        self.is_running = False
+        self._expires_at = None
+        self._memory_base = 0
+        self._steps = 0
+        self._is_tracing_started = False
+
+    def start(self) -> None:
+        self.nodes = 0
+        self.constraints = 0
+        self.is_running = True
+        self._expires_at = time.perf_counter() + self.deadline if self.deadline is not None else None
+        self._steps = 0
+        if self.max_memory is not None and self.is_traced_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._is_tracing_started = True
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        return None
+
+    def stop(self) -> None:
+        self.is_running = False
+        if self._is_tracing_started:
+            tracemalloc.stop()
+            self._is_tracing_started = False
+        return None
+
+    def poll(self) -> None:
+        if self._expires_at is not None and time.perf_counter() > self._expires_at:
+            raise BudgetExceededError('time', self.deadline)
+        if self.max_memory is not None and self._get_memory() > self.max_memory:
+            raise BudgetExceededError('memory', self.max_memory)
+        return None
+
+    def charge_node(self) -> None:
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise BudgetExceededError('nodes', self.max_nodes)
+        self.charge_step()
+        return None
+
+    def charge_constraints(self, count: int = 1) -> None:
+        self.constraints += count
+        if self.max_constraints is not None and self.constraints > self.max_constraints:
+            raise BudgetExceededError('constraints', self.max_constraints)
+        return None
+
+    def charge_step(self) -> None:
+        self._steps += 1
+        if self._steps % self.__poll_interval == 0:
+            self.poll()
+        return None
+
+    def check_type(self, type: Type) -> Type:
+        if self.max_type_size is not None and type is not None and self._measure_type(type, self.max_type_size) > self.max_type_size:
+            raise BudgetExceededError('type size', self.max_type_size)
+        return type
+
+    def _get_memory(self) -> int:
+        if self.is_traced_memory:
+            return tracemalloc.get_traced_memory()[0] - self._memory_base
+        try:
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    @classmethod
+    def _measure_type(cls, type: Type, limit: int) -> int:
+        size: int = 0
+        stack: list[Type | None] = [type]
+        while stack and size <= limit:
+            current: Type | None = stack.pop()
+            if current is None:
+                continue
+            size += 1
+            match current:
+                case FunctionalType():
+                    stack.extend((current.param, current.ret))
+                case TupleType() | RecordType() | VariantType():
+                    stack.extend(current.types)
+                case SumType():
+                    stack.extend((current.left, current.right))
+                case ListType():
+                    stack.append(current.type)
+                case RefType() | UniversalWrapperType():
+                    stack.append(current.inner_type)
+        return size
@@ -1,9 +1,9 @@
-from antlr.stellaParser import stellaParser
+from syntax import syntaxTree
 from type.type import BoolType, BottomType, FunctionalType, ListType, NatType, RecordType, RefType, SumType, TopType, TupleType, Type, TypeVariable, UnitType, VariantType
 
 
-def validate_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext], expected_type: Type) -> bool:
-    preprocessed_patterns: list[stellaParser.PatternContext] = [__preprocess_pattern(pattern) for pattern in patterns]
+def validate_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern], expected_type: Type) -> bool:
+    preprocessed_patterns: list[syntaxTree.Pattern] = [__preprocess_pattern(pattern) for pattern in patterns]
     match expected_type:
         case BoolType():
             return __validate_bool_patterns_exhaustiveness(preprocessed_patterns)
@@ -34,139 +34,131 @@ def validate_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]
         case _:
             return False
 
-def __preprocess_pattern(pattern: stellaParser.PatternContext) -> stellaParser.PatternContext:
+def __preprocess_pattern(pattern: syntaxTree.Pattern) -> syntaxTree.Pattern:
     match pattern:
-        case stellaParser.PatternAscContext():
-            return __preprocess_pattern(pattern.pattern_)
-        case stellaParser.ParenthesisedPatternContext():
+        case syntaxTree.PatternAsc():
             return __preprocess_pattern(pattern.pattern_)
         case _:
             return pattern
 
-def __validate_bool_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_bool_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     has_false_pattern: bool = False
     has_true_pattern: Bool = False
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
-        if isinstance(pattern, stellaParser.PatternFalseContext):
+        if isinstance(pattern, syntaxTree.PatternFalse):
             has_false_pattern = True
-        if isinstance(pattern, stellaParser.PatternTrueContext):
+        if isinstance(pattern, syntaxTree.PatternTrue):
             has_true_pattern = True
     return has_false_pattern and has_true_pattern
 
-def __validate_nat_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_nat_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     has_int_pattern: bool = False
     has_succ_pattern: Bool = False
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
-        if isinstance(pattern, stellaParser.PatternIntContext):
+        if isinstance(pattern, syntaxTree.PatternInt):
             has_int_pattern = True
-        if isinstance(pattern, stellaParser.PatternSuccContext) and isinstance(pattern.pattern_, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternSucc) and isinstance(pattern.pattern_, syntaxTree.PatternVar):
             has_succ_pattern = True
     return has_int_pattern and has_succ_pattern
 
-def __validate_functional_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_functional_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
     return False
 
-def __validate_unit_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_unit_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or isinstance(pattern, stellaParser.PatternUnitContext):
+        if isinstance(pattern, syntaxTree.PatternVar) or isinstance(pattern, syntaxTree.PatternUnit):
             return True
     return False
 
-def __validate_tuple_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_tuple_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or (isinstance(pattern, stellaParser.PatternTupleContext) and all(isinstance(tuple_pattern, stellaParser.PatternVarContext) for tuple_pattern in pattern.patterns)):
+        if isinstance(pattern, syntaxTree.PatternVar) or (isinstance(pattern, syntaxTree.PatternTuple) and all(isinstance(tuple_pattern, syntaxTree.PatternVar) for tuple_pattern in pattern.patterns)):
             return True
     return False
 
-def __validate_record_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_record_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or (isinstance(pattern, stellaParser.PatternRecordContext) and all(isinstance(record_pattern.pattern_, stellaParser.PatternVarContext) for record_pattern in pattern.patterns)):
+        if isinstance(pattern, syntaxTree.PatternVar) or (isinstance(pattern, syntaxTree.PatternRecord) and all(isinstance(record_pattern.pattern_, syntaxTree.PatternVar) for record_pattern in pattern.patterns)):
             return True
     return False
 
-def __validate_sum_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_sum_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     has_inl_pattern: bool = False
     has_inr_pattern: Bool = False
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
-        if isinstance(pattern, stellaParser.PatternInlContext):
+        if isinstance(pattern, syntaxTree.PatternInl):
             has_inl_pattern = True
-        if isinstance(pattern, stellaParser.PatternInrContext):
+        if isinstance(pattern, syntaxTree.PatternInr):
             has_inr_pattern = True
     return has_inl_pattern and has_inr_pattern
 
-def __validate_variant_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext], expected_type: VariantType) -> bool:
+def __validate_variant_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern], expected_type: VariantType) -> bool:
     actual_labels: set[str] = set()
     expected_labels: set[str] = set(expected_type.labels)
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
-        if isinstance(pattern, stellaParser.PatternVariantContext):
-            actual_labels.add(pattern.label.text)
+        if isinstance(pattern, syntaxTree.PatternVariant):
+            actual_labels.add(pattern.label)
     return not expected_labels - actual_labels
 
-def __validate_list_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_list_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or (isinstance(pattern, stellaParser.PatternListContext) and all(isinstance(list_pattern, stellaParser.PatternVarContext) for list_pattern in pattern.patterns)):
+        if isinstance(pattern, syntaxTree.PatternVar) or (isinstance(pattern, syntaxTree.PatternList) and all(isinstance(list_pattern, syntaxTree.PatternVar) for list_pattern in pattern.patterns)):
             return True
     return False
 
-def __validate_ref_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_ref_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     return True
 
-def __validate_top_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_top_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or isinstance(pattern, stellaParser.PatternTopContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
     return False
 
-def __validate_bottom_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext]) -> bool:
+def __validate_bottom_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern]) -> bool:
     for pattern in patterns:
-        if isinstance(pattern, stellaParser.PatternVarContext) or isinstance(pattern, stellaParser.PatternBottomContext):
+        if isinstance(pattern, syntaxTree.PatternVar):
             return True
     return False
 
-def __validate_type_variable_patterns_exhaustiveness(patterns: list[stellaParser.PatternContext], expected_type: TypeVariable) -> bool:
+def __validate_type_variable_patterns_exhaustiveness(patterns: list[syntaxTree.Pattern], expected_type: TypeVariable) -> bool:
     for pattern in patterns:
         match pattern:
-            case stellaParser.PatternFalseContext():
+            case syntaxTree.PatternFalse():
                 return __validate_bool_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternTrueContext():
+            case syntaxTree.PatternTrue():
                 return __validate_bool_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternIntContext():
+            case syntaxTree.PatternInt():
                 return __validate_nat_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternSuccContext():
+            case syntaxTree.PatternSucc():
                 return __validate_nat_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternVarContext():
+            case syntaxTree.PatternVar():
                 return True
-            case stellaParser.PatternUnitContext():
+            case syntaxTree.PatternUnit():
                 return __validate_unit_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternTupleContext():
+            case syntaxTree.PatternTuple():
                 return __validate_tuple_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternRecordContext():
+            case syntaxTree.PatternRecord():
                 return __validate_record_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternInlContext():
+            case syntaxTree.PatternInl():
                 return __validate_sum_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternInrContext():
+            case syntaxTree.PatternInr():
                 return __validate_sum_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternVariantContext():
+            case syntaxTree.PatternVariant():
                 return __validate_variant_patterns_exhaustiveness(patterns, expected_type)
-            case stellaParser.PatternListContext():
+            case syntaxTree.PatternList():
                 return __validate_list_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternConsContext():
+            case syntaxTree.PatternCons():
                 return __validate_list_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternRefContext():
-                return __validate_ref_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternTopContext():
-                return __validate_top_patterns_exhaustiveness(patterns)
-            case stellaParser.PatternBottomContext():
-                return __validate_bottom_patterns_exhaustiveness(patterns)
     return True
@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from typing import Final
+
+from syntax import syntaxTree
+from type.type import Type
+
+
+class Fingerprint:
+    structure_id: int | None
+    free_variables: frozenset[str]
+
+    def __init__(self, structure_id: int | None, free_variables: frozenset[str]):
+        self.structure_id = structure_id
+        self.free_variables = free_variables
+
+    @property
+    def is_closed(self) -> bool:
+        return self.structure_id is not None and not self.free_variables
+
+
+class InferenceCache:
+    __default_max_size: Final[int] = 1024
+    __default_min_size: Final[int] = 48
+    __cacheable_expressions: Final[tuple[type, ...]] = (syntaxTree.Abstraction, syntaxTree.Application, syntaxTree.Tuple, syntaxTree.Record, syntaxTree.List, syntaxTree.Let, syntaxTree.Match)
+    __impure_expressions: Final[tuple[type, ...]] = (syntaxTree.Throw, syntaxTree.TryWith, syntaxTree.TryCatch, syntaxTree.TryCastAs)
+    max_size: int
+    min_size: int
+    hits: int
+    misses: int
+    _results: OrderedDict[tuple[int, str], Type]
+    _fingerprints: dict[syntaxTree.Node, Fingerprint]
+    _structure_ids: dict[tuple[object, ...], int]
+    _next_structure_id: int
+
+    def __init__(self, max_size: int = __default_max_size, min_size: int = __default_min_size):
+        self.max_size = max_size
+        self.min_size = min_size
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._fingerprints = {}
+        self._structure_ids = {}
+        self._next_structure_id = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def make_key(self, ctx: syntaxTree.Expr, expected_type: Type) -> tuple[int, str] | None:
+        if not isinstance(ctx, self.__cacheable_expressions) or (expected_type and not expected_type.is_known_type):
+            return None
+        if ctx.span.stop - ctx.span.start + 1 < self.min_size:
+            return None
+        fingerprint: Fingerprint = self.fingerprint(ctx)
+        if not fingerprint.is_closed:
+            return None
+        return fingerprint.structure_id, f'{type(expected_type).__name__}:{expected_type.name}' if expected_type else ''
+
+    def get(self, key: tuple[int, str]) -> Type | None:
+        result: Type | None = self._results.get(key)
+        if not result:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def put(self, key: tuple[int, str], result: Type) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last = False)
+
+    def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._results.clear()
+        self._fingerprints.clear()
+        self._structure_ids.clear()
+        self._next_structure_id = 0
+
+    def clear_fingerprints(self) -> None:
+        self._fingerprints.clear()
+        self._structure_ids.clear()
+
+    def fingerprint(self, ctx: syntaxTree.Node) -> Fingerprint:
+        fingerprint: Fingerprint | None = self._fingerprints.get(ctx)
+        if not fingerprint:
+            fingerprint = self._compute_fingerprint(ctx)
+            self._fingerprints[ctx] = fingerprint
+        return fingerprint
+
+    def _compute_fingerprint(self, ctx: syntaxTree.Node) -> Fingerprint:
+        structure: list[object] = [type(ctx)]
+        is_pure: bool = not isinstance(ctx, self.__impure_expressions)
+        free_variables: set[str] = set()
+        for field_name in syntaxTree.get_node_fields(type(ctx)):
+            value: object = getattr(ctx, field_name)
+            for child in value if isinstance(value, list) else (value,):
+                if not isinstance(child, syntaxTree.Node):
+                    structure.append(child)
+                    continue
+                child_fingerprint: Fingerprint = self.fingerprint(child)
+                if child_fingerprint.structure_id is None:
+                    is_pure = False
+                    continue
+                structure.append(-child_fingerprint.structure_id - 1)
+                free_variables |= child_fingerprint.free_variables
+            structure.append(None)
+        if not is_pure:
+            return Fingerprint(None, frozenset())
+        match ctx:
+            case syntaxTree.Var():
+                free_variables.add(ctx.name)
+            case syntaxTree.Abstraction():
+                free_variables -= {param_decl.name for param_decl in ctx.paramDecls}
+            case syntaxTree.Let():
+                free_variables = set().union(*(self.fingerprint(binding.rhs).free_variables for binding in ctx.patternBindings))
+                free_variables |= self.fingerprint(ctx.body).free_variables - self._collect_pattern_variables([binding.pat for binding in ctx.patternBindings])
+            case syntaxTree.LetRec():
+                free_variables -= self._collect_pattern_variables([binding.pat for binding in ctx.patternBindings])
+            case syntaxTree.Match():
+                free_variables = set(self.fingerprint(ctx.expr_).free_variables)
+                for case_context in ctx.cases:
+                    free_variables |= self.fingerprint(case_context.expr_).free_variables - self._collect_pattern_variables([case_context.pattern_])
+        structure_key: tuple[object, ...] = tuple(structure)
+        structure_id: int | None = self._structure_ids.get(structure_key)
+        if structure_id is None:
+            structure_id = self._structure_ids[structure_key] = self._next_structure_id
+            self._next_structure_id += 1
+        return Fingerprint(structure_id, frozenset(free_variables))
+
+    @classmethod
+    def _collect_pattern_variables(cls, patterns: list[syntaxTree.Pattern]) -> set[str]:
+        variables: set[str] = set()
+        stack: list[syntaxTree.Node] = list(patterns)
+        while stack:
+            pattern: syntaxTree.Node = stack.pop()
+            if isinstance(pattern, syntaxTree.PatternVar):
+                variables.add(pattern.name)
+            elif pattern is not None:
+                stack.extend(pattern.iter_children())
+        return variables
@@ -1,7 +1,7 @@
 from abc import ABCMeta, abstractmethod
-from antlr4 import ParserRuleContext
 from typing import Self
 
+from error.sourceSpan import SourceSpan
 from utils.singleton import SingletonABCMeta
 
 
@@ -26,6 +26,9 @@ class Type(metaclass = ABCMeta):
     def get_first_unresolved_type(self) -> Self:
         return None
 
+    def contains_error_type(self) -> bool:
+        return False
+
 
 class UnknownType(Type, metaclass = SingletonABCMeta):
 
@@ -47,6 +50,25 @@ class UnknownType(Type, metaclass = SingletonABCMeta):
         return isinstance(other, UnknownType)
 
 
+class ErrorType(Type, metaclass = SingletonABCMeta):
+
+    def __init__(self):
+        super().__init__(False)
+
+    @property
+    def name(self) -> str:
+        return 'Error'
+
+    def is_subtype_of(self, other: Type, subtyping_enabled: bool) -> bool:
+        return True
+
+    def contains_error_type(self) -> bool:
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Type)
+
+
 class BoolType(Type, metaclass = SingletonABCMeta):
 
     def __init__(self):
@@ -124,6 +146,9 @@ class FunctionalType(Type):
             return param_first_unresolved_type
         return self.ret.get_first_unresolved_type()
 
+    def contains_error_type(self) -> bool:
+        return self.param.contains_error_type() or self.ret.contains_error_type()
+
     def with_substitution(self, types: dict[Type, Type]) -> Self:
         new_param: Type = self.param
         new_ret: Type = self.ret
@@ -226,6 +251,9 @@ class TupleType(Type):
                 return first_unresolved_type
         return None
 
+    def contains_error_type(self) -> bool:
+        return any(tuple_type.contains_error_type() for tuple_type in self.types)
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -279,6 +307,9 @@ class RecordType(Type):
                 return first_unresolved_type
         return None
 
+    def contains_error_type(self) -> bool:
+        return any(record_type.contains_error_type() for record_type in self.types)
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -329,6 +360,9 @@ class SumType(Type):
             return left_first_unresolved_type
         return self.right.get_first_unresolved_type()
 
+    def contains_error_type(self) -> bool:
+        return self.left.contains_error_type() or self.right.contains_error_type()
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -382,6 +416,9 @@ class VariantType(Type):
                 return first_unresolved_type
         return None
 
+    def contains_error_type(self) -> bool:
+        return any(variant_type.contains_error_type() for variant_type in self.types)
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -427,6 +464,9 @@ class ListType(Type):
     def get_first_unresolved_type(self) -> Type:
         return self.type.get_first_unresolved_type()
 
+    def contains_error_type(self) -> bool:
+        return self.type.contains_error_type()
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -465,6 +505,9 @@ class RefType(Type):
     def get_first_unresolved_type(self) -> Type:
         return self.inner_type.get_first_unresolved_type()
 
+    def contains_error_type(self) -> bool:
+        return self.inner_type.contains_error_type()
+
     def __eq__(self, other: object) -> bool:
         if not self.is_known_type or (isinstance(other, Type) and not other.is_known_type):
             return True
@@ -520,6 +563,14 @@ class TypeVariable(Type):
         self.index = TypeVariable._count
         TypeVariable._count += 1
 
+    @classmethod
+    def get_count(cls) -> int:
+        return TypeVariable._count
+
+    @classmethod
+    def reset_count(cls, count: int = 0) -> None:
+        TypeVariable._count = count
+
     @property
     def name(self) -> str:
         return f'?T{self.index}'
@@ -534,7 +585,7 @@ class TypeVariable(Type):
     def replace(self, what: Self, to: Type) -> Type:
         return to if self == what else self
 
-    def contains_in(self, type: Type, expression: ParserRuleContext) -> bool:
+    def contains_in(self, type: Type, expression: SourceSpan) -> bool:
         match type:
             case FunctionalType():
                 result: bool = self.contains_in(type.param, expression) or self.contains_in(type.ret, expression)
@@ -616,6 +667,9 @@ class UniversalWrapperType(Type):
     def name(self) -> str:
         return f'[{", ".join([type_param.name for type_param in self.type_params])}]{self.inner_type.name}'
 
+    def contains_error_type(self) -> bool:
+        return self.inner_type.contains_error_type()
+
     def is_subtype_of(self, other: Type, subtyping_enabled: bool) -> bool:
         if self == other:
             return True
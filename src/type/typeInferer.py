@@ -1,13 +1,12 @@
-import sys
-
-from antlr4 import ParserRuleContext
-
-from antlr.stellaParser import stellaParser
 from error.errorKind import ErrorKind
 from error.errorManager import ErrorManager
+from extension.extensionFeatures import ExtensionFeatures
 from extension.extensionManager import ExtensionManager
+from syntax import syntaxTree
+from type.checkBudget import CheckBudget
 from type.exhaustivenessValidator import validate_patterns_exhaustiveness
-from type.type import BoolType, BottomType, FunctionalType, GenericType, ListType, NatType, RecordType, RefType, SumType, TopType, TupleType, Type, TypeVariable, UnitType, UniversalWrapperType, UnknownType, VariantType
+from type.inferenceCache import InferenceCache
+from type.type import BoolType, BottomType, ErrorType, FunctionalType, GenericType, ListType, NatType, RecordType, RefType, SumType, TopType, TupleType, Type, TypeVariable, UnitType, UniversalWrapperType, UnknownType, VariantType
 from type.typeContext import TypeContext
 from type.typeVisitor import get_type
 from unification.unifySolver import UnifySolver
@@ -16,135 +15,162 @@ from unification.unifySolver import UnifySolver
 class TypeInferer:
     _error_manager: ErrorManager
     _extension_manager: ExtensionManager
+    _features: ExtensionFeatures
     _unify_solver: UnifySolver
+    _inference_cache: InferenceCache
     _type_context: TypeContext
+    _check_budget: CheckBudget
 
-    def __init__(self, error_manager: ErrorManager, extension_manager: ExtensionManager, unify_solver: UnifySolver, parent_type_context: TypeContext = None):
+    def __init__(self, error_manager: ErrorManager, extension_manager: ExtensionManager, unify_solver: UnifySolver, inference_cache: InferenceCache = None, parent_type_context: TypeContext = None, check_budget: CheckBudget = None):
         self._error_manager = error_manager
         self._extension_manager = extension_manager
+        self._features = extension_manager.features
         self._unify_solver = unify_solver
+        self._inference_cache = inference_cache
         self._type_context = TypeContext(parent_type_context)
+        self._check_budget = check_budget
+
+    def visit_expression(self, ctx: syntaxTree.Expr, expected_type: Type) -> Type:
+        if not self._check_budget:
+            return self._infer_expression(ctx, expected_type)
+        self._check_budget.charge_node()
+        return self._check_budget.check_type(self._infer_expression(ctx, expected_type))
+
+    def _infer_expression(self, ctx: syntaxTree.Expr, expected_type: Type) -> Type:
+        cache_key: tuple[int, str] | None = self._get_cache_key(ctx, expected_type)
+        if not cache_key:
+            return self._visit_expression(ctx, expected_type)
+        cached_type: Type | None = self._inference_cache.get(cache_key)
+        if cached_type:
+            return cached_type
+        errors_count: int = len(self._error_manager.errors) if self._error_manager else 0
+        actual_type: Type = self._visit_expression(ctx, expected_type)
+        if actual_type and not actual_type.contains_error_type() and errors_count == (len(self._error_manager.errors) if self._error_manager else 0):
+            self._inference_cache.put(cache_key, actual_type)
+        return actual_type
 
-    def visit_expression(self, ctx: stellaParser.ExprContext, expected_type: Type) -> Type:
+    def _get_cache_key(self, ctx: syntaxTree.Expr, expected_type: Type) -> tuple[int, str] | None:
+        if not self._inference_cache or not self._features.is_inference_cacheable:
+            return None
+        return self._inference_cache.make_key(ctx, expected_type)
+
+    def _visit_expression(self, ctx: syntaxTree.Expr, expected_type: Type) -> Type:
         match ctx:
-            case stellaParser.ConstFalseContext():
+            case syntaxTree.ConstFalse():
                 actual_type: BoolType = self._visit_const_false(ctx)
-            case stellaParser.ConstTrueContext():
+            case syntaxTree.ConstTrue():
                 actual_type: BoolType = self._visit_const_true(ctx)
-            case stellaParser.ConstIntContext():
+            case syntaxTree.ConstInt():
                 actual_type: NatType = self._visit_const_int(ctx)
-            case stellaParser.IsZeroContext():
+            case syntaxTree.IsZero():
                 actual_type: BoolType = self._visit_is_zero(ctx)
-            case stellaParser.SuccContext():
+            case syntaxTree.Succ():
                 actual_type: NatType = self._visit_succ(ctx)
-            case stellaParser.PredContext():
+            case syntaxTree.Pred():
                 actual_type: NatType = self._visit_pred(ctx)
-            case stellaParser.IfContext():
+            case syntaxTree.If():
                 actual_type: Type = self._visit_if(ctx, expected_type)
-            case stellaParser.AbstractionContext():
+            case syntaxTree.Abstraction():
                 actual_type: FunctionalType = self._visit_abstraction(ctx, expected_type)
-            case stellaParser.TypeAbstractionContext():
+            case syntaxTree.TypeAbstraction():
                 actual_type: UniversalWrapperType = self._visit_type_abstraction(ctx, expected_type)
-            case stellaParser.VarContext():
+            case syntaxTree.Var():
                 actual_type: Type = self._visit_var(ctx, expected_type)
-            case stellaParser.ApplicationContext():
+            case syntaxTree.Application():
                 actual_type: Type = self._visit_application(ctx, expected_type)
-            case stellaParser.TypeApplicationContext():
+            case syntaxTree.TypeApplication():
                 actual_type: FunctionalType = self._visit_type_application(ctx, expected_type)
-            case stellaParser.ConstUnitContext():
+            case syntaxTree.ConstUnit():
                 actual_type: UnitType = self._visit_const_unit(ctx)
-            case stellaParser.SequenceContext():
+            case syntaxTree.Sequence():
                 actual_type: Type = self._visit_sequence(ctx, expected_type)
-            case stellaParser.TypeAscContext():
+            case syntaxTree.TypeAsc():
                 actual_type: Type = self._visit_type_asc(ctx, expected_type)
-            case stellaParser.LetContext():
+            case syntaxTree.Let():
                 actual_type: Type = self._visit_let(ctx, expected_type)
-            case stellaParser.TupleContext():
+            case syntaxTree.Tuple():
                 actual_type: TupleType = self._visit_tuple(ctx, expected_type)
-            case stellaParser.DotTupleContext():
+            case syntaxTree.DotTuple():
                 actual_type: Type = self._visit_dot_tuple(ctx, expected_type)
-            case stellaParser.RecordContext():
+            case syntaxTree.Record():
                 actual_type: RecordType = self._visit_record(ctx, expected_type)
-            case stellaParser.DotRecordContext():
+            case syntaxTree.DotRecord():
                 actual_type: Type = self._visit_dot_record(ctx, expected_type)
-            case stellaParser.MatchContext():
+            case syntaxTree.Match():
                 actual_type: Type = self._visit_match(ctx, expected_type)
-            case stellaParser.PatternContext():
+            case syntaxTree.Pattern():
                 actual_type: Type = self._visit_pattern(ctx, expected_type)
-            case stellaParser.InlContext():
+            case syntaxTree.Inl():
                 actual_type: SumType = self._visit_inl(ctx, expected_type)
-            case stellaParser.InrContext():
+            case syntaxTree.Inr():
                 actual_type: SumType = self._visit_inr(ctx, expected_type)
-            case stellaParser.VariantContext():
+            case syntaxTree.Variant():
                 actual_type: SumType = self._visit_variant(ctx, expected_type)
-            case stellaParser.NatRecContext():
+            case syntaxTree.NatRec():
                 actual_type: Type = self._visit_nat_rec(ctx, expected_type)
-            case stellaParser.FixContext():
+            case syntaxTree.Fix():
                 actual_type: Type = self._visit_fix(ctx, expected_type)
-            case stellaParser.ListContext():
+            case syntaxTree.List():
                 actual_type: ListType = self._visit_list(ctx, expected_type)
-            case stellaParser.ConsListContext():
+            case syntaxTree.ConsList():
                 actual_type: ListType = self._visit_cons_list(ctx, expected_type)
-            case stellaParser.IsEmptyContext():
+            case syntaxTree.IsEmpty():
                 actual_type: BoolType = self._visit_is_empty(ctx, expected_type)
-            case stellaParser.HeadContext():
+            case syntaxTree.Head():
                 actual_type: Type = self._visit_head(ctx, expected_type)
-            case stellaParser.TailContext():
+            case syntaxTree.Tail():
                 actual_type: ListType = self._visit_tail(ctx, expected_type)
-            case stellaParser.RefContext():
+            case syntaxTree.Ref():
                 actual_type: RefType = self._visit_ref(ctx, expected_type)
-            case stellaParser.ConstMemoryContext():
+            case syntaxTree.ConstMemory():
                 actual_type: Type = self._visit_const_memory(ctx, expected_type)
-            case stellaParser.DerefContext():
+            case syntaxTree.Deref():
                 actual_type: Type = self._visit_deref(ctx, expected_type)
-            case stellaParser.AssignContext():
+            case syntaxTree.Assign():
                 actual_type: UnitType = self._visit_assign(ctx, expected_type)
-            case stellaParser.PanicContext():
+            case syntaxTree.Panic():
                 actual_type: Type = self._visit_panic(ctx, expected_type)
-            case stellaParser.ThrowContext():
+            case syntaxTree.Throw():
                 actual_type: Type = self._visit_throw(ctx, expected_type)
-            case stellaParser.TryWithContext():
+            case syntaxTree.TryWith():
                 actual_type: Type = self._visit_try_with(ctx, expected_type)
-            case stellaParser.TryCatchContext():
+            case syntaxTree.TryCatch():
                 actual_type: Type = self._visit_try_catch(ctx, expected_type)
-            case stellaParser.TypeCastContext():
+            case syntaxTree.TypeCast():
                 actual_type: Type = self._visit_type_cast(ctx, expected_type)
-            case stellaParser.TerminatingSemicolonContext():
-                actual_type: Type = self.visit_expression(ctx.expr_, expected_type)
-            case stellaParser.ParenthesisedExprContext():
-                actual_type: Type = self.visit_expression(ctx.expr_, expected_type)
             case _:
-                sys.stderr.write(f'Unsupported syntax for {type(ctx).__name__}\n')
                 actual_type: Type = None
-        if not actual_type:
-            return None
-        return self._validate_types(actual_type, expected_type, ctx)
+        if actual_type:
+            actual_type = self._validate_types(actual_type, expected_type, ctx)
+        if not actual_type and self._error_manager and self._error_manager.is_recovery_mode:
+            return ErrorType()
+        return actual_type
 
-    def _visit_const_false(self, ctx: stellaParser.ConstFalseContext) -> BoolType:
+    def _visit_const_false(self, ctx: syntaxTree.ConstFalse) -> BoolType:
         return BoolType()
 
-    def _visit_const_true(self, ctx: stellaParser.ConstTrueContext) -> BoolType:
+    def _visit_const_true(self, ctx: syntaxTree.ConstTrue) -> BoolType:
         return BoolType()
 
-    def _visit_const_int(self, ctx: stellaParser.ConstIntContext) -> NatType:
+    def _visit_const_int(self, ctx: syntaxTree.ConstInt) -> NatType:
         return NatType()
 
-    def _visit_is_zero(self, ctx: stellaParser.IsZeroContext) -> BoolType:
+    def _visit_is_zero(self, ctx: syntaxTree.IsZero) -> BoolType:
         if not isinstance(self.visit_expression(ctx.n, NatType()), NatType):
             return None
         return BoolType()
 
-    def _visit_succ(self, ctx: stellaParser.SuccContext) -> NatType:
+    def _visit_succ(self, ctx: syntaxTree.Succ) -> NatType:
         if not isinstance(self.visit_expression(ctx.n, NatType()), NatType):
             return None
         return NatType()
 
-    def _visit_pred(self, ctx: stellaParser.PredContext) -> NatType:
+    def _visit_pred(self, ctx: syntaxTree.Pred) -> NatType:
         if not isinstance(self.visit_expression(ctx.n, NatType()), NatType):
             return None
         return NatType()
 
-    def _visit_if(self, ctx: stellaParser.IfContext, expected_type: Type) -> Type:
+    def _visit_if(self, ctx: syntaxTree.If, expected_type: Type) -> Type:
         condition_type: Type = self.visit_expression(ctx.condition, BoolType())
         if not condition_type:
             return None
@@ -160,7 +186,7 @@ class TypeInferer:
             return None
         return else_type
 
-    def _visit_abstraction(self, ctx: stellaParser.AbstractionContext, expected_type: Type) -> FunctionalType:
+    def _visit_abstraction(self, ctx: syntaxTree.Abstraction, expected_type: Type) -> FunctionalType:
         if expected_type and not (isinstance(expected_type, FunctionalType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             functional_type: FunctionalType = self._visit_abstraction(ctx, None)
             if not functional_type:
@@ -168,12 +194,12 @@ class TypeInferer:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_LAMBDA, expected_type, functional_type, ctx)
             return None
-        param_type: Type = get_type(ctx._paramDecl.paramType)
+        param_type: Type = get_type(ctx.paramDecls[0].paramType)
         if not self._is_known_type(param_type):
             return None
         functional_type_context: TypeContext = TypeContext(self._type_context)
-        functional_type_context.save_variable_type(ctx._paramDecl.name.text, param_type)
-        functional_type_inferer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, functional_type_context)
+        functional_type_context.save_variable_type(ctx.paramDecls[0].name, param_type)
+        functional_type_inferer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, functional_type_context, self._check_budget)
         match expected_type:
             case TypeVariable():
                 target_type: TypeVariable = TypeVariable()
@@ -188,7 +214,7 @@ class TypeInferer:
         actual_type: Type = FunctionalType(param_type, return_type)
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_type_abstraction(self, ctx: stellaParser.TypeAbstractionContext, expected_type: Type) -> UniversalWrapperType:
+    def _visit_type_abstraction(self, ctx: syntaxTree.TypeAbstraction, expected_type: Type) -> UniversalWrapperType:
         match expected_type:
             case UniversalWrapperType():
                 target_type: FunctionalType = expected_type.inner_type
@@ -201,32 +227,32 @@ class TypeInferer:
                 if self._error_manager:
                     self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, expected_type, actual_type, ctx)
                 return None
-        type_params: list[GenericType] = [GenericType(generic.text) for generic in ctx.generics]
+        type_params: list[GenericType] = [GenericType(generic) for generic in ctx.generics]
         functional_type_context: TypeContext = TypeContext(self._type_context)
         for type_param in type_params:
             functional_type_context.save_generic_type(type_param.name, type_param)
-        functional_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, functional_type_context)
+        functional_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, functional_type_context, self._check_budget)
         inner_type: FunctionalType = functional_type_inferrer.visit_expression(ctx.expr_, target_type)
         if not inner_type:
             return None
         actual_type: UniversalWrapperType = UniversalWrapperType(type_params, inner_type)
         return actual_type
 
-    def _visit_var(self, ctx: stellaParser.VarContext, expected_type: Type) -> Type:
-        actual_type: Type | None = self._type_context.resolve_variable_type(ctx.name.text)
+    def _visit_var(self, ctx: syntaxTree.Var, expected_type: Type) -> Type:
+        actual_type: Type | None = self._type_context.resolve_variable_type(ctx.name)
         if not actual_type:
-            actual_type: FunctionalType | None = self._type_context.resolve_functional_type(ctx.name.text)
+            actual_type: FunctionalType | None = self._type_context.resolve_functional_type(ctx.name)
         if not actual_type:
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_UNDEFINED_VARIABLE, ctx.name.text)
+                self._error_manager.register_error(ErrorKind.ERROR_UNDEFINED_VARIABLE, ctx.name)
             return None
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_application(self, ctx: stellaParser.ApplicationContext, expected_type: Type) -> Type:
+    def _visit_application(self, ctx: syntaxTree.Application, expected_type: Type) -> Type:
         functional_type: Type = self.visit_expression(ctx.fun, None)
         if not functional_type:
             return None
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             param_type: Type = self.visit_expression(ctx.args[0], None)
             if not param_type:
                 return None
@@ -242,7 +268,7 @@ class TypeInferer:
         actual_type: Type = functional_type.ret
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_type_application(self, ctx: stellaParser.TypeApplicationContext, expected_type: Type) -> FunctionalType:
+    def _visit_type_application(self, ctx: syntaxTree.TypeApplication, expected_type: Type) -> FunctionalType:
         functional_type: FunctionalType = self.visit_expression(ctx.fun, None)
         if not functional_type:
             return None
@@ -264,36 +290,36 @@ class TypeInferer:
             return None
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_const_unit(self, ctx: stellaParser.ConstUnitContext) -> UnitType:
+    def _visit_const_unit(self, ctx: syntaxTree.ConstUnit) -> UnitType:
         return UnitType()
 
-    def _visit_sequence(self, ctx: stellaParser.SequenceContext, expected_type: Type) -> Type:
+    def _visit_sequence(self, ctx: syntaxTree.Sequence, expected_type: Type) -> Type:
         if not self.visit_expression(ctx.expr1, UnitType()):
             return None
         return self.visit_expression(ctx.expr2, expected_type)
 
-    def _visit_type_asc(self, ctx: stellaParser.TypeAscContext, expected_type: Type) -> Type:
+    def _visit_type_asc(self, ctx: syntaxTree.TypeAsc, expected_type: Type) -> Type:
         target_type: Type = get_type(ctx.type_)
         if not self._is_known_type(target_type):
             return None
-        actual_type: Type = self.visit_expression(ctx.expr_, expected_type if expected_type and not self._extension_manager.is_type_reconstruction() else target_type)
+        actual_type: Type = self.visit_expression(ctx.expr_, expected_type if expected_type and not self._features.is_type_reconstruction else target_type)
         if not actual_type:
             return None
         return self._validate_types(target_type, expected_type, ctx)
 
-    def _visit_let(self, ctx: stellaParser.LetContext, expected_type: Type) -> Type:
-        expression_type: Type = self.visit_expression(ctx.patternBinding(0).rhs, None)
+    def _visit_let(self, ctx: syntaxTree.Let, expected_type: Type) -> Type:
+        expression_type: Type = self.visit_expression(ctx.patternBindings[0].rhs, None)
         if not expression_type:
             return None
-        expression_context: stellaParser.PatternContext = ctx.patternBinding(0).pat
-        while expression_context and not isinstance(expression_context, stellaParser.PatternVarContext):
+        expression_context: syntaxTree.Pattern = ctx.patternBindings[0].pat
+        while expression_context and not isinstance(expression_context, syntaxTree.PatternVar):
             expression_context = expression_context.pattern_
         let_type_context: TypeContext = TypeContext(self._type_context)
-        let_type_context.save_variable_type(expression_context.name.text, expression_type)
-        let_type_inferer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, let_type_context)
+        let_type_context.save_variable_type(expression_context.name, expression_type)
+        let_type_inferer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, let_type_context, self._check_budget)
         return let_type_inferer.visit_expression(ctx.body, expected_type)
 
-    def _visit_tuple(self, ctx: stellaParser.TupleContext, expected_type: Type) -> TupleType:
+    def _visit_tuple(self, ctx: syntaxTree.Tuple, expected_type: Type) -> TupleType:
         if expected_type and not (isinstance(expected_type, TupleType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             tuple_type: TupleType = self._visit_tuple(ctx, None)
             if not tuple_type:
@@ -308,35 +334,35 @@ class TypeInferer:
                 return None
             types.append(expression_type)
         actual_type: TupleType = TupleType(types)
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             self._unify_solver.add_constraint(expected_type, actual_type, ctx)
         return actual_type
 
-    def _visit_dot_tuple(self, ctx: stellaParser.DotTupleContext, expected_type: Type) -> Type:
+    def _visit_dot_tuple(self, ctx: syntaxTree.DotTuple, expected_type: Type) -> Type:
         tuple_type: Type = self.visit_expression(ctx.expr_, None)
         if not tuple_type:
             return None
-        if self._extension_manager.is_type_reconstruction():
-            if not ctx.index.text.isnumeric() or int(ctx.index.text) <= 0:
+        if self._features.is_type_reconstruction:
+            if not ctx.index.isnumeric() or int(ctx.index) <= 0:
                 if self._error_manager:
-                    self._error_manager.register_error(ErrorKind.ERROR_TUPLE_INDEX_OUT_OF_BOUNDS, ctx.index.text, -1)
+                    self._error_manager.register_error(ErrorKind.ERROR_TUPLE_INDEX_OUT_OF_BOUNDS, ctx.index, -1)
                 return None
-            tuple_arity: int = tuple_type.arity if isinstance(tuple_type, TupleType) else int(ctx.index.text)
+            tuple_arity: int = tuple_type.arity if isinstance(tuple_type, TupleType) else int(ctx.index)
             target_type: TupleType = TupleType([TypeVariable() for _ in range(tuple_arity)])
-            actual_type: Type = target_type.types[int(ctx.index.text) - 1]
+            actual_type: Type = target_type.types[int(ctx.index) - 1]
             return self._validate_types(actual_type, expected_type, ctx)
         if not isinstance(tuple_type, TupleType):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_NOT_A_TUPLE, tuple_type, ctx)
             return None
-        if not ctx.index.text.isnumeric() or int(ctx.index.text) <= 0 or int(ctx.index.text) > tuple_type.arity:
+        if not ctx.index.isnumeric() or int(ctx.index) <= 0 or int(ctx.index) > tuple_type.arity:
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_TUPLE_INDEX_OUT_OF_BOUNDS, ctx.index.text, tuple_type.arity)
+                self._error_manager.register_error(ErrorKind.ERROR_TUPLE_INDEX_OUT_OF_BOUNDS, ctx.index, tuple_type.arity)
             return None
-        actual_type: Type = tuple_type.types[int(ctx.index.text) - 1]
+        actual_type: Type = tuple_type.types[int(ctx.index) - 1]
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_record(self, ctx: stellaParser.RecordContext, expected_type: Type) -> RecordType:
+    def _visit_record(self, ctx: syntaxTree.Record, expected_type: Type) -> RecordType:
         if expected_type and not (isinstance(expected_type, RecordType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             record_type: RecordType = self._visit_record(ctx, None)
             if not record_type:
@@ -347,34 +373,34 @@ class TypeInferer:
         labels: list[str] = []
         types: list[Type] = []
         for binding in ctx.bindings:
-            labels.append(binding.name.text)
+            labels.append(binding.name)
             type: Type = self.visit_expression(binding.rhs, None)
             if not type:
                 return None
             types.append(type)
         actual_type: RecordType = RecordType(labels, types)
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             self._unify_solver.add_constraint(expected_type, actual_type, ctx)
         return actual_type
 
-    def _visit_dot_record(self, ctx: stellaParser.DotRecordContext, expected_type: Type) -> Type:
+    def _visit_dot_record(self, ctx: syntaxTree.DotRecord, expected_type: Type) -> Type:
         record_type: Type = self.visit_expression(ctx.expr_, None)
         if not record_type:
             return None
-        if self._extension_manager.is_type_reconstruction() and isinstance(record_type, TypeVariable):
+        if self._features.is_type_reconstruction and isinstance(record_type, TypeVariable):
             return TypeVariable()
         if not isinstance(record_type, RecordType):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_NOT_A_RECORD, record_type, ctx)
             return None
-        if ctx.label.text not in record_type.labels:
+        if ctx.label not in record_type.labels:
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_FIELD_ACCESS, ctx.label.text, record_type)
+                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_FIELD_ACCESS, ctx.label, record_type)
             return None
-        actual_type: Type = record_type.types[record_type.labels.index(ctx.label.text)]
+        actual_type: Type = record_type.types[record_type.labels.index(ctx.label)]
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_match(self, ctx: stellaParser.MatchContext, expected_type: Type) -> Type:
+    def _visit_match(self, ctx: syntaxTree.Match, expected_type: Type) -> Type:
         expression_type: Type = self.visit_expression(ctx.expr_, None)
         if not expression_type:
             return None
@@ -382,11 +408,11 @@ class TypeInferer:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_ILLEGAL_EMPTY_MATCHING, ctx)
             return None
-        patterns: list[stellaParser.PatternContext] = [case_context.pattern_ for case_context in ctx.cases]
+        patterns: list[syntaxTree.Pattern] = [case_context.pattern_ for case_context in ctx.cases]
         case_types: list[Type] = []
         for case_context in ctx.cases:
             case_type_context: TypeContext = TypeContext(self._type_context)
-            case_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, case_type_context)
+            case_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, case_type_context, self._check_budget)
             if not case_type_inferrer._visit_pattern(case_context.pattern_, expression_type):
                 return None
             case_types.append(case_type_inferrer.visit_expression(case_context.expr_, expected_type))
@@ -402,64 +428,62 @@ class TypeInferer:
                 return None
         return actual_type
 
-    def _visit_pattern(self, ctx: stellaParser.PatternContext, expected_type: Type) -> Type:
+    def _visit_pattern(self, ctx: syntaxTree.Pattern, expected_type: Type) -> Type:
         match ctx:
-            case stellaParser.PatternFalseContext():
+            case syntaxTree.PatternFalse():
                 actual_type: BoolType = self._visit_false_pattern(ctx)
-            case stellaParser.PatternTrueContext():
+            case syntaxTree.PatternTrue():
                 actual_type: BoolType = self._visit_true_pattern(ctx)
-            case stellaParser.PatternIntContext():
+            case syntaxTree.PatternInt():
                 actual_type: NatType = self._visit_int_pattern(ctx)
-            case stellaParser.PatternSuccContext():
+            case syntaxTree.PatternSucc():
                 actual_type: NatType = self._visit_succ_pattern(ctx)
-            case stellaParser.PatternVarContext():
+            case syntaxTree.PatternVar():
                 actual_type: Type = self._visit_var_pattern(ctx, expected_type)
-            case stellaParser.PatternUnitContext():
+            case syntaxTree.PatternUnit():
                 actual_type: UnitType = self._visit_unit_pattern(ctx)
-            case stellaParser.PatternAscContext():
+            case syntaxTree.PatternAsc():
                 actual_type: Type = self._visit_asc_pattern(ctx, expected_type)
-            case stellaParser.PatternTupleContext():
+            case syntaxTree.PatternTuple():
                 actual_type: TupleType = self._visit_tuple_pattern(ctx, expected_type)
-            case stellaParser.PatternRecordContext():
+            case syntaxTree.PatternRecord():
                 actual_type: RecordType = self._visit_record_pattern(ctx, expected_type)
-            case stellaParser.PatternInlContext():
+            case syntaxTree.PatternInl():
                 actual_type: SumType = self._visit_inl_pattern(ctx, expected_type)
-            case stellaParser.PatternInrContext():
+            case syntaxTree.PatternInr():
                 actual_type: SumType = self._visit_inr_pattern(ctx, expected_type)
-            case stellaParser.PatternVariantContext():
+            case syntaxTree.PatternVariant():
                 actual_type: VariantType = self._visit_variant_pattern(ctx, expected_type)
-            case stellaParser.PatternListContext():
+            case syntaxTree.PatternList():
                 actual_type: ListType = self._visit_list_pattern(ctx, expected_type)
-            case stellaParser.PatternConsContext():
+            case syntaxTree.PatternCons():
                 actual_type: ListType = self._visit_cons_pattern(ctx, expected_type)
-            case stellaParser.ParenthesisedPatternContext():
-                actual_type: Type = self._visit_pattern(ctx.pattern_, expected_type)
             case _:
                 actual_type: Type = None
         if not actual_type:
             return None
         return self._validate_patterns(actual_type, expected_type, ctx)
 
-    def _visit_false_pattern(self, ctx: stellaParser.PatternFalseContext) -> BoolType:
+    def _visit_false_pattern(self, ctx: syntaxTree.PatternFalse) -> BoolType:
         return BoolType()
 
-    def _visit_true_pattern(self, ctx: stellaParser.PatternTrueContext) -> BoolType:
+    def _visit_true_pattern(self, ctx: syntaxTree.PatternTrue) -> BoolType:
         return BoolType()
 
-    def _visit_int_pattern(self, ctx: stellaParser.PatternIntContext) -> NatType:
+    def _visit_int_pattern(self, ctx: syntaxTree.PatternInt) -> NatType:
         return NatType()
 
-    def _visit_succ_pattern(self, ctx: stellaParser.PatternSuccContext) -> NatType:
+    def _visit_succ_pattern(self, ctx: syntaxTree.PatternSucc) -> NatType:
         return NatType()
 
-    def _visit_var_pattern(self, ctx: stellaParser.PatternVarContext, expected_type: Type) -> Type:
-        self._type_context.save_variable_type(ctx.name.text, expected_type)
+    def _visit_var_pattern(self, ctx: syntaxTree.PatternVar, expected_type: Type) -> Type:
+        self._type_context.save_variable_type(ctx.name, expected_type)
         return expected_type
 
-    def _visit_unit_pattern(self, ctx: stellaParser.PatternUnitContext) -> UnitType:
+    def _visit_unit_pattern(self, ctx: syntaxTree.PatternUnit) -> UnitType:
         return UnitType()
 
-    def _visit_asc_pattern(self, ctx: stellaParser.PatternAscContext, expected_type: Type) -> Type:
+    def _visit_asc_pattern(self, ctx: syntaxTree.PatternAsc, expected_type: Type) -> Type:
         target_type: Type = get_type(ctx.type_)
         if not self._is_known_type(target_type):
             return None
@@ -470,7 +494,7 @@ class TypeInferer:
             return None
         return self._visit_pattern(ctx.pattern_, actual_type)
 
-    def _visit_tuple_pattern(self, ctx: stellaParser.PatternTupleContext, expected_type: Type) -> TupleType:
+    def _visit_tuple_pattern(self, ctx: syntaxTree.PatternTuple, expected_type: Type) -> TupleType:
         if expected_type and not ((isinstance(expected_type, TupleType) and len(ctx.patterns) == len(expected_type.types)) or isinstance(expected_type, TopType)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
@@ -479,18 +503,18 @@ class TypeInferer:
             self._visit_pattern(tuple_pattern, expected_type.types[index])
         return expected_type
 
-    def _visit_record_pattern(self, ctx: stellaParser.PatternRecordContext, expected_type: Type) -> RecordType:
-        if expected_type and not ((isinstance(expected_type, RecordType) and {record_pattern.label.text for record_pattern in ctx.patterns} == set(expected_type.labels)) or isinstance(expected_type, TopType)):
+    def _visit_record_pattern(self, ctx: syntaxTree.PatternRecord, expected_type: Type) -> RecordType:
+        if expected_type and not ((isinstance(expected_type, RecordType) and {record_pattern.label for record_pattern in ctx.patterns} == set(expected_type.labels)) or isinstance(expected_type, TopType)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
             return None
         labels_indices: dict[str, int] = {label: index for index, label in enumerate(expected_type.labels)}
         for labelled_pattern in ctx.patterns:
-            label_type: Type = expected_type.types[labels_indices[labelled_pattern.label.text]]
+            label_type: Type = expected_type.types[labels_indices[labelled_pattern.label]]
             self._visit_pattern(labelled_pattern.pattern_, label_type)
         return expected_type
 
-    def _visit_inl_pattern(self, ctx: stellaParser.PatternInlContext, expected_type: Type) -> SumType:
+    def _visit_inl_pattern(self, ctx: syntaxTree.PatternInl, expected_type: Type) -> SumType:
         if expected_type and not (isinstance(expected_type, SumType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
@@ -510,7 +534,7 @@ class TypeInferer:
             return None
         return expected_type
 
-    def _visit_inr_pattern(self, ctx: stellaParser.PatternInrContext, expected_type: Type) -> SumType:
+    def _visit_inr_pattern(self, ctx: syntaxTree.PatternInr, expected_type: Type) -> SumType:
         if expected_type and not (isinstance(expected_type, SumType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
@@ -530,18 +554,18 @@ class TypeInferer:
             return None
         return expected_type
 
-    def _visit_variant_pattern(self, ctx: stellaParser.PatternVariantContext, expected_type: Type) -> VariantType:
-        if expected_type and not ((isinstance(expected_type, VariantType) and ctx.label.text in expected_type.labels) or isinstance(expected_type, TopType)):
+    def _visit_variant_pattern(self, ctx: syntaxTree.PatternVariant, expected_type: Type) -> VariantType:
+        if expected_type and not ((isinstance(expected_type, VariantType) and ctx.label in expected_type.labels) or isinstance(expected_type, TopType)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
             return None
-        expression_type: Type = expected_type.types[expected_type.labels.index(ctx.label.text)]
+        expression_type: Type = expected_type.types[expected_type.labels.index(ctx.label)]
         actual_type: Type = self._visit_pattern(ctx.pattern_, expression_type)
         if not actual_type:
             return None
         return expected_type
 
-    def _visit_list_pattern(self, ctx: stellaParser.PatternListContext, expected_type: Type) -> ListType:
+    def _visit_list_pattern(self, ctx: syntaxTree.PatternList, expected_type: Type) -> ListType:
         if expected_type and not (isinstance(expected_type, ListType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
@@ -560,7 +584,7 @@ class TypeInferer:
             self._visit_pattern(list_pattern, list_type.type)
         return expected_type
 
-    def _visit_cons_pattern(self, ctx: stellaParser.PatternConsContext, expected_type: Type) -> ListType:
+    def _visit_cons_pattern(self, ctx: syntaxTree.PatternCons, expected_type: Type) -> ListType:
         if expected_type and not (isinstance(expected_type, ListType) or isinstance(expected_type, TopType) or isinstance(expected_type, TypeVariable)):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_PATTERN_FOR_TYPE, ctx, expected_type)
@@ -579,14 +603,14 @@ class TypeInferer:
         self._visit_pattern(ctx.tail, list_type)
         return expected_type
 
-    def _visit_inl(self, ctx: stellaParser.InlContext, expected_type: Type) -> SumType:
-        if not expected_type and not self._extension_manager.is_type_reconstruction():
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+    def _visit_inl(self, ctx: syntaxTree.Inl, expected_type: Type) -> SumType:
+        if not expected_type and not self._features.is_type_reconstruction:
+            if self._features.is_ambiguous_type_as_bottom:
                 return BottomType()
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_SUM_TYPE, ctx)
             return None
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             expression_type: Type = self.visit_expression(ctx.expr_, None)
             if not expression_type:
                 return None
@@ -606,14 +630,14 @@ class TypeInferer:
             return None
         return expected_type
 
-    def _visit_inr(self, ctx: stellaParser.InrContext, expected_type: Type) -> SumType:
-        if not expected_type and not self._extension_manager.is_type_reconstruction():
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+    def _visit_inr(self, ctx: syntaxTree.Inr, expected_type: Type) -> SumType:
+        if not expected_type and not self._features.is_type_reconstruction:
+            if self._features.is_ambiguous_type_as_bottom:
                 return BottomType()
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_SUM_TYPE, ctx)
             return None
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             expression_type: Type = self.visit_expression(ctx.expr_, None)
             if not expression_type:
                 return None
@@ -633,9 +657,9 @@ class TypeInferer:
             return None
         return expected_type
 
-    def _visit_variant(self, ctx: stellaParser.VariantContext, expected_type: Type) -> VariantType:
+    def _visit_variant(self, ctx: syntaxTree.Variant, expected_type: Type) -> VariantType:
         if not expected_type:
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+            if self._features.is_ambiguous_type_as_bottom:
                 return BottomType()
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_VARIANT_TYPE, ctx)
@@ -644,15 +668,15 @@ class TypeInferer:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_VARIANT, expected_type)
             return None
-        if ctx.label.text not in expected_type.labels:
+        if ctx.label not in expected_type.labels:
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_VARIANT_LABEL, ctx.label.text, ctx, expected_type)
+                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_VARIANT_LABEL, ctx.label, ctx, expected_type)
             return None
-        expression_type: Type = expected_type.types[expected_type.labels.index(ctx.label.text)]
+        expression_type: Type = expected_type.types[expected_type.labels.index(ctx.label)]
         self.visit_expression(ctx.rhs, expression_type)
         return expected_type
 
-    def _visit_nat_rec(self, ctx: stellaParser.NatRecContext, expected_type: Type) -> Type:
+    def _visit_nat_rec(self, ctx: syntaxTree.NatRec, expected_type: Type) -> Type:
         self.visit_expression(ctx.n, NatType())
         initial_type: Type = self.visit_expression(ctx.initial, expected_type)
         if not initial_type:
@@ -664,22 +688,22 @@ class TypeInferer:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, FunctionalType(None, None, False), step_type, ctx.step)
             return None
-        if not isinstance(step_type.param, NatType) and not self._extension_manager.is_type_reconstruction():
+        if not isinstance(step_type.param, NatType) and not self._features.is_type_reconstruction:
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_PARAMETER, NatType(), step_type.param, ctx.step.paramDecl if isinstance(ctx.step, stellaParser.AbstractionContext) else ctx.step)
+                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_PARAMETER, NatType(), step_type.param, ctx.step.paramDecls[0] if isinstance(ctx.step, syntaxTree.Abstraction) else ctx.step)
             return None
-        if not isinstance(step_type.ret, FunctionalType) or step_type.ret.param != step_type.ret.ret and not self._extension_manager.is_type_reconstruction():
+        if not isinstance(step_type.ret, FunctionalType) or step_type.ret.param != step_type.ret.ret and not self._features.is_type_reconstruction:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, FunctionalType(None, None, False), step_type.ret, ctx.step)
             return None
-        if step_type.ret.param != initial_type and not self._extension_manager.is_type_reconstruction():
+        if step_type.ret.param != initial_type and not self._features.is_type_reconstruction:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, initial_type, step_type.ret.param, ctx.step)
             return None
         return initial_type
 
-    def _visit_fix(self, ctx: stellaParser.FixContext, expected_type: Type) -> Type:
-        if self._extension_manager.is_type_reconstruction():
+    def _visit_fix(self, ctx: syntaxTree.Fix, expected_type: Type) -> Type:
+        if self._features.is_type_reconstruction:
             target_type: Type = expected_type if expected_type else TypeVariable()
             self.visit_expression(ctx.expr_, FunctionalType(target_type, target_type))
             return target_type
@@ -692,8 +716,8 @@ class TypeInferer:
             return None
         return functional_type.ret
 
-    def _visit_list(self, ctx: stellaParser.ListContext, expected_type: Type) -> ListType:
-        if expected_type and not (isinstance(expected_type, ListType) or isinstance(expected_type, TopType)) and not self._extension_manager.is_type_reconstruction():
+    def _visit_list(self, ctx: syntaxTree.List, expected_type: Type) -> ListType:
+        if expected_type and not (isinstance(expected_type, ListType) or isinstance(expected_type, TopType)) and not self._features.is_type_reconstruction:
             list_type: ListType = self._visit_list(ctx, None)
             if not list_type:
                 return None
@@ -701,7 +725,7 @@ class TypeInferer:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_LIST, expected_type, list_type, ctx)
             return None
         if not expected_type and not ctx.exprs:
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+            if self._features.is_ambiguous_type_as_bottom:
                 return ListType(BottomType())
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_LIST, ctx)
@@ -717,19 +741,19 @@ class TypeInferer:
             list_type = ListType(expression_types[0])
         if not list_type:
             list_type = ListType(BottomType())
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             for index, expression_type in enumerate(expression_types):
                 self._unify_solver.add_constraint(list_type.type, expression_type, ctx.exprs[index])
             return self._validate_types(list_type, expected_type, ctx)
         for index, expression_type in enumerate(expression_types):
-            if not expression_type.is_subtype_of(list_type.type, self._extension_manager.is_structural_subtyping()):
+            if not expression_type.is_subtype_of(list_type.type, self._features.is_structural_subtyping):
                 if self._error_manager:
                     self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, list_type, expression_type, ctx.exprs[index])
                 return None
         return self._validate_types(list_type, expected_type, ctx)
 
-    def _visit_cons_list(self, ctx: stellaParser.ConsListContext, expected_type: Type) -> ListType:
-        if self._extension_manager.is_type_reconstruction():
+    def _visit_cons_list(self, ctx: syntaxTree.ConsList, expected_type: Type) -> ListType:
+        if self._features.is_type_reconstruction:
             actual_type: ListType = ListType(TypeVariable())
             if not self.visit_expression(ctx.head, actual_type.type):
                 return None
@@ -753,18 +777,18 @@ class TypeInferer:
             return None
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_is_empty(self, ctx: stellaParser.IsEmptyContext, expected_type: Type) -> BoolType:
-        list_type: Type = self.visit_expression(ctx.expr(), None)
+    def _visit_is_empty(self, ctx: syntaxTree.IsEmpty, expected_type: Type) -> BoolType:
+        list_type: Type = self.visit_expression(ctx.list_, None)
         if not list_type:
             return None
         if not isinstance(list_type, ListType):
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_NOT_A_LIST, list_type, ctx.expr())
+                self._error_manager.register_error(ErrorKind.ERROR_NOT_A_LIST, list_type, ctx.list_)
             return None
         actual_type: BoolType = BoolType()
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_head(self, ctx: stellaParser.HeadContext, expected_type: Type) -> Type:
+    def _visit_head(self, ctx: syntaxTree.Head, expected_type: Type) -> Type:
         list_type: Type = self.visit_expression(ctx.list_, None)
         if not list_type:
             return None
@@ -775,7 +799,7 @@ class TypeInferer:
         actual_type: Type = list_type.type
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_tail(self, ctx: stellaParser.TailContext, expected_type: Type) -> ListType:
+    def _visit_tail(self, ctx: syntaxTree.Tail, expected_type: Type) -> ListType:
         if expected_type and not (isinstance(expected_type, ListType) or isinstance(expected_type, TopType)):
             list_type: ListType = self._visit_tail(ctx, None)
             if not list_type:
@@ -792,7 +816,7 @@ class TypeInferer:
             return None
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_ref(self, ctx: stellaParser.RefContext, expected_type: Type) -> RefType:
+    def _visit_ref(self, ctx: syntaxTree.Ref, expected_type: Type) -> RefType:
         if expected_type and not (isinstance(expected_type, RefType) or isinstance(expected_type, TopType)):
             ref_type: RefType = self._visit_ref(ctx, None)
             if not ref_type:
@@ -806,11 +830,11 @@ class TypeInferer:
         actual_type: RefType = RefType(expression_type)
         return actual_type
 
-    def _visit_const_memory(self, ctx: stellaParser.ConstMemoryContext, expected_type: Type) -> Type:
-        if self._extension_manager.is_type_reconstruction():
+    def _visit_const_memory(self, ctx: syntaxTree.ConstMemory, expected_type: Type) -> Type:
+        if self._features.is_type_reconstruction:
             return TypeVariable()
         if not expected_type:
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+            if self._features.is_ambiguous_type_as_bottom:
                 return RefType(BottomType())
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_REFERENCE_TYPE, ctx)
@@ -821,11 +845,11 @@ class TypeInferer:
             return None
         return expected_type
 
-    def _visit_deref(self, ctx: stellaParser.DerefContext, expected_type: Type) -> Type:
+    def _visit_deref(self, ctx: syntaxTree.Deref, expected_type: Type) -> Type:
         ref_type: Type = self.visit_expression(ctx.expr_, RefType(expected_type) if expected_type else None)
         if not ref_type:
             return None
-        if self._extension_manager.is_type_reconstruction() and isinstance(ref_type, TypeVariable):
+        if self._features.is_type_reconstruction and isinstance(ref_type, TypeVariable):
             return ref_type
         if not isinstance(ref_type, RefType):
             if self._error_manager:
@@ -834,8 +858,8 @@ class TypeInferer:
         actual_type: Type = ref_type.inner_type
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _visit_assign(self, ctx: stellaParser.AssignContext, expected_type: Type) -> UnitType:
-        if self._extension_manager.is_type_reconstruction():
+    def _visit_assign(self, ctx: syntaxTree.Assign, expected_type: Type) -> UnitType:
+        if self._features.is_type_reconstruction:
             return UnitType()
         if expected_type and not (isinstance(expected_type, UnitType) or isinstance(expected_type, TopType)):
             if self._error_manager:
@@ -851,31 +875,31 @@ class TypeInferer:
         rhs_type: Type = self.visit_expression(ctx.rhs, None)
         if not rhs_type:
             return None
-        if not rhs_type.is_subtype_of(lhs_type.inner_type, self._extension_manager.is_structural_subtyping()):
+        if not rhs_type.is_subtype_of(lhs_type.inner_type, self._features.is_structural_subtyping):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, lhs_type.inner_type, rhs_type, ctx.rhs)
             return None
         return UnitType()
 
-    def _visit_panic(self, ctx: stellaParser.PanicContext, expected_type: Type) -> Type:
+    def _visit_panic(self, ctx: syntaxTree.Panic, expected_type: Type) -> Type:
         if not expected_type:
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+            if self._features.is_ambiguous_type_as_bottom:
                 return BottomType()
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_PANIC_TYPE, ctx)
             return None
         return expected_type
 
-    def _visit_throw(self, ctx: stellaParser.ThrowContext, expected_type: Type) -> Type:
+    def _visit_throw(self, ctx: syntaxTree.Throw, expected_type: Type) -> Type:
         exception_type: Type | None = self._type_context.resolve_exception_type()
         if not exception_type:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_EXCEPTION_TYPE_NOT_DECLARED)
             return None
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             return TypeVariable()
         if not expected_type:
-            if self._extension_manager.is_ambiguous_type_as_bottom():
+            if self._features.is_ambiguous_type_as_bottom:
                 return BottomType()
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_AMBIGUOUS_THROW_TYPE, ctx)
@@ -885,7 +909,7 @@ class TypeInferer:
         actual_type: Type = expected_type if expected_type else BottomType()
         return actual_type
 
-    def _visit_try_with(self, ctx: stellaParser.TryWithContext, expected_type: Type) -> Type:
+    def _visit_try_with(self, ctx: syntaxTree.TryWith, expected_type: Type) -> Type:
         if not self._type_context.resolve_exception_type():
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_EXCEPTION_TYPE_NOT_DECLARED)
@@ -902,7 +926,7 @@ class TypeInferer:
             return None
         return with_type
 
-    def _visit_try_catch(self, ctx: stellaParser.TryCatchContext, expected_type: Type) -> Type:
+    def _visit_try_catch(self, ctx: syntaxTree.TryCatch, expected_type: Type) -> Type:
         exception_type: Type | None = self._type_context.resolve_exception_type()
         if not exception_type:
             if self._error_manager:
@@ -912,7 +936,7 @@ class TypeInferer:
         if not try_type:
             return None
         catch_type_context: TypeContext = TypeContext(self._type_context)
-        catch_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, catch_type_context)
+        catch_type_inferrer: TypeInferer = TypeInferer(self._error_manager, self._extension_manager, self._unify_solver, self._inference_cache, catch_type_context, self._check_budget)
         if not catch_type_inferrer.visit_expression(ctx.pat, exception_type):
             return None
         catch_type: Type = catch_type_inferrer.visit_expression(ctx.fallbackExpr, expected_type)
@@ -924,7 +948,7 @@ class TypeInferer:
             return None
         return catch_type
 
-    def _visit_type_cast(self, ctx: stellaParser.TypeCastContext, expected_type: Type) -> Type:
+    def _visit_type_cast(self, ctx: syntaxTree.TypeCast, expected_type: Type) -> Type:
         if not self.visit_expression(ctx.expr_, None):
             return None
         actual_type: Type = get_type(ctx.type_)
@@ -932,10 +956,10 @@ class TypeInferer:
             return None
         return self._validate_types(actual_type, expected_type, ctx)
 
-    def _validate_types(self, actual_type: Type, expected_type: Type, expression: ParserRuleContext) -> Type:
+    def _validate_types(self, actual_type: Type, expected_type: Type, expression: syntaxTree.Node) -> Type:
         if not expected_type:
             return actual_type
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             self._unify_solver.add_constraint(expected_type, actual_type, expression)
             return expected_type
         if isinstance(actual_type, TupleType) and isinstance(expected_type, TupleType) and not self._validate_tuples(actual_type, expected_type, expression):
@@ -944,16 +968,16 @@ class TypeInferer:
             return None
         if isinstance(actual_type, VariantType) and isinstance(expected_type, VariantType) and not self._validate_variants(actual_type, expected_type, expression):
             return None
-        if not actual_type or not actual_type.is_subtype_of(expected_type, self._extension_manager.is_structural_subtyping()):
+        if not actual_type or not actual_type.is_subtype_of(expected_type, self._features.is_structural_subtyping):
             if self._error_manager:
-                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_SUBTYPE if self._extension_manager.is_structural_subtyping() else ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, expected_type, actual_type, expression)
+                self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_SUBTYPE if self._features.is_structural_subtyping else ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, expected_type, actual_type, expression)
             return None
         return expected_type
 
-    def _validate_patterns(self, actual_type: Type, expected_type: Type, expression: stellaParser.PatternContext) -> Type:
+    def _validate_patterns(self, actual_type: Type, expected_type: Type, expression: syntaxTree.Pattern) -> Type:
         if not expected_type:
             return actual_type
-        if self._extension_manager.is_type_reconstruction():
+        if self._features.is_type_reconstruction:
             self._unify_solver.add_constraint(expected_type, actual_type, expression)
             return expected_type
         if not actual_type or actual_type != expected_type:
@@ -972,14 +996,14 @@ class TypeInferer:
             return False
         return True
 
-    def _validate_tuples(self, actual_tuple: TupleType, expected_tuple: TupleType, expression: ParserRuleContext) -> bool:
-        if actual_tuple.arity < expected_tuple.arity or (not self._extension_manager.is_structural_subtyping() and actual_tuple.arity != expected_tuple.arity):
+    def _validate_tuples(self, actual_tuple: TupleType, expected_tuple: TupleType, expression: syntaxTree.Node) -> bool:
+        if actual_tuple.arity < expected_tuple.arity or (not self._features.is_structural_subtyping and actual_tuple.arity != expected_tuple.arity):
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TUPLE_LENGTH, expected_tuple.arity, actual_tuple.arity, expression)
             return False
         return True
 
-    def _validate_records(self, actual_record: RecordType, expected_record: RecordType, expression: ParserRuleContext) -> bool:
+    def _validate_records(self, actual_record: RecordType, expected_record: RecordType, expression: syntaxTree.Node) -> bool:
         actual_labels: set[str] = set(actual_record.labels)
         expected_labels: set[str] = set(expected_record.labels)
         missing_fields: set[str] = expected_labels - actual_labels
@@ -988,7 +1012,7 @@ class TypeInferer:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_MISSING_RECORD_FIELDS, f'{{{", ".join([field for field in missing_fields])}}}', expected_record)
             return False
-        if unexpected_fields and not self._extension_manager.is_structural_subtyping():
+        if unexpected_fields and not self._features.is_structural_subtyping:
             if self._error_manager:
                 self._error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_RECORD_FIELDS, f'{{{", ".join([field for field in unexpected_fields])}}}', expected_record)
             return False
@@ -1002,7 +1026,7 @@ class TypeInferer:
             return False
         return True
 
-    def _validate_variants(self, actual_variant: VariantType, expected_variant: VariantType, expression: ParserRuleContext) -> bool:
+    def _validate_variants(self, actual_variant: VariantType, expected_variant: VariantType, expression: syntaxTree.Node) -> bool:
         actual_labels: set[str] = set(actual_variant.labels)
         expected_labels: set[str] = set(expected_variant.labels)
         unexpected_labels: set[str] = actual_labels - expected_labels
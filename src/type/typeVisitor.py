@@ -1,97 +1,95 @@
-from antlr.stellaParser import stellaParser
+from syntax import syntaxTree
 from type.type import BoolType, BottomType, FunctionalType, GenericType, ListType, NatType, RecordType, RefType, SumType, TopType, TupleType, Type, TypeVariable, UnitType, UniversalWrapperType, UnknownType, VariantType
 
 
-def get_type(ctx: stellaParser.StellatypeContext) -> Type:
+def get_type(ctx: syntaxTree.Stellatype) -> Type:
     match ctx:
-        case stellaParser.TypeBoolContext():
+        case syntaxTree.TypeBool():
             return __visit_bool_type(ctx)
-        case stellaParser.TypeNatContext():
+        case syntaxTree.TypeNat():
             return __visit_nat_type(ctx)
-        case stellaParser.TypeFunContext():
+        case syntaxTree.TypeFun():
             return __visit_functional_type(ctx)
-        case stellaParser.TypeForAllContext():
+        case syntaxTree.TypeForAll():
             return __visit_for_all_type(ctx)
-        case stellaParser.TypeVarContext():
+        case syntaxTree.TypeVar():
             return __visit_variable_type(ctx)
-        case stellaParser.TypeAutoContext():
+        case syntaxTree.TypeAuto():
             return __visit_auto_type(ctx)
-        case stellaParser.TypeUnitContext():
+        case syntaxTree.TypeUnit():
             return __visit_unit_type(ctx)
-        case stellaParser.TypeTupleContext():
+        case syntaxTree.TypeTuple():
             return __visit_tuple_type(ctx)
-        case stellaParser.TypeRecordContext():
+        case syntaxTree.TypeRecord():
             return __visit_record_type(ctx)
-        case stellaParser.TypeSumContext():
+        case syntaxTree.TypeSum():
             return __visit_sum_type(ctx)
-        case stellaParser.TypeVariantContext():
+        case syntaxTree.TypeVariant():
             return __visit_variant_type(ctx)
-        case stellaParser.TypeListContext():
+        case syntaxTree.TypeList():
             return __visit_list_type(ctx)
-        case stellaParser.TypeRefContext():
+        case syntaxTree.TypeRef():
             return __visit_ref_type(ctx)
-        case stellaParser.TypeTopContext():
+        case syntaxTree.TypeTop():
             return __visit_top_type(ctx)
-        case stellaParser.TypeBottomContext():
+        case syntaxTree.TypeBottom():
             return __visit_bottom_type(ctx)
-        case stellaParser.TypeParensContext():
-            return get_type(ctx.type_)
         case _:
             return UnknownType()
 
-def __visit_bool_type(ctx: stellaParser.TypeBoolContext) -> BoolType:
+def __visit_bool_type(ctx: syntaxTree.TypeBool) -> BoolType:
     return BoolType()
 
-def __visit_nat_type(ctx: stellaParser.TypeNatContext) -> NatType:
+def __visit_nat_type(ctx: syntaxTree.TypeNat) -> NatType:
     return NatType()
 
-def __visit_functional_type(ctx: stellaParser.TypeFunContext) -> FunctionalType:
+def __visit_functional_type(ctx: syntaxTree.TypeFun) -> FunctionalType:
     return FunctionalType(get_type(ctx.paramTypes[0]), get_type(ctx.returnType))
 
-def __visit_for_all_type(ctx: stellaParser.TypeForAllContext) -> UniversalWrapperType:
-    type_params: list[GenericType] = [GenericType(type.text) for type in ctx.types]
+def __visit_for_all_type(ctx: syntaxTree.TypeForAll) -> UniversalWrapperType:
+    type_params: list[GenericType] = [GenericType(type) for type in ctx.types]
     inner_type: Type = get_type(ctx.type_)
     return UniversalWrapperType(type_params, inner_type)
 
-def __visit_variable_type(ctx: stellaParser.TypeVarContext) -> GenericType:
-    return GenericType(ctx.name.text)
+def __visit_variable_type(ctx: syntaxTree.TypeVar) -> GenericType:
+    return GenericType(ctx.name)
 
-def __visit_auto_type(ctx: stellaParser.TypeAutoContext) -> TypeVariable:
+def __visit_auto_type(ctx: syntaxTree.TypeAuto) -> TypeVariable:
     return TypeVariable()
 
-def __visit_unit_type(ctx: stellaParser.TypeUnitContext) -> UnitType:
+def __visit_unit_type(ctx: syntaxTree.TypeUnit) -> UnitType:
     return UnitType()
 
-def __visit_tuple_type(ctx: stellaParser.TypeTupleContext) -> TupleType:
+def __visit_tuple_type(ctx: syntaxTree.TypeTuple) -> TupleType:
     return TupleType([get_type(type) for type in ctx.types])
 
-def __visit_record_type(ctx: stellaParser.TypeRecordContext) -> RecordType:
+def __visit_record_type(ctx: syntaxTree.TypeRecord) -> RecordType:
     labels: list[str] = []
     types: list[Type] = []
     for field in ctx.fieldTypes:
-        labels.append(field.label.text)
+        labels.append(field.label)
         types.append(get_type(field.type_))
     return RecordType(labels, types)
 
-def __visit_sum_type(ctx: stellaParser.TypeSumContext) -> SumType:
+def __visit_sum_type(ctx: syntaxTree.TypeSum) -> SumType:
     return SumType(get_type(ctx.left), get_type(ctx.right))
 
-def __visit_variant_type(ctx: stellaParser.TypeVariantContext) -> VariantType:
+def __visit_variant_type(ctx: syntaxTree.TypeVariant) -> VariantType:
     labels: list[str] = []
     types: list[Type] = []
     for field in ctx.fieldTypes:
-        labels.append(field.label.text)
+        labels.append(field.label)
         types.append(get_type(field.type_))
     return VariantType(labels, types)
 
-def __visit_list_type(ctx: stellaParser.TypeListContext) -> ListType:
+def __visit_list_type(ctx: syntaxTree.TypeList) -> ListType:
     return ListType(get_type(ctx.type_))
 
-def __visit_ref_type(ctx: stellaParser.TypeRefContext) -> RefType:
+def __visit_ref_type(ctx: syntaxTree.TypeRef) -> RefType:
     return RefType(get_type(ctx.type_))
 
-def __visit_top_type(ctx: stellaParser.TypeTopContext) -> TopType:
+def __visit_top_type(ctx: syntaxTree.TypeTop) -> TopType:
     return TopType()
 
-def __visit_bottom_type(ctx: stellaParser.TypeBottomContext) -> BottomType:
+def __visit_bottom_type(ctx: syntaxTree.TypeBottom) -> BottomType:
     return BottomType()
@@ -1,6 +1,6 @@
 from abc import ABCMeta
-from antlr4 import ParserRuleContext
 
+from error.sourceSpan import SourceSpan
 from type.type import Type
 from utils.singleton import SingletonABCMeta
 
@@ -8,9 +8,9 @@ from utils.singleton import SingletonABCMeta
 class UnificationResult(metaclass = ABCMeta):
     expected_type: Type
     actual_type: Type
-    expression: ParserRuleContext
+    expression: SourceSpan
 
-    def __init__(self, expected_type: Type, actual_type: Type, expression: ParserRuleContext):
+    def __init__(self, expected_type: Type, actual_type: Type, expression: SourceSpan):
         self.expected_type = expected_type
         self.actual_type = actual_type
         self.expression = expression
@@ -28,19 +28,19 @@ class UnificationResult(metaclass = ABCMeta):
 
 class UnificationFailed(UnificationResult):
 
-    def __init__(self, expected_type: Type, actual_type: Type, expression: ParserRuleContext):
+    def __init__(self, expected_type: Type, actual_type: Type, expression: SourceSpan):
         super().__init__(expected_type, actual_type, expression)
 
 
 class UnificationFailedInfiniteType(UnificationResult):
 
-    def __init__(self, expected_type: Type, actual_type: Type, expression: ParserRuleContext):
+    def __init__(self, expected_type: Type, actual_type: Type, expression: SourceSpan):
         super().__init__(expected_type, actual_type, expression)
 
 
 class UnificationSucceded(UnificationResult, metaclass = SingletonABCMeta):
 
-    def __init__(self, expected_type: Type = None, actual_type: Type = None, expression: ParserRuleContext = None):
+    def __init__(self, expected_type: Type = None, actual_type: Type = None, expression: SourceSpan = None):
         super().__init__(expected_type, actual_type, expression)
 
     def __eq__(self, other: object) -> bool:
@@ -0,0 +1,88 @@
+import os
+import re
+import shutil
+import stat
+
+from pathlib import Path
+from typing import Final
+
+
+class UnsafeCacheDirectoryError(Exception):
+    directory: Path
+
+    def __init__(self, directory: Path):
+        super().__init__(f'cache directory {directory} must be owned by the current user and not writable by other users')
+        self.directory = directory
+
+
+class UnsafeCacheFileError(Exception):
+    path: Path
+
+    def __init__(self, path: Path):
+        super().__init__(f'cache file {path} must be a regular file owned by the current user and not writable by other users')
+        self.path = path
+
+
+class CacheDirectory:
+    __version_key_pattern: Final[re.Pattern[str]] = re.compile(r'[0-9a-f]{16}')
+    __private_mode: Final[int] = 0o700
+    root: Path
+    path: Path
+    marker: str
+
+    def __init__(self, root: str | Path, version_key: str, kind: str):
+        self.root = Path(root)
+        self.path = self.root / version_key
+        self.marker = f'.{kind}-cache'
+
+    @classmethod
+    def check_private(cls, directory: Path) -> None:
+        try:
+            directory_stat: os.stat_result = directory.lstat()
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISDIR(directory_stat.st_mode) or not cls._is_private(directory_stat):
+            raise UnsafeCacheDirectoryError(directory)
+        return None
+
+    @classmethod
+    def check_private_file(cls, path: Path) -> None:
+        cls.check_private(path.parent)
+        try:
+            file_stat: os.stat_result = path.lstat()
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode) or not cls._is_private(file_stat):
+            raise UnsafeCacheFileError(path)
+        return None
+
+    def open(self) -> Path:
+        self.create()
+        self._remove_stale_versions()
+        return self.path
+
+    def create(self) -> None:
+        self.root.mkdir(self.__private_mode, parents = True, exist_ok = True)
+        self.check_private(self.root)
+        self.path.mkdir(self.__private_mode, exist_ok = True)
+        self.check_private(self.path)
+        self.path.chmod(self.__private_mode)
+        self.path.joinpath(self.marker).touch()
+        return None
+
+    def iter_entries(self) -> list[Path]:
+        try:
+            return [path for path in self.path.iterdir() if not path.name.startswith('.')]
+        except FileNotFoundError:
+            self.create()
+            return []
+
+    def _remove_stale_versions(self) -> None:
+        for directory in self.root.iterdir():
+            if directory.name != self.path.name and self.__version_key_pattern.fullmatch(directory.name) and not directory.is_symlink() and directory.joinpath(self.marker).is_file():
+                shutil.rmtree(directory, ignore_errors = True)
+        return None
+
+    @classmethod
+    def _is_private(cls, path_stat: os.stat_result) -> bool:
+        return path_stat.st_uid == os.getuid() and not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
@@ -0,0 +1,4 @@
+from typing import Final
+
+
+CHECKER_VERSION: Final[str] = '0.2.0'
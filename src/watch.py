@@ -0,0 +1,105 @@
+import os
+import time
+import traceback
+
+from dataclasses import dataclass
+from hashlib import sha256
+from io import StringIO
+from pathlib import Path
+from typing import TextIO
+
+from checkRunner import CheckRunner
+from type.type import TypeVariable
+
+
+@dataclass
+class WatchEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    status: str
+    error_kind: str | None
+    message: str
+
+
+class DirectoryWatcher:
+    directory: Path
+    check_runner: CheckRunner
+    entries: dict[Path, WatchEntry]
+    checked_files: int
+    type_variable_count: int
+
+    def __init__(self, directory: Path, check_runner: CheckRunner):
+        self.directory = directory
+        self.check_runner = check_runner
+        self.entries = {}
+        self.checked_files = 0
+        self.type_variable_count = TypeVariable.get_count()
+
+    def watch(self, output: TextIO, interval: float, polls: int | None = None) -> None:
+        is_first_poll: bool = True
+        while polls is None or polls > 0:
+            start: float = time.perf_counter()
+            changed_paths: list[Path] = self.refresh()
+            if changed_paths or is_first_poll:
+                is_first_poll = False
+                self.write_report(changed_paths, time.perf_counter() - start, output)
+            if polls is not None:
+                polls -= 1
+            if polls != 0:
+                time.sleep(interval)
+        return None
+
+    def refresh(self) -> list[Path]:
+        changed_paths: list[Path] = []
+        paths: set[Path] = set()
+        for path in sorted(self.directory.rglob('*.stella')):
+            try:
+                stat: os.stat_result = path.stat()
+                entry: WatchEntry | None = self.entries.get(path)
+                if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    paths.add(path)
+                    continue
+                data: bytes = path.read_bytes()
+            except OSError:
+                continue
+            paths.add(path)
+            digest: str = sha256(data).hexdigest()
+            if entry and entry.digest == digest:
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+                continue
+            self.entries[path] = self._check(data, stat, digest)
+            changed_paths.append(path)
+        for path in sorted(self.entries.keys() - paths):
+            del self.entries[path]
+            changed_paths.append(path)
+        return changed_paths
+
+    def write_report(self, changed_paths: list[Path], elapsed: float, output: TextIO) -> None:
+        for path in changed_paths:
+            entry: WatchEntry | None = self.entries.get(path)
+            if entry is None:
+                output.write(f'{path}: removed\n')
+                continue
+            output.write(f'{path}: {entry.error_kind or entry.status}\n')
+            if entry.message:
+                output.write(entry.message if entry.message.endswith('\n') else f'{entry.message}\n')
+        counts: dict[str, int] = {'ok': 0, 'error': 0, 'budget': 0, 'crash': 0}
+        for entry in self.entries.values():
+            counts[entry.status] += 1
+        output.write(f'{len(self.entries)} programs: {counts["ok"]} ok, {counts["error"]} with errors, {counts["budget"]} over budget, {counts["crash"]} crashed; {len(changed_paths)} changed in {elapsed:.2f} s\n')
+        output.flush()
+
+    def _check(self, data: bytes, stat: os.stat_result, digest: str) -> WatchEntry:
+        self.checked_files += 1
+        TypeVariable.reset_count(self.type_variable_count)
+        output: StringIO = StringIO()
+        try:
+            exit_code: int = self.check_runner.run(StringIO(data.decode()), output)
+        except Exception:
+            return WatchEntry(stat.st_mtime_ns, stat.st_size, digest, 'crash', None, output.getvalue() + traceback.format_exc())
+        if self.check_runner.exceeded_budget:
+            return WatchEntry(stat.st_mtime_ns, stat.st_size, digest, 'budget', None, output.getvalue())
+        error_kind: str | None = self.check_runner.errors[0].error_kind.name if exit_code and self.check_runner.errors else None
+        return WatchEntry(stat.st_mtime_ns, stat.st_size, digest, 'error' if exit_code else 'ok', error_kind, output.getvalue())
@@ -0,0 +1,28 @@
+from argparse import ArgumentParser
+from io import StringIO
+
+from checkRunner import CheckRunner
+from main import add_arguments
+from type.type import TypeVariable
+
+
+def run_check(check_runner, source):
+    TypeVariable.reset_count()
+    output = StringIO()
+    try:
+        exit_code = check_runner.run(StringIO(source), output)
+    except ValueError:
+        return None
+    return exit_code, [error.error_kind for error in check_runner.errors], output.getvalue()
+
+def run(flags, source):
+    return run_check(CheckRunner(add_arguments(ArgumentParser()).parse_args(flags)), source)
+
+def generate_program(functions_count):
+    return 'language core;\n\n' + ''.join(f'fn f{index}(n : Nat) -> Nat {{\n  return f{max(index - 1, 0)}(succ(n))\n}}\n\n' for index in range(functions_count)) + f'fn main(n : Nat) -> Nat {{\n  return f{functions_count - 1}(n)\n}}\n'
+
+def generate_independent_program(functions_count):
+    return 'language core;\n\n' + ''.join(f'fn f{index}(n : Nat) -> Nat {{\n  return succ(n)\n}}\n\n' for index in range(functions_count)) + 'fn main(n : Nat) -> Nat {\n  return f0(n)\n}\n'
+
+def generate_error_program(errors_count):
+    return 'language core;\n\n' + ''.join(f'fn f{index}(n : Nat) -> Bool {{\n  return n\n}}\n\n' for index in range(errors_count)) + 'fn main(n : Nat) -> Nat {\n  return n\n}\n'
@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+def test_matches_single_file_cli(tmp_path):
+    paths = sorted(Path('tests/test_cases/').rglob('*.stella'))[::3]
+    list_path = tmp_path / 'programs.txt'
+    list_path.write_text(''.join(f'{path}\n' for path in paths[1::2]))
+    for flags in ([], ['--all-errors']):
+        batch = subprocess.run([sys.executable, 'src/batch.py', *flags, *map(str, paths[::2]), '--list', str(list_path)], capture_output = True, text = True)
+        results = [json.loads(line) for line in batch.stdout.splitlines()]
+        assert [result['path'] for result in results] == [str(path) for path in paths[::2] + paths[1::2]]
+        for result in results:
+            with open(result['path']) as input:
+                single = subprocess.run([sys.executable, 'src/main.py', *flags], stdin = input, capture_output = True, text = True)
+            assert result['exit_code'] == single.returncode, result['path']
+            if result['status'] != 'crash':
+                assert result['message'] == single.stderr, result['path']
+            assert (result['error_kind'] is None) == (result['status'] != 'error')
+        assert batch.returncode == (0 if all(result['status'] == 'ok' for result in results) else 255)
+
+def test_directory(tmp_path):
+    tmp_path.joinpath('nested').mkdir()
+    tmp_path.joinpath('nested', 'b.stella').write_text('language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n')
+    tmp_path.joinpath('a.stella').write_text('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n')
+    batch = subprocess.run([sys.executable, 'src/batch.py', str(tmp_path)], capture_output = True, text = True)
+    results = [json.loads(line) for line in batch.stdout.splitlines()]
+    assert [(Path(result['path']).name, result['status'], result['error_kind']) for result in results] == [('a.stella', 'ok', None), ('b.stella', 'error', 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION')]
+
+def test_parallel_matches_serial():
+    serial = subprocess.run([sys.executable, 'src/batch.py', 'tests/test_cases'], capture_output = True, text = True)
+    parallel = subprocess.run([sys.executable, 'src/batch.py', '--jobs', '2', '--max-tasks-per-worker', '3', 'tests/test_cases'], capture_output = True, text = True)
+    assert parallel.returncode == serial.returncode
+    assert parallel.stdout == serial.stdout
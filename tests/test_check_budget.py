@@ -0,0 +1,52 @@
+import json
+import pytest
+import subprocess
+import sys
+
+from pathlib import Path
+
+from checker.checkerSession import CheckerSession
+from conftest import generate_program, run
+from type.checkBudget import CheckBudget
+
+
+def generate_reconstruction_program(functions_count):
+    return 'language core;\nextend with #type-reconstruction;\n\n' + ''.join(f'fn f{index}(n : auto) -> auto {{\n  return f{max(index - 1, 0)}(succ(n))\n}}\n\n' for index in range(functions_count)) + f'fn main(n : Nat) -> auto {{\n  return f{functions_count - 1}(n)\n}}\n'
+
+def generate_pairs_program(depth):
+    return 'language core;\nextend with #type-reconstruction, #pairs, #let-bindings;\n\nfn main(x0 : auto) -> auto {\n  return ' + ''.join(f'let x{index + 1} = {{x{index}, x{index}}} in ' for index in range(depth)) + f'x{depth}\n}}\n'
+
+@pytest.mark.parametrize('flags', [[], ['--all-errors'], ['--function-cache', 'FUNCTION_CACHE'], ['--stream']])
+def test_unlimited_budget_matches_unbudgeted_check(flags, tmp_path):
+    flags = [str(tmp_path / flag) if flag == 'FUNCTION_CACHE' else flag for flag in flags]
+    budget_flags = [*flags, '--deadline', '600', '--max-nodes', '1000000000', '--max-constraints', '1000000000', '--max-type-size', '1000000000', '--max-memory', '1000000']
+    sources = [path.read_text() for path in sorted(Path('tests/test_cases/').rglob('*.stella'))]
+    sources.append(generate_reconstruction_program(100))
+    sources.append(generate_pairs_program(6))
+    for source in sources:
+        assert run(budget_flags, source) == run(flags, source), source
+
+@pytest.mark.parametrize('flags, resource', [(['--max-nodes', '500'], 'nodes'), (['--max-constraints', '50'], 'constraints'), (['--max-type-size', '100'], 'type size'), (['--deadline', '0.01'], 'time'), (['--max-memory', '1', '--trace-memory'], 'memory')])
+def test_budget_exceeded(flags, resource):
+    source = {'constraints': generate_reconstruction_program(100), 'type size': generate_pairs_program(12)}.get(resource, generate_program(3000))
+    exit_code, errors, output = run(flags, source)
+    assert (exit_code, errors) == (-2, [])
+    assert output.startswith('Type checking stopped!\n') and f'its {resource} budget' in output
+
+def test_budget_is_per_check():
+    checker_session = CheckerSession(check_budget = CheckBudget(max_nodes = 500))
+    result = checker_session.check(generate_program(300))
+    assert (result.is_ok, result.exceeded_resource, result.error_kind) == (False, 'nodes', None)
+    result = checker_session.check('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n')
+    assert (result.is_ok, result.exceeded_resource) == (True, None)
+    result = checker_session.check('language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n')
+    assert result.error_kind.name == 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION'
+
+def test_batch_status(tmp_path):
+    tmp_path.joinpath('large.stella').write_text(generate_program(300))
+    tmp_path.joinpath('small.stella').write_text('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n')
+    batch = subprocess.run([sys.executable, 'src/batch.py', '--max-nodes', '500', str(tmp_path)], capture_output = True, text = True)
+    results = [json.loads(line) for line in batch.stdout.splitlines()]
+    assert [(result['status'], result['error_kind']) for result in results] == [('budget', None), ('ok', None)]
+    assert batch.returncode == 255
+    assert '1 over budget' in batch.stderr
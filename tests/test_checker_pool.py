@@ -0,0 +1,80 @@
+import asyncio
+import checkerPool
+import json
+import multiprocessing
+import pytest
+import subprocess
+import sys
+
+from pathlib import Path
+
+from checkerPool import CheckerPool, check_source
+from conftest import generate_independent_program
+
+
+def test_concurrent_checks_match_batch():
+    paths = sorted(Path('tests/test_cases/').rglob('*.stella'))[::2]
+    batch = subprocess.run([sys.executable, 'src/batch.py', *map(str, paths)], capture_output = True, text = True)
+    expected = [json.loads(line) for line in batch.stdout.splitlines()]
+
+    async def check_all():
+        async with CheckerPool(workers = 2, max_pending = 4) as checker_pool:
+            return await asyncio.gather(*(checker_pool.check_source(path.read_text(), name = str(path)) for path in paths))
+
+    for path, result, expected_result in zip(paths, asyncio.run(check_all()), expected):
+        assert (result.path, result.status, result.exit_code, result.error_kind) == (expected_result['path'], expected_result['status'], expected_result['exit_code'], expected_result['error_kind']), path
+        if result.status != 'crash':
+            assert result.message == expected_result['message'], path
+
+def test_cancellation_stops_worker():
+    async def cancel():
+        async with CheckerPool() as checker_pool:
+            [worker] = multiprocessing.active_children()
+            check = asyncio.create_task(checker_pool.check_source(generate_independent_program(5000)))
+            await asyncio.sleep(0.5)
+            check.cancel()
+            try:
+                await check
+            except asyncio.CancelledError:
+                pass
+            await asyncio.to_thread(worker.join, 30)
+            assert not worker.is_alive()
+            return await checker_pool.check_source(generate_independent_program(1))
+
+    assert asyncio.run(cancel()).status == 'ok'
+
+def test_timeout_and_backpressure():
+    async def check_slow():
+        async with CheckerPool(max_pending = 2, timeout = 0.5) as checker_pool:
+            checks = [asyncio.create_task(checker_pool.check_source(generate_independent_program(5000 if index == 0 else 1))) for index in range(4)]
+            await asyncio.sleep(0.1)
+            assert checker_pool.pending_count == 2
+            return [result.status for result in await asyncio.gather(*checks)]
+
+    assert asyncio.run(check_slow()) == ['timeout', 'ok', 'ok', 'ok']
+
+def test_lost_workers_fail_callers(monkeypatch):
+    async def check_after_lost_worker():
+        async with CheckerPool(timeout = 0.5) as checker_pool:
+            monkeypatch.setattr(checkerPool, 'PoolWorker', failing_pool_worker)
+            monkeypatch.setattr(CheckerPool, '_CheckerPool__retry_delay', 0.01)
+            result = await checker_pool.check_source(generate_independent_program(5000))
+            with pytest.raises(RuntimeError) as runtime_error:
+                await asyncio.wait_for(checker_pool.check_source(generate_independent_program(1)), 30)
+            return result.status, runtime_error.value.__cause__
+
+    def failing_pool_worker(args):
+        raise OSError('cannot start worker')
+
+    status, start_error = asyncio.run(check_after_lost_worker())
+    assert status == 'timeout'
+    assert str(start_error) == 'cannot start worker'
+
+def test_check_source():
+    async def check():
+        result = await check_source('language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n', timeout = 30)
+        await CheckerPool.get_default().close()
+        return result
+
+    result = asyncio.run(check())
+    assert (result.status, result.error_kind) == ('error', 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION')
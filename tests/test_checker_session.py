@@ -0,0 +1,35 @@
+import pytest
+import random
+
+from pathlib import Path
+
+from checker.checkerSession import CheckerSession
+from conftest import run
+from type.type import TypeVariable
+
+
+@pytest.mark.parametrize('flags', [[], ['--all-errors'], ['--all-errors', '--require-extensions', '--regex-lexer']])
+def test_matches_fresh_checks(flags):
+    sources = [path.read_text() for path in sorted(Path('tests/test_cases/').rglob('*.stella'))] * 2
+    sources.append('language core;\n\nfn main(n : Nat) -> Nat {\n  return succ(n\n}\n')
+    random.Random(0).shuffle(sources)
+    TypeVariable.reset_count()
+    checker_session = CheckerSession('--all-errors' in flags, 100, '--require-extensions' in flags, '--regex-lexer' in flags)
+    for source in sources:
+        expected = run(flags, source)
+        try:
+            result = checker_session.check(source)
+        except ValueError:
+            assert expected is None
+            continue
+        assert (-1 if result.errors else 0, [error.error_kind for error in result.errors], result.message) == expected, source
+    assert checker_session.checks_count == len(sources)
+
+def test_result():
+    checker_session = CheckerSession()
+    result = checker_session.check('language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n')
+    assert not result.is_ok
+    assert result.error_kind.name == 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION'
+    assert result.message.startswith('An error occurred during type checking!\n')
+    result = checker_session.check('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n')
+    assert (result.is_ok, result.error_kind, result.message) == (True, None, '')
@@ -0,0 +1,34 @@
+from checker.checkerManager import CheckerManager
+from checker.declarationIndex import DeclarationIndex
+from error.errorKind import ErrorKind
+from parsing.programParser import parse_program
+from syntax.syntaxLowering import lower_program
+
+
+def build(source):
+    return DeclarationIndex.build(lower_program(parse_program(source)).decls)
+
+def test_indexes_declarations_in_order():
+    declaration_index = build('language core;\nextend with #nested-function-declarations;\n\nfn f(n : Nat) -> Bool {\n  fn main(m : Nat) -> Nat {\n    return m\n  }\n  return true\n}\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n\nfn g(n : Bool) -> Nat {\n  return 0\n}\n')
+    assert [declaration.name for declaration in declaration_index.declarations] == ['f', 'main', 'g']
+    assert declaration_index.main is declaration_index.declarations[1]
+    assert declaration_index.lookup('g').signature.name == '(Bool) -> (Nat)'
+    assert declaration_index.lookup('h') is None
+    assert [declaration.name for declaration in declaration_index.declarations[0].local_index.declarations] == ['main']
+
+def test_first_main_wins_and_later_duplicates_shadow():
+    declaration_index = build('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n\nfn f(n : Nat) -> Nat {\n  return n\n}\n\nfn main(n : Nat) -> Bool {\n  return true\n}\n\nfn f(n : Bool) -> Bool {\n  return n\n}\n')
+    assert len(declaration_index.declarations) == 4
+    assert declaration_index.main is declaration_index.declarations[0]
+    assert declaration_index.lookup('f') is declaration_index.declarations[3]
+
+def test_nested_main_is_not_main():
+    errors = CheckerManager(True).check(parse_program('language core;\nextend with #nested-function-declarations;\n\nfn f(n : Nat) -> Nat {\n  fn main(m : Nat) -> Nat {\n    return m\n  }\n  return n\n}\n'))
+    assert [error.error_kind for error in errors] == [ErrorKind.ERROR_MISSING_MAIN]
+
+def test_passes_run_in_order():
+    source = 'language core;\n\nfn f(n : Nat) -> Bool {\n  return n\n}\n'
+    assert [error.error_kind for error in CheckerManager(True).check(parse_program(source))] == [ErrorKind.ERROR_MISSING_MAIN, ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION]
+    assert CheckerManager().check_first(parse_program(source)).error_kind == ErrorKind.ERROR_MISSING_MAIN
+    strict_errors = CheckerManager(True, is_strict_extensions = True).check(parse_program(source.replace('return n', 'return {n, n}')))
+    assert [error.error_kind for error in strict_errors] == [ErrorKind.ERROR_MISSING_EXTENSION]
@@ -0,0 +1,77 @@
+import io
+import pytest
+
+from pathlib import Path
+
+from checker.checkerManager import CheckerManager
+from error.error import format_errors
+from parsing.declarationStream import DeclarationStream
+from parsing.programParser import ParseError, parse_program
+
+
+HEADER = 'language core;\nextend with #natural-literals, #exceptions, #exception-type-declaration, #universal-types, #type-aliases;\n'
+DECLS = [
+    'fn id(n : Nat) -> Nat {\n  return n\n}\n',
+    '// fn commented(n : Nat) -> Nat\n',
+    '/* fn\n  commented(n : Nat) -> Nat { return n } */\n',
+    'inline fn twice(f : fn(Nat) -> Nat) -> fn(Nat) -> Nat {\n  return fn(n : Nat) { return f(f(n)) }\n}\n',
+    'generic fn const[T](x : T) -> fn(Nat) -> T {\n  return fn(n : Nat) { return x }\n}\n',
+    'type Alias = fn(Nat) -> Nat\n',
+    'exception type = Nat\n',
+    'fn later(n : Nat) -> Bool {\n  return Nat::iszero(forward(n))\n}\n',
+    'fn wrong(n : Nat) -> Bool {\n  return n\n}\n',
+    'fn forward(n : Nat) -> Nat {\n  fn local(m : Nat) -> Nat {\n    return succ(m)\n  }\n  return local(twice(id)(n))\n}\n',
+    'fn main(n : Nat) -> Nat {\n  return forward(n)\n}\n'
+]
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 1 << 16])
+def test_corpus(block_size):
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella')):
+        source = path.read_text()
+        assert check_stream(source, block_size) == check_source(source), path
+
+@pytest.mark.parametrize('block_size', [1, 5, 1 << 16])
+def test_declarations(block_size):
+    for count in range(len(DECLS) + 1):
+        source = HEADER + '\n'.join(DECLS[:count])
+        assert check_stream(source, block_size) == check_source(source), source
+        source = HEADER + '\n'.join(DECLS[:count] + DECLS[-1:])
+        assert check_stream(source, block_size) == check_source(source), source
+
+def test_invalid_syntax():
+    for source in (HEADER + DECLS[0] + 'fn broken(n : Nat) -> Nat {\n  return succ(n\n}\n' + DECLS[-1], HEADER + 'fn id(n : Nat) -> Nat {\n  return n\n' + DECLS[-1], HEADER + DECLS[0] + '/* unterminated\n' + DECLS[-1], 'language core;\nextend with;\n' + DECLS[-1], ''):
+        assert check_stream(source, 5) == check_source(source), source
+
+def test_retained_source():
+    source = HEADER + ''.join(DECLS)
+    stream = DeclarationStream(io.StringIO(source), block_size = 5)
+    errors = CheckerManager(True).check(stream)
+    assert [error.error_kind.name for error in errors] == ['ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION']
+    wrong = source.index('fn wrong')
+    assert stream.source[wrong:wrong + 8] == 'fn wrong'
+    assert stream.source[len(HEADER):len(HEADER) + 5] == ''
+
+
+def check_source(source: str) -> tuple:
+    try:
+        program = parse_program(source)
+    except ParseError as parse_error:
+        return 'ParseError', parse_error.errors
+    checker_manager = CheckerManager(True)
+    try:
+        errors = checker_manager.check(program)
+    except ValueError as error:
+        return 'ValueError', str(error)
+    return format_errors(errors, source), format_errors(checker_manager.warnings, source)
+
+def check_stream(source: str, block_size: int) -> tuple:
+    stream = DeclarationStream(io.StringIO(source), block_size = block_size)
+    checker_manager = CheckerManager(True)
+    try:
+        errors = checker_manager.check(stream)
+    except ParseError as parse_error:
+        return 'ParseError', parse_error.errors
+    except ValueError as error:
+        return 'ValueError', str(error)
+    return format_errors(errors, stream.source), format_errors(checker_manager.warnings, stream.source)
@@ -0,0 +1,73 @@
+import os
+import pickle
+import pytest
+
+from antlr4.dfa.DFA import DFA
+from argparse import ArgumentParser
+from pathlib import Path
+
+from antlr.stellaLexer import stellaLexer
+from antlr.stellaParser import stellaParser
+from main import add_arguments
+from parsing.dfaCache import DfaCache
+from parsing.programParser import ParseError, ProgramParser
+from utils.cacheDirectory import UnsafeCacheDirectoryError, UnsafeCacheFileError
+
+
+def test_round_trip(tmp_path):
+    sources = [path.read_text() for path in sorted(Path('tests/test_cases/').rglob('*.stella'))]
+    expected = [parse_tree(source) for source in sources]
+    DfaCache.warm_up(sources)
+    dfa_cache = DfaCache(tmp_path / 'dfa.cache')
+    assert dfa_cache.save()
+    state_count = DfaCache.get_state_count()
+    reset_dfas()
+    assert DfaCache.get_state_count() == 0
+    assert DfaCache(tmp_path / 'dfa.cache').load()
+    assert DfaCache.get_state_count() == state_count
+    assert [parse_tree(source) for source in sources] == expected
+    assert DfaCache.get_state_count() == state_count
+
+def test_version_mismatch(tmp_path):
+    dfa_cache = DfaCache(tmp_path / 'dfa.cache')
+    assert dfa_cache.save()
+    dfa_cache.path.write_bytes(dfa_cache.path.read_bytes().replace(DfaCache.get_version_key().encode(), b'0' * 16))
+    assert not dfa_cache.load()
+
+def test_refuses_forbidden_globals(tmp_path):
+    dfa_cache = DfaCache(tmp_path / 'dfa.cache')
+    with dfa_cache.path.open('wb') as file:
+        pickle.dump(DfaCache.get_version_key(), file)
+        file.write(pickle.dumps(os.system).replace(b'system', b'getcwd'))
+    assert not dfa_cache.load()
+    dfa_cache.path.write_bytes(pickle.dumps(os.getcwd))
+    assert not dfa_cache.load()
+
+def test_refuses_unsafe_file(tmp_path):
+    dfa_cache = DfaCache(tmp_path / 'cache' / 'dfa.cache')
+    assert dfa_cache.save()
+    assert os.stat(dfa_cache.path.parent).st_mode & 0o777 == 0o700
+    dfa_cache.path.chmod(0o666)
+    with pytest.raises(UnsafeCacheFileError):
+        dfa_cache.load()
+    with pytest.raises(SystemExit):
+        add_arguments(ArgumentParser()).parse_args(['--dfa-cache', str(dfa_cache.path)])
+    dfa_cache.path.chmod(0o600)
+    tmp_path.joinpath('link.cache').symlink_to(dfa_cache.path)
+    with pytest.raises(UnsafeCacheFileError):
+        DfaCache(tmp_path / 'link.cache').load()
+    dfa_cache.path.parent.chmod(0o777)
+    with pytest.raises(UnsafeCacheDirectoryError):
+        dfa_cache.load()
+
+
+def parse_tree(source: str) -> str:
+    program_parser = ProgramParser(source)
+    try:
+        return program_parser.parse().toStringTree(recog = program_parser.parser)
+    except ParseError:
+        return 'ParseError'
+
+def reset_dfas() -> None:
+    stellaLexer.decisionsToDFA[:] = [DFA(decision_state, index) for index, decision_state in enumerate(stellaLexer.atn.decisionToState)]
+    stellaParser.decisionsToDFA[:] = [DFA(decision_state, index) for index, decision_state in enumerate(stellaParser.atn.decisionToState)]
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+from checker.checkerManager import CheckerManager
+from conftest import generate_error_program
+from error.errorKind import ErrorKind
+from error.errorManager import ErrorManager
+from error.sourceSpan import SourceSpan
+from parsing.programParser import parse_program
+from type.type import ErrorType, FunctionalType, NatType
+
+
+def test_reports_independent_errors():
+    errors = CheckerManager(True).check(parse_program(generate_error_program(5)))
+    assert [error.error_kind for error in errors] == [ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION] * 5
+    assert len({error.args[-1] for error in errors}) == 5
+    assert CheckerManager().check_first(parse_program(generate_error_program(5))) == errors[0]
+
+def test_max_errors():
+    assert len(CheckerManager(True, 3).check(parse_program(generate_error_program(5)))) == 3
+    for flags, errors_count in [(['--all-errors', '--max-errors', '2'], 2), (['--all-errors'], 5), ([], 1)]:
+        check = subprocess.run([sys.executable, 'src/main.py', *flags], input = generate_error_program(5), capture_output = True, text = True)
+        assert check.returncode == 255
+        assert check.stderr.count('ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION') == errors_count, flags
+
+def test_drops_duplicate_errors_in_recovery_mode():
+    span = SourceSpan(10, 12, 2, 3)
+    for is_recovery_mode, errors_count in [(True, 2), (False, 3)]:
+        error_manager = ErrorManager(is_recovery_mode)
+        error_manager.register_error(ErrorKind.ERROR_UNDEFINED_VARIABLE, 'm', span)
+        error_manager.register_error(ErrorKind.ERROR_UNDEFINED_VARIABLE, 'm', span)
+        error_manager.register_error(ErrorKind.ERROR_UNDEFINED_VARIABLE, 'm', SourceSpan(20, 22, 3, 3))
+        assert len(error_manager.errors) == errors_count
+
+def test_suppresses_error_type_cascades():
+    error_manager = ErrorManager(True)
+    error_manager.register_error(ErrorKind.ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION, FunctionalType(NatType(), ErrorType()), NatType(), SourceSpan(0, 1, 1, 0))
+    assert error_manager.errors == []
+    for source in ['language core;\n\nfn main(n : Nat) -> Nat {\n  return succ(if m then m else m)\n}\n', 'language core;\nextend with #pairs;\n\nfn main(n : Nat) -> Bool {\n  return Nat::iszero({m, n}.1)\n}\n']:
+        assert [error.error_kind for error in CheckerManager(True).check(parse_program(source))] == [ErrorKind.ERROR_UNDEFINED_VARIABLE], source
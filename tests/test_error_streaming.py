@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from checker.checkerManager import CheckerManager
+from conftest import generate_error_program
+from parsing.programParser import parse_program
+from type.type import TypeVariable
+
+
+def test_streams_errors_in_order():
+    for path in [*sorted(Path('tests/test_cases/').rglob('*.stella')), None]:
+        source = path.read_text() if path else generate_error_program(5)
+        TypeVariable.reset_count()
+        try:
+            expected = list(CheckerManager(True).check(parse_program(source)))
+        except ValueError:
+            continue
+        streamed = []
+        TypeVariable.reset_count()
+        assert CheckerManager(True).stream_errors(parse_program(source), lambda error: streamed.append(error) is None) == expected, path
+        assert streamed == expected, path
+
+def test_stops_after_handled_error():
+    streamed = []
+    errors = CheckerManager(True).stream_errors(parse_program(generate_error_program(5)), lambda error: streamed.append(error) is None and len(streamed) < 2)
+    assert len(errors) == len(streamed) == 2
+    assert errors == CheckerManager(True).check(parse_program(generate_error_program(5)))[:2]
+
+def test_check_first_matches_first_error():
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella')):
+        TypeVariable.reset_count()
+        try:
+            errors = CheckerManager().check(parse_program(path.read_text()))
+        except ValueError:
+            continue
+        TypeVariable.reset_count()
+        assert CheckerManager().check_first(parse_program(path.read_text())) == (errors[0] if errors else None), path
@@ -0,0 +1,58 @@
+import pytest
+import random
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from checker.functionCache import FunctionCache
+from checker.incrementalChecker import IncrementalChecker
+from checkRunner import CheckRunner
+from conftest import generate_program, run_check
+from main import add_arguments
+from parsing.programParser import ParseError, parse_program
+
+
+def check(function_cache, source):
+    incremental_checker = IncrementalChecker(function_cache, is_recovery_mode = True)
+    incremental_checker.check(parse_program(source), source)
+    return incremental_checker.checked_decls
+
+@pytest.mark.parametrize('flags', [[], ['--all-errors'], ['--all-errors', '--require-extensions']])
+def test_matches_full_check(tmp_path, flags):
+    cached_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args([*flags, '--function-cache', str(tmp_path)]))
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(flags))
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella')):
+        source = path.read_text()
+        expected = run_check(check_runner, source)
+        assert run_check(cached_runner, source) == expected, path
+        assert run_check(cached_runner, '\n\n' + source) == run_check(check_runner, '\n\n' + source), path
+    assert cached_runner.function_cache.hits > 0
+
+def test_rechecks_changed_bodies_and_callers(tmp_path):
+    function_cache = FunctionCache(tmp_path)
+    source = generate_program(20)
+    assert check(function_cache, source) == 21
+    assert check(function_cache, source) == 0
+    position = source.index('succ(n)', source.index('fn f7('))
+    assert check(function_cache, source[:position] + 'succ(succ(n))' + source[position + len('succ(n)'):]) == 1
+    position = source.index('-> Nat', source.index('fn f7('))
+    assert check(function_cache, source[:position] + '-> Bool' + source[position + len('-> Nat'):]) == 2
+    assert check(function_cache, source.replace('language core;', 'language core;\n\nexception type = Nat')) == 22
+
+def test_random_edits_match_full_check(tmp_path):
+    generator = random.Random(45)
+    fragments = ['succ(n)', 'true', 'n', '0', ' ', '\n', 'Bool', 'Nat', 'f0', 'f1(n)', 'fn g(n : Nat) -> Nat { return n }\n']
+    cached_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(['--all-errors', '--function-cache', str(tmp_path)]))
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(['--all-errors']))
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella'))[::3]:
+        source = path.read_text()
+        for _ in range(20):
+            start = generator.randrange(len(source) + 1)
+            stop = min(start + generator.randrange(8), len(source))
+            edited = source[:start] + generator.choice(fragments) + source[stop:]
+            try:
+                parse_program(edited)
+            except ParseError:
+                continue
+            source = edited
+            assert run_check(cached_runner, source) == run_check(check_runner, source), path
@@ -0,0 +1,78 @@
+import pytest
+import random
+
+from antlr4.tree.Tree import TerminalNode
+from pathlib import Path
+
+from parsing.incrementalParser import IncrementalParser
+from parsing.programParser import ParseError, ProgramParser
+
+
+FRAGMENTS = [' ', '\n', '\r\n', '\t', '// note\n', '/* note */', '/*', '*/', '//', 'x', 'succ', '0', '1', '(', ')', '{', '}', ';', ',', ':', '->', '=', '<0x1>', 'fn', 'return', 'Nat', 'Bool']
+
+
+def test_single_declaration_reparsed():
+    source = 'language core;\n\n' + '\n\n'.join(f'fn f{index}(n : Nat) -> Nat {{\n  return succ(n)\n}}' for index in range(20)) + '\n\nfn main(n : Nat) -> Nat {\n  return f19(n)\n}\n'
+    incremental_parser = IncrementalParser(source)
+    decls = list(incremental_parser.parse().decls)
+    position = source.index('succ(n)', source.index('fn f7'))
+    program_context = incremental_parser.edit(position, position + len('succ(n)'), 'succ(succ(n))')
+    assert incremental_parser.reparsed_decls == 1
+    assert all(old is new for index, (old, new) in enumerate(zip(decls, program_context.decls)) if index != 7)
+    assert dump(program_context) == dump(ProgramParser(incremental_parser.source, is_regex_lexer = True).parse())
+
+def test_random_edits():
+    generator = random.Random(37)
+    for path in sorted(Path('tests/test_cases/ok/').glob('*.stella')):
+        source = path.read_text()
+        incremental_parser = IncrementalParser(source)
+        incremental_parser.parse()
+        for _ in range(40):
+            start, stop, text = make_edit(generator, incremental_parser.source)
+            removed = incremental_parser.source[start:stop]
+            if not check_edit(incremental_parser, start, stop, text) or generator.random() < 0.3:
+                check_edit(incremental_parser, start, start + len(text), removed)
+
+
+def make_edit(generator: random.Random, source: str) -> tuple[int, int, str]:
+    program_parser = ProgramParser(source, is_regex_lexer = True)
+    tokens = [token for token in program_parser.get_tokens() if token.type > 0]
+    try:
+        decls = program_parser.parse().decls
+    except ParseError:
+        decls = []
+    token = generator.choice(tokens)
+    match generator.randint(0, 5):
+        case 0:
+            return token.start, token.start, generator.choice([' ', '\n', '\r\n', '// note\n', '/* note */'])
+        case 1 if token.text.isdigit():
+            return token.start, token.stop + 1, str(generator.randint(0, 20))
+        case 1 | 2 if token.text.isidentifier():
+            return token.start, token.stop + 1, generator.choice([token.text + 'x', token.text[:-1] or 'x', 'succ'])
+        case 3 if decls:
+            decl = generator.choice(decls)
+            position = generator.choice(decls).start.start
+            return position, position, source[decl.start.start:decl.stop.stop + 1] + '\n'
+        case 4 if decls:
+            decl = generator.choice(decls)
+            return decl.start.start, decl.stop.stop + 1, ''
+        case _:
+            start = generator.randint(0, len(source))
+            return start, min(start + generator.choice([0, 1, 2, 5]), len(source)), generator.choice(FRAGMENTS)
+
+def check_edit(incremental_parser: IncrementalParser, start: int, stop: int, text: str) -> bool:
+    expected_source = incremental_parser.source[:start] + text + incremental_parser.source[stop:]
+    try:
+        expected = dump(ProgramParser(expected_source, is_regex_lexer = True).parse())
+    except ParseError:
+        with pytest.raises(ParseError):
+            incremental_parser.edit(start, stop, text)
+        return False
+    assert dump(incremental_parser.edit(start, stop, text)) == expected, repr(expected_source)
+    return True
+
+def dump(node) -> tuple:
+    if isinstance(node, TerminalNode):
+        token = node.symbol
+        return token.type, token.text, token.start, token.stop, token.line, token.column, token.tokenIndex
+    return type(node).__name__, node.start.tokenIndex, node.stop.tokenIndex, tuple(dump(child) for child in node.children or [])
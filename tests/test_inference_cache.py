@@ -0,0 +1,73 @@
+from checker.checker import register_extensions
+from checker.visitor import TypeVisitor
+from error.errorManager import ErrorManager
+from extension.extensionManager import ExtensionManager
+from parsing.programParser import parse_program
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_program
+from type.inferenceCache import InferenceCache
+from type.type import NatType
+from unification.unifySolver import DisabledUnifySolver
+
+
+def check(source, inference_cache):
+    program = lower_program(parse_program(source))
+    error_manager = ErrorManager(True)
+    extension_manager = ExtensionManager()
+    register_extensions(program, extension_manager)
+    TypeVisitor(error_manager, extension_manager, DisabledUnifySolver(), inference_cache).visit_program(program)
+    return error_manager.errors
+
+def generate_program(body):
+    return f'language core;\nextend with #pairs;\n\nfn main(n : Nat) -> {{Nat, Nat}} {{\n  return {{{body}, {body}}}\n}}\n'
+
+def find_nodes(program, node_type):
+    nodes = []
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, node_type):
+            nodes.append(node)
+        stack.extend(child for child in node.iter_children() if child is not None)
+    return nodes
+
+def test_repeated_closed_subexpression_hits():
+    source = generate_program('(fn(x : Nat) { return succ(succ(succ(succ(succ(x))))) })(n)')
+    inference_cache = InferenceCache()
+    assert check(source, inference_cache) == check(source, None) == []
+    assert (inference_cache.hits, inference_cache.misses) == (1, 1)
+    source = source.replace('-> {Nat, Nat}', '-> {Nat, Bool}')
+    assert check(source, InferenceCache()) == check(source, None) != []
+
+def test_open_subexpression_is_not_cached():
+    inference_cache = InferenceCache()
+    assert check(generate_program('(fn(x : Nat) { return succ(succ(succ(succ(succ(n))))) })(n)'), inference_cache) == []
+    assert inference_cache.hits == inference_cache.misses == 0
+
+def test_throw_and_try_bypass_cache():
+    for body in ['(fn(x : Nat) { return if Nat::iszero(x) then succ(succ(x)) else throw(0) })(n)', '(fn(x : Nat) { return try { succ(succ(succ(succ(x)))) } with { 0 } })(n)']:
+        source = 'language core;\nextend with #pairs, #exceptions, #exception-type-declaration;\n\nexception type = Nat\n\n' + generate_program(body).removeprefix('language core;\nextend with #pairs;\n\n')
+        inference_cache = InferenceCache()
+        assert check(source, inference_cache) == check(source, None) == [], body
+        assert inference_cache.hits == inference_cache.misses == 0, body
+        program = lower_program(parse_program(source))
+        assert all(inference_cache.fingerprint(node).structure_id is None for node in find_nodes(program, syntaxTree.Abstraction)), body
+
+def test_cache_is_bounded():
+    inference_cache = InferenceCache(max_size = 2)
+    for key in [(0, ''), (1, ''), (0, ''), (2, '')]:
+        if not inference_cache.get(key):
+            inference_cache.put(key, NatType())
+    assert inference_cache.get((1, '')) is None
+    assert inference_cache.get((0, '')) == inference_cache.get((2, '')) == NatType()
+
+def test_structure_ids_are_dropped_between_checks():
+    inference_cache = InferenceCache()
+    body = '(fn(x : Nat) { return succ(succ(succ(succ(succ(x))))) })(n)'
+    assert check(generate_program(body), inference_cache) == []
+    inference_cache.clear_fingerprints()
+    assert not inference_cache._structure_ids
+    source = generate_program(body.replace('(fn(x : Nat) {', '(fn(x : Bool) {').replace('succ(succ(succ(succ(succ(x)))))', 'if x then 0 else succ(0)')).replace('(n)', '(true)')
+    assert check(source, inference_cache) == check(source, None) == []
+    source = generate_program(body.replace('succ(succ(succ(succ(succ(x)))))', 'Nat::iszero(succ(succ(succ(x))))'))
+    assert check(source, inference_cache) == check(source, None) != []
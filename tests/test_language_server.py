@@ -0,0 +1,112 @@
+import json
+import random
+import subprocess
+import sys
+
+from pathlib import Path
+
+from checker.documentChecker import DocumentChecker
+from conftest import generate_program
+
+
+def test_rechecks_only_changed_declarations():
+    source = generate_program(20)
+    document_checker = DocumentChecker(source)
+    assert document_checker.check() == []
+    assert document_checker.checked_decls == 21
+    position = source.index('succ(n)', source.index('fn f7('))
+    document_checker.edit(position, position + len('succ(n)'), 'true')
+    diagnostics = document_checker.check()
+    assert document_checker.checked_decls == 1
+    assert [(diagnostic.start, diagnostic.stop) for diagnostic in diagnostics] == [(position, position + len('true'))]
+    assert diagnostics == DocumentChecker(document_checker.source).check()
+    document_checker.edit(0, 0, '\n\n')
+    assert document_checker.check() == [diagnostic.shift(2) for diagnostic in diagnostics]
+    assert document_checker.checked_decls == 0
+
+def test_rechecks_dependents_of_changed_signature():
+    source = generate_program(20)
+    document_checker = DocumentChecker(source)
+    document_checker.check()
+    position = source.index('-> Nat', source.index('fn f7('))
+    document_checker.edit(position, position + len('-> Nat'), '-> Bool')
+    diagnostics = document_checker.check()
+    assert document_checker.checked_decls == 2
+    assert [diagnostic.message.partition('\n')[0] for diagnostic in diagnostics] == ['ERROR: ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION'] * 2
+    assert diagnostics == DocumentChecker(document_checker.source).check()
+
+def test_random_edits_match_full_check():
+    generator = random.Random(43)
+    fragments = ['succ(n)', 'true', 'n', '0', ' ', '\n', 'Bool', 'Nat', 'f0', 'f1(n)', '(', '}', 'fn g(n : Nat) -> Nat { return n }\n']
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella'))[::2]:
+        document_checker = DocumentChecker(path.read_text())
+        try:
+            document_checker.check()
+        except ValueError:
+            continue
+        for _ in range(15):
+            source = document_checker.source
+            start = generator.randrange(len(source) + 1)
+            stop = min(start + generator.randrange(8), len(source))
+            document_checker.edit(start, stop, generator.choice(fragments))
+            try:
+                expected = DocumentChecker(document_checker.source).check()
+            except ValueError:
+                continue
+            assert normalize(document_checker.check()) == normalize(expected), path
+
+def test_language_server_session():
+    source = generate_program(5)
+    server = subprocess.Popen([sys.executable, 'src/languageServer.py', '--debounce', '50'], stdin = subprocess.PIPE, stdout = subprocess.PIPE)
+    uri = 'file:///program.stella'
+    send(server, {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}})
+    assert receive(server)['result']['capabilities']['textDocumentSync']['change'] == 2
+    send(server, {'jsonrpc': '2.0', 'method': 'initialized', 'params': {}})
+    send(server, {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {'textDocument': {'uri': uri, 'languageId': 'stella', 'version': 1, 'text': source}}})
+    assert receive(server)['params'] == {'uri': uri, 'version': 1, 'diagnostics': []}
+    line = source[:source.index('fn f2(')].count('\n') + 1
+    column = len('  return f1(')
+    for version, (old_text, text) in enumerate([('succ(n)', 't'), ('t', 'tr'), ('tr', 'true')], 2):
+        change = {'range': {'start': {'line': line, 'character': column}, 'end': {'line': line, 'character': column + len(old_text)}}, 'text': text}
+        send(server, {'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {'textDocument': {'uri': uri, 'version': version}, 'contentChanges': [change]}})
+    params = receive(server)['params']
+    assert params['version'] == 4
+    assert [(diagnostic['range'], diagnostic['code']) for diagnostic in params['diagnostics']] == [({'start': {'line': line, 'character': column}, 'end': {'line': line, 'character': column + len('true')}}, 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION')]
+    send(server, {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'})
+    assert receive(server) == {'jsonrpc': '2.0', 'id': 2, 'result': None}
+    send(server, {'jsonrpc': '2.0', 'method': 'exit'})
+    assert server.wait(30) == 0
+
+def test_invalid_messages():
+    server = subprocess.Popen([sys.executable, 'src/languageServer.py'], stdin = subprocess.PIPE, stdout = subprocess.PIPE)
+    server.stdin.write(b'Content-Length: 5\r\n\r\n{bad}')
+    server.stdin.flush()
+    assert receive(server)['error']['code'] == -32700
+    send(server, [1])
+    assert receive(server)['error']['code'] == -32600
+    send(server, {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'capabilities': None}})
+    assert receive(server)['error']['code'] == -32602
+    send(server, {'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {}})
+    assert receive(server)['method'] == 'window/logMessage'
+    send(server, {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'})
+    assert receive(server) == {'jsonrpc': '2.0', 'id': 2, 'result': None}
+    server.stdin.write(b'Content-Length: 5\r\n\r\n{bad}')
+    server.stdin.close()
+    assert receive(server)['error']['code'] == -32700
+    assert server.wait(30) == 1
+
+def normalize(diagnostics):
+    return [(diagnostic.start, diagnostic.stop, diagnostic.message.partition('\n')[0] if 'ERROR_INVALID_SYNTAX' in diagnostic.message else diagnostic.message) for diagnostic in diagnostics]
+
+def send(server, message):
+    body = json.dumps(message).encode()
+    server.stdin.write(f'Content-Length: {len(body)}\r\n\r\n'.encode() + body)
+    server.stdin.flush()
+
+def receive(server):
+    content_length = None
+    while line := server.stdout.readline().strip():
+        name, _, value = line.decode().partition(':')
+        if name.lower() == 'content-length':
+            content_length = int(value)
+    return json.loads(server.stdout.read(content_length))
@@ -0,0 +1,37 @@
+import pytest
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from checker.parallelChecker import ParallelChecker
+from checkRunner import CheckRunner
+from conftest import generate_program, run_check
+from main import add_arguments
+
+
+@pytest.mark.parametrize('flags', [[], ['--all-errors'], ['--all-errors', '--require-extensions']])
+def test_matches_serial_check(flags):
+    parallel_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args([*flags, '--check-jobs', '3', '--parallel-threshold', '0']))
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(flags))
+    try:
+        source = generate_program(300)
+        sources = [path.read_text() for path in sorted(Path('tests/test_cases/').rglob('*.stella'))]
+        sources.append(source)
+        sources.append(source.replace('succ(n)', 'true', 2).replace('-> Nat {\n  return f200', '-> Bool {\n  return f200'))
+        sources.append(source.replace('succ(n)', '(n, 1)', 3))
+        sources.append(source.replace('fn main', 'fn mian'))
+        sources.append(source.replace('return f9(', 'return f9 (', 1) + 'fn broken(n : Nat) -> Nat {\n  return\n}\n')
+        for source in sources:
+            assert run_check(parallel_runner, source) == run_check(check_runner, source), source[:200]
+    finally:
+        parallel_runner.close()
+
+def test_falls_back_to_serial_check():
+    parallel_checker = ParallelChecker(2, True)
+    try:
+        source = generate_program(50)
+        assert parallel_checker.check(source) == []
+        assert parallel_checker.check(source + 'fn broken(n : Nat) -> Nat {\n  return\n}\n') is None
+        assert parallel_checker.check(source.replace('language core;', 'language core;\nextend with #type-reconstruction;')) is None
+    finally:
+        parallel_checker.close()
@@ -0,0 +1,53 @@
+import pytest
+import stat
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from main import add_arguments
+from parsing.parseCache import ParseCache
+from parsing.programParser import parse_program
+from utils.cacheDirectory import UnsafeCacheDirectoryError
+
+
+def test_matches_uncached_parse(tmp_path):
+    parse_cache = ParseCache(tmp_path)
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella'))[::4]:
+        source = path.read_text()
+        for _ in range(2):
+            assert parse_cache.parse(source).toStringTree() == parse_program(source).toStringTree(), path
+    assert parse_cache.hits == parse_cache.misses > 0
+
+def test_eviction_bounds_size(tmp_path, monkeypatch):
+    parse_cache = ParseCache(tmp_path, max_size = 4096)
+    evictions = []
+    evict = parse_cache._evict
+    monkeypatch.setattr(parse_cache, '_evict', lambda: evictions.append(evict()))
+    for index in range(129):
+        parse_cache.parse(f'language core;\n\nfn main(n : Nat) -> Nat {{\n  return {"succ(" * index}n{")" * index}\n}}\n')
+    assert len(evictions) == 3
+    assert sum(path.stat().st_size for path in parse_cache.directory.iterdir()) <= 4096
+
+def test_keeps_unrelated_directories(tmp_path):
+    tmp_path.joinpath('important_project').mkdir()
+    tmp_path.joinpath('important_project', 'main.stella').write_text('language core;\n')
+    tmp_path.joinpath('0123456789abcdef').mkdir()
+    stale_directory = tmp_path / 'fedcba9876543210'
+    stale_directory.mkdir()
+    stale_directory.joinpath('.parse-cache').touch()
+    parse_cache = ParseCache(tmp_path)
+    assert tmp_path.joinpath('important_project', 'main.stella').is_file()
+    assert tmp_path.joinpath('0123456789abcdef').is_dir()
+    assert not stale_directory.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(['important_project', '0123456789abcdef', parse_cache.directory.name])
+
+def test_refuses_shared_directory(tmp_path):
+    parse_cache = ParseCache(tmp_path / 'cache')
+    assert stat.S_IMODE(parse_cache.directory.stat().st_mode) == 0o700
+    shared_path = tmp_path / 'shared'
+    shared_path.mkdir()
+    shared_path.chmod(0o777)
+    with pytest.raises(UnsafeCacheDirectoryError):
+        ParseCache(shared_path)
+    with pytest.raises(SystemExit):
+        add_arguments(ArgumentParser()).parse_args(['--parse-cache', str(shared_path)])
@@ -0,0 +1,48 @@
+import random
+
+from antlr4 import CommonTokenStream
+from antlr4.InputStream import InputStream
+from pathlib import Path
+
+from antlr.stellaLexer import stellaLexer
+from parsing.regexLexer import TokenBuffer, tokenize
+
+
+FRAGMENTS = [literal_name[1:-1] for literal_name in stellaLexer.literalNames if literal_name.startswith('\'')] + [
+    ' ', '\t', '\n', '\r', '\r\n', '\f', '//', '/*', '*/', '#', '<0x', '>', '0x', '12', '_', '!', '?', ':', '-', 'x',
+    'Abc', 'é', 'Ø', '×', '÷', 'ÿ', 'µ', '$', '"', '\\', '@', '~', '`', 'Ā'
+]
+
+
+def test_corpus():
+    for path in Path('tests/test_cases/').rglob('*.stella'):
+        source = path.read_text()
+        assert read_buffer(tokenize(source)) == read_antlr_tokens(source), path
+
+def test_fuzzed():
+    generator = random.Random(36)
+    corpus = [path.read_text() for path in sorted(Path('tests/test_cases/').rglob('*.stella'))]
+    for _ in range(500):
+        source = ''.join(generator.choice(FRAGMENTS) for _ in range(generator.randint(0, 40)))
+        assert read_buffer(tokenize(source)) == read_antlr_tokens(source), repr(source)
+    for _ in range(200):
+        source = list(generator.choice(corpus)) if corpus else []
+        for _ in range(generator.randint(1, 5)):
+            position = generator.randint(0, len(source))
+            if source and generator.random() < 0.5:
+                del source[min(position, len(source) - 1)]
+            else:
+                source.insert(position, generator.choice(FRAGMENTS))
+        source = ''.join(source)
+        assert read_buffer(tokenize(source)) == read_antlr_tokens(source), repr(source)
+
+
+def read_buffer(buffer: TokenBuffer) -> list[tuple]:
+    return [(buffer.types[index], buffer.starts[index], buffer.stops[index], buffer.lines[index], buffer.columns[index], buffer.get_channel(index)) for index in range(len(buffer))]
+
+def read_antlr_tokens(source: str) -> list[tuple]:
+    lexer = stellaLexer(InputStream(source))
+    lexer.removeErrorListeners()
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    return [(token.type, token.start, token.stop, token.line, token.column, token.channel) for token in stream.tokens]
@@ -0,0 +1,69 @@
+import pytest
+import shutil
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+from checker.resultCache import ResultCache
+from checkRunner import CheckRunner
+from conftest import run_check
+from main import add_arguments
+from parsing.programParser import ProgramParser
+
+
+def reformat(source):
+    tokens = ProgramParser(source, is_regex_lexer = True).get_tokens()[:-1]
+    return '\n'.join(f'  /* {index} */ {token.text}' for index, token in enumerate(tokens))
+
+@pytest.mark.parametrize('flags', [[], ['--all-errors']])
+def test_matches_uncached_check(tmp_path, flags):
+    cached_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args([*flags, '--result-cache', str(tmp_path)]))
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(flags))
+    hits = 0
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella')):
+        source = path.read_text()
+        expected = run_check(check_runner, source)
+        assert run_check(cached_runner, source) == expected, path
+        assert not cached_runner.is_cached
+        if expected is not None and 'ERROR_INVALID_SYNTAX' not in expected[2]:
+            assert run_check(cached_runner, source) == expected, path
+            assert cached_runner.is_cached
+            hits += 1
+        reformatted = reformat(source)
+        expected = run_check(check_runner, reformatted)
+        assert run_check(cached_runner, reformatted) == expected, path
+        hits += cached_runner.is_cached
+    assert hits == cached_runner.result_cache.hits > 0
+
+def test_options_change_key(tmp_path):
+    tokens = ProgramParser('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n').get_tokens()
+    assert ResultCache(tmp_path, 'a').get_key(tokens) != ResultCache(tmp_path, 'b').get_key(tokens)
+
+def test_eviction_bounds_size(tmp_path):
+    result_cache = ResultCache(tmp_path, max_size = 4096)
+    for index in range(129):
+        tokens = ProgramParser(f'language core;\n\nfn main(n : Nat) -> Nat {{\n  return {"succ(" * index}n{")" * index}\n}}\n').get_tokens()
+        result_cache.store(result_cache.get_key(tokens), tokens, [], [])
+    assert sum(path.stat().st_size for path in result_cache.directory.iterdir()) <= 4096
+    assert result_cache.load(result_cache.get_key(tokens), tokens) == ([], [])
+    assert result_cache.hit_rate == 1.0
+
+def test_shares_directory_with_parse_cache(tmp_path):
+    flags = ['--parse-cache', str(tmp_path), '--result-cache', str(tmp_path), '--function-cache', str(tmp_path)]
+    cached_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(flags))
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args([]))
+    assert cached_runner.parse_cache.directory.is_dir() and cached_runner.result_cache.directory.is_dir()
+    source = 'language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n'
+    assert run_check(cached_runner, source) == run_check(check_runner, source)
+    assert run_check(cached_runner, source.replace('return', 'return  ')) == run_check(check_runner, source)
+    assert cached_runner.result_cache.hits == 1
+
+def test_recreates_removed_directory(tmp_path):
+    result_cache = ResultCache(tmp_path)
+    tokens = ProgramParser('language core;\n\nfn main(n : Nat) -> Nat {\n  return n\n}\n').get_tokens()
+    shutil.rmtree(result_cache.directory)
+    result_cache.clear()
+    shutil.rmtree(result_cache.directory)
+    result_cache.store(result_cache.get_key(tokens), tokens, [], [])
+    result_cache.store(result_cache.get_key(tokens), tokens, [], [])
+    assert result_cache.load(result_cache.get_key(tokens), tokens) == ([], [])
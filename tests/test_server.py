@@ -0,0 +1,82 @@
+import json
+import signal
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+from conftest import generate_independent_program
+
+
+def start_server(*flags):
+    return subprocess.Popen([sys.executable, 'src/server.py', *flags], stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.PIPE, text = True)
+
+def request(server, request_id, source):
+    server.stdin.write(json.dumps({'id': request_id, 'source': source}) + '\n')
+    server.stdin.flush()
+    return json.loads(server.stdout.readline())
+
+def test_matches_batch():
+    paths = sorted(Path('tests/test_cases/').rglob('*.stella'))[::4]
+    batch = subprocess.run([sys.executable, 'src/batch.py', *map(str, paths)], capture_output = True, text = True)
+    expected = [json.loads(line) for line in batch.stdout.splitlines()]
+    server = start_server('--workers', '2')
+    try:
+        for index, (path, result) in enumerate(zip(paths, expected)):
+            response = request(server, index, path.read_text())
+            assert response['id'] == index
+            assert (response['status'], response['exit_code'], response['error_kind']) == (result['status'], result['exit_code'], result['error_kind']), path
+            if result['status'] != 'crash':
+                assert response['message'] == result['message'], path
+    finally:
+        server.stdin.close()
+    assert server.wait(30) == 0
+
+def test_invalid_requests():
+    server = start_server()
+    try:
+        for line in ('not json', '[]', '{"id": 1}', '{"id": 1, "source": 2}'):
+            server.stdin.write(line + '\n')
+            server.stdin.flush()
+            response = json.loads(server.stdout.readline())
+            assert response['status'] == 'invalid'
+    finally:
+        server.stdin.close()
+    assert server.wait(30) == 0
+
+def test_oversized_requests():
+    server = start_server('--max-request-size', '1000')
+    try:
+        for source in ('x' * 3000, 'x' * 300000):
+            response = request(server, 'large', source)
+            assert (response['id'], response['status']) == (None, 'invalid')
+            assert 'longer than 1000 bytes' in response['message']
+            response = request(server, 'small', generate_independent_program(1))
+            assert (response['id'], response['status']) == ('small', 'ok')
+    finally:
+        server.stdin.close()
+    assert server.wait(30) == 0
+
+def test_timeout_restarts_worker():
+    server = start_server('--timeout', '0.5')
+    try:
+        response = request(server, 'slow', generate_independent_program(5000))
+        assert (response['id'], response['status']) == ('slow', 'timeout')
+        response = request(server, 'fast', generate_independent_program(1))
+        assert (response['id'], response['status'], response['message']) == ('fast', 'ok', '')
+    finally:
+        server.stdin.close()
+    assert server.wait(30) == 0
+
+def test_sigterm_drains():
+    server = start_server()
+    assert request(server, 0, generate_independent_program(1))['status'] == 'ok'
+    server.stdin.write(json.dumps({'id': 1, 'source': generate_independent_program(5000)}) + '\n')
+    server.stdin.flush()
+    time.sleep(0.5)
+    server.send_signal(signal.SIGTERM)
+    response = json.loads(server.stdout.readline())
+    assert (response['id'], response['status']) == (1, 'ok')
+    assert server.wait(30) == 0
+    assert 'served 2 requests' in server.stderr.read()
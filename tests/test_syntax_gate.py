@@ -0,0 +1,46 @@
+from checker.checker import SyntaxChecker
+from checker.checkerManager import CheckerManager
+from checker.syntaxGate import SyntaxGate
+from error.errorKind import ErrorKind
+from error.errorManager import ErrorManager
+from extension.extensionKind import ExtensionKind
+from parsing.programParser import parse_program
+from syntax.syntaxLowering import lower_program
+
+
+PAIRS_PROGRAM = 'language core;\n\nfn main(n : Nat) -> {Nat, Nat} {\n  return {n, n}\n}\n'
+ARITHMETIC_PROGRAM = 'language core;\nextend with #arithmetic-operators;\n\nfn main(n : Nat) -> Nat {\n  return (n + n) + n\n}\n'
+
+def scan(source):
+    program = lower_program(parse_program(source))
+    return SyntaxGate.scan(program, SyntaxChecker(ErrorManager()).get_features(program))
+
+def test_reports_missing_extensions():
+    report = scan(PAIRS_PROGRAM)
+    assert list(report.missing_extensions) == [(ExtensionKind.PAIRS, ExtensionKind.TUPLES)]
+    assert report.unsupported_syntax == {}
+    assert scan(PAIRS_PROGRAM.replace('language core;\n', 'language core;\nextend with #tuples;\n')).is_accepted
+
+def test_reports_unsupported_syntax():
+    report = scan(ARITHMETIC_PROGRAM)
+    assert report.missing_extensions == {}
+    assert report.unsupported_syntax == {'Add': 2}
+    report = scan(ARITHMETIC_PROGRAM.replace('extend with #arithmetic-operators;\n', ''))
+    assert list(report.missing_extensions) == [(ExtensionKind.ARITHMETIC_OPERATORS,)]
+    assert report.unsupported_syntax == {'Add': 2}
+
+def test_lenient_mode_warns_only_about_unsupported_syntax():
+    checker_manager = CheckerManager()
+    assert checker_manager.check(parse_program(PAIRS_PROGRAM)) == []
+    assert checker_manager.warnings == []
+    checker_manager = CheckerManager()
+    checker_manager.check(parse_program(ARITHMETIC_PROGRAM))
+    assert [(warning.error_kind, warning.args) for warning in checker_manager.warnings] == [(ErrorKind.ERROR_UNSUPPORTED_SYNTAX, ('Add (2)',))]
+    assert ErrorKind.ERROR_UNSUPPORTED_SYNTAX not in [error.error_kind for error in checker_manager.check(parse_program(ARITHMETIC_PROGRAM))]
+
+def test_strict_mode_rejects_before_type_checking():
+    errors = CheckerManager(True, is_strict_extensions = True).check(parse_program(PAIRS_PROGRAM.replace('-> {Nat, Nat}', '-> Nat')))
+    assert [error.error_kind for error in errors] == [ErrorKind.ERROR_MISSING_EXTENSION]
+    assert errors[0].args[0] == '#pairs or #tuples'
+    errors = CheckerManager(True, is_strict_extensions = True).check(parse_program(ARITHMETIC_PROGRAM))
+    assert [(error.error_kind, error.args) for error in errors] == [(ErrorKind.ERROR_UNSUPPORTED_SYNTAX, ('Add (2)',))]
@@ -0,0 +1,39 @@
+from antlr4 import ParserRuleContext
+from pathlib import Path
+
+from antlr.stellaParser import stellaParser
+from error.sourceSpan import SourceSpan
+from parsing.programParser import parse_program
+from syntax import syntaxTree
+from syntax.syntaxLowering import lower_program
+
+
+def iter_contexts(ctx):
+    stack = [ctx]
+    while stack:
+        ctx = stack.pop()
+        if isinstance(ctx, ParserRuleContext):
+            yield ctx
+            stack.extend(ctx.children or [])
+
+def iter_nodes(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.iter_children())
+
+def test_nodes_mirror_parse_tree():
+    for path in sorted(Path('tests/test_cases/').rglob('*.stella')):
+        program_context = parse_program(path.read_text())
+        contexts = {(type(ctx).__name__.removesuffix('Context'), SourceSpan.from_context(ctx)) for ctx in iter_contexts(program_context)}
+        program = lower_program(program_context)
+        assert program.extensions == [extension.text[1:] for ctx in program_context.extensions for extension in getattr(ctx, 'extensionNames', [])], path
+        nodes = {(type(node).__name__, node.span) for node in iter_nodes(program)}
+        assert {node for node in nodes if hasattr(stellaParser, f'{node[0]}Context') and node[0] != 'Program'} == {context for context in contexts if hasattr(syntaxTree, context[0]) and context[0] != 'Program'}, path
+
+def test_parenthesised_expressions_are_dropped():
+    source = 'language core;\n\nfn main(n : Nat) -> Nat {\n  return ((succ(n)))\n}\n'
+    return_expr = lower_program(parse_program(source)).decls[0].returnExpr
+    assert isinstance(return_expr, syntaxTree.Succ) and isinstance(return_expr.n, syntaxTree.Var)
+    assert source[return_expr.span.start:return_expr.span.stop + 1] == 'succ(n)'
@@ -1,12 +1,9 @@
 import pytest
 
-from antlr4 import CommonTokenStream
-from antlr4.InputStream import InputStream
 from pathlib import Path
 
-from antlr.stellaLexer import stellaLexer
-from antlr.stellaParser import stellaParser
-from checker.checkerManager import CheckerManager
+from checker.checkerSession import CheckerSession
+from parsing.programParser import ParseError, parse_program
 from utils.singleton import SingletonABCMeta
 
 
@@ -17,25 +14,24 @@ def pytest_generate_tests(metafunc):
     elif 'test_case' in metafunc.fixturenames:
         metafunc.parametrize('test_case', test_cases.ok)
 
-def test_error(error_kind, test_case):
+@pytest.fixture(scope = 'module')
+def checker_session():
+    return CheckerSession()
+
+def test_error(error_kind, test_case, checker_session):
     input = test_case.read_text()
-    lexer = stellaLexer(InputStream(input))
-    stream = CommonTokenStream(lexer)
-    parser = stellaParser(stream)
-    context = parser.program()
-    checker_manager = CheckerManager()
-    errors = checker_manager.check(context)
-    assert errors and errors[0].error_kind.name == error_kind
-
-def test_ok(test_case):
+    result = checker_session.check(input)
+    assert result.errors and result.errors[0].error_kind.name == error_kind
+
+def test_ok(test_case, checker_session):
     input = test_case.read_text()
-    lexer = stellaLexer(InputStream(input))
-    stream = CommonTokenStream(lexer)
-    parser = stellaParser(stream)
-    context = parser.program()
-    checker_manager = CheckerManager()
-    errors = checker_manager.check(context)
-    assert not errors
+    result = checker_session.check(input)
+    assert result.is_ok
+
+def test_invalid_syntax():
+    with pytest.raises(ParseError) as parse_error:
+        parse_program('language core;\n\nfn main(n : Nat) -> Nat {\n  return succ(n\n}\n')
+    assert parse_error.value.errors[0].error_kind.name == 'ERROR_INVALID_SYNTAX'
 
 
 class TestCases(metaclass = SingletonABCMeta):
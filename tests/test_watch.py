@@ -0,0 +1,47 @@
+import os
+import shutil
+
+from argparse import ArgumentParser
+from io import StringIO
+from pathlib import Path
+
+from checkRunner import CheckRunner
+from main import add_arguments
+from type.type import TypeVariable
+from watch import DirectoryWatcher
+
+
+def check(check_runner, path):
+    TypeVariable.reset_count()
+    output = StringIO()
+    try:
+        exit_code = check_runner.run(StringIO(path.read_text()), output)
+    except Exception:
+        return 'crash'
+    return check_runner.errors[0].error_kind.name if exit_code and check_runner.errors else 'ok'
+
+def test_rechecks_only_changed_files(tmp_path):
+    paths = sorted(Path('tests/test_cases/').rglob('*.stella'))
+    for index, path in enumerate(paths):
+        shutil.copy(path, tmp_path / f'{index}.stella')
+    check_runner = CheckRunner(add_arguments(ArgumentParser()).parse_args(['--all-errors']))
+    watcher = DirectoryWatcher(tmp_path, check_runner)
+    assert len(watcher.refresh()) == len(paths)
+    assert watcher.checked_files == len(paths)
+    for path, entry in watcher.entries.items():
+        assert (entry.error_kind or entry.status) == check(check_runner, path)
+    assert watcher.refresh() == []
+    first, second, third = sorted(watcher.entries)[:3]
+    stat = first.stat()
+    os.utime(first, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert watcher.refresh() == []
+    second.write_text('language core;\n\nfn main(n : Nat) -> Bool {\n  return n\n}\n')
+    third.unlink()
+    assert watcher.refresh() == [second, third]
+    assert watcher.checked_files == len(paths) + 1
+    assert watcher.entries[second].error_kind == 'ERROR_UNEXPECTED_TYPE_FOR_EXPRESSION'
+    assert third not in watcher.entries
+    output = StringIO()
+    watcher.watch(output, 0, 2)
+    assert output.getvalue().startswith(f'{len(paths) - 1} programs: ')
+    assert output.getvalue().count('programs: ') == 1